@@ -0,0 +1,429 @@
+"""
+ASGI entry point for running the API outside Vercel.
+The generate and export endpoints are native asyncio handlers: streams are written with
+backpressure, so slow clients wait on the event loop instead of pinning a
+worker thread, while their items are generated a chunk at a time on a thread,
+and large batches are split across a process pool. Every other
+route is delegated to the Flask app in index.py on a thread.
+
+Run with:  uvicorn asgi:app --app-dir api
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from urllib.parse import parse_qsl
+
+from werkzeug.utils import get_content_type
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from index import (
+    MAX_BATCH_JOBS, STREAM_MIMETYPES, app as flask_app, build_quick_ideas, cached_generate,
+    encode_stream_item, generator, get_count, get_num_tips, get_seed, get_stream_format,
+    start_export
+)
+from timeline import Timeline
+
+# Batches with at least this many jobs go to the process pool; smaller ones run on a thread
+BATCH_OFFLOAD_JOBS = int(os.environ.get("CONTENT_ASGI_BATCH_OFFLOAD", 50))
+BATCH_WORKERS = int(os.environ.get("CONTENT_ASGI_WORKERS", os.cpu_count() or 1))
+# Requests for up to this many items are generated inline; bigger ones on a thread
+INLINE_ITEMS = 10
+# Stream items generated per trip to a thread (and sent per message)
+STREAM_CHUNK = 32
+# Largest request body accepted
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+_process_pool = None
+
+
+class HTTPError(Exception):
+    """Error response raised while reading a request"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _get_process_pool():
+    """Process pool for large batches, started on first use"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=BATCH_WORKERS, mp_context=get_context("spawn"))
+    return _process_pool
+
+
+class WorkerOutOfSync(Exception):
+    """A pool worker couldn't reproduce the parent's content data, so its results could differ"""
+
+
+def _run_batch_chunk(items, data_version, topics, weights, timeline):
+    """Run (index, job, seed) batch items in a pool worker"""
+    # Pick up topics, weights, timeline and user examples changed since this worker started
+    if generator.topics != topics:
+        generator.topics = topics
+        generator._content_changed()
+    if generator.weights.to_dict() != weights:
+        generator.weights.update(weights, replace=True)
+    if generator.timeline.to_dict() != timeline:
+        generator.timeline = Timeline(**timeline)
+    if generator.data_version != data_version:
+        generator.load_user_examples()
+        if generator.data_version != data_version:
+            raise WorkerOutOfSync(f"worker data version {generator.data_version} != {data_version}")
+    return generator.run_batch_items(items)
+
+
+async def run_batch(jobs, seed):
+    """Run a batch off the event loop; large ones are split across processes with the same results"""
+    loop = asyncio.get_running_loop()
+    if len(jobs) < BATCH_OFFLOAD_JOBS or BATCH_WORKERS < 2:
+        return await loop.run_in_executor(None, generator.generate_batch, jobs, seed)
+
+    # Seeds are assigned up front, so a job's result doesn't depend on which worker runs it
+    items = list(zip(range(len(jobs)), jobs, generator.assign_batch_seeds(jobs, seed)))
+    chunk_size = -(-len(items) // BATCH_WORKERS)
+    pool = _get_process_pool()
+    state = (generator.data_version, generator.topics, generator.weights.to_dict(), generator.timeline.to_dict())
+    try:
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(pool, _run_batch_chunk, items[start:start + chunk_size], *state)
+            for start in range(0, len(items), chunk_size)
+        ])
+    except WorkerOutOfSync as e:
+        # e.g. user examples saved again mid-request: run it here rather than return mixed results
+        print(f"Note: Running batch in-process, {e}")
+        return await loop.run_in_executor(None, generator.generate_batch, jobs, seed)
+    return [result for chunk in chunks for result in chunk]
+
+
+async def compute(func, size):
+    """Run a small generation inline, a bigger one on a thread so the event loop stays responsive"""
+    if isinstance(size, int) and size <= INLINE_ITEMS:
+        return func()
+    return await asyncio.get_running_loop().run_in_executor(None, func)
+
+
+async def read_body(receive):
+    """Read the full request body"""
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise HTTPError(400, "Client disconnected")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def read_json(receive):
+    """Read a JSON object body (empty body -> {})"""
+    body = await read_body(receive)
+    if not body.strip():
+        return {}
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HTTPError(400, "Request body must be valid JSON")
+    return data or {}
+
+
+async def send_json(send, payload, status=200, cache_hit=None):
+    """Send a complete JSON response"""
+    body = flask_app.json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"access-control-allow-origin", b"*"),
+    ]
+    if cache_hit is not None:
+        headers.append((b"x-cache", b"HIT" if cache_hit else b"MISS"))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _encode_chunk(iterator, stream_format):
+    """Generate and encode up to STREAM_CHUNK items; returns (lines, finished), the last chunk ending the stream"""
+    lines = []
+    try:
+        for item in iterator:
+            lines.append(encode_stream_item(item, stream_format))
+            if len(lines) >= STREAM_CHUNK:
+                return lines, False
+    except Exception as e:
+        lines.append(encode_stream_item({"success": False, "error": str(e)}, stream_format, event="error"))
+        return lines, True
+    if stream_format == "sse":
+        lines.append(encode_stream_item({"success": True}, stream_format, event="done"))
+    return lines, True
+
+
+async def send_stream(send, items, stream_format):
+    """Stream items as NDJSON/SSE; each send waits for the client, so slow readers only cost memory for one chunk"""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", STREAM_MIMETYPES[stream_format].encode()),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),
+            (b"access-control-allow-origin", b"*"),
+        ],
+    })
+    # Items are generated on a thread, a chunk at a time, so a long stream never blocks the event loop
+    loop = asyncio.get_running_loop()
+    iterator = iter(items)
+    while True:
+        lines, finished = await loop.run_in_executor(None, _encode_chunk, iterator, stream_format)
+        await send({"type": "http.response.body", "body": "".join(lines).encode("utf-8"), "more_body": not finished})
+        if finished:
+            return
+
+
+def _next_text(iterator):
+    """Join up to STREAM_CHUNK text chunks of an export; returns (text, finished)"""
+    parts = []
+    for part in iterator:
+        parts.append(part)
+        if len(parts) >= STREAM_CHUNK:
+            return "".join(parts), False
+    return "".join(parts), True
+
+
+async def send_text_stream(send, chunks, mimetype, headers):
+    """Stream text chunks as they're generated (on a thread), one message per STREAM_CHUNK chunks"""
+    loop = asyncio.get_running_loop()
+    iterator = iter(chunks)
+    # The first chunk is generated before the response starts, so early errors still get an error response
+    text, finished = await loop.run_in_executor(None, _next_text, iterator)
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", get_content_type(mimetype, "utf-8").encode())]
+        + [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+        + [(b"access-control-allow-origin", b"*")],
+    })
+    while True:
+        try:
+            await send({"type": "http.response.body", "body": text.encode("utf-8"), "more_body": not finished})
+            if finished:
+                return
+            text, finished = await loop.run_in_executor(None, _next_text, iterator)
+        except Exception as e:
+            # Headers are already sent; end the body so the client sees a truncated file, not a hang
+            print(f"Note: Export stream stopped: {e}")
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+
+async def export_content(data, scope, send):
+    """Stream generated reels as a JSONL, CSV, SRT subtitle or teleprompter file"""
+    from_query = scope["method"] == "GET"
+    if from_query:
+        # Like Flask's request.args.to_dict(): the first value of each parameter
+        data = {}
+        for name, value in parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True):
+            data.setdefault(name, value)
+    chunks, mimetype, headers = start_export(data, from_query)
+    await send_text_stream(send, chunks, mimetype, headers)
+
+
+async def generate_reel(data, scope, send):
+    """Generate an Instagram Reel"""
+    topic = data.get("topic")
+    num_tips = get_num_tips(data)
+    seed = get_seed(data)
+    reel, cache_hit = await compute(lambda: cached_generate(
+        "reel", data, lambda: generator.generate_instagram_reel(topic, num_tips, seed=seed)
+    ), num_tips)
+    await send_json(send, {"success": True, "reel": reel}, cache_hit=cache_hit)
+
+
+async def generate_batch(data, scope, send):
+    """Generate many reels/hooks/quick ideas in one request"""
+    jobs = data.get("jobs")
+    if not isinstance(jobs, list) or not jobs:
+        return await send_json(send, {"success": False, "error": "Please provide a non-empty list of jobs"}, 400)
+    if len(jobs) > MAX_BATCH_JOBS:
+        return await send_json(send, {"success": False, "error": f"Too many jobs (max {MAX_BATCH_JOBS})"}, 400)
+
+    seed = get_seed(data)
+    stream_format = get_stream_format(data, header(scope, b"accept"))
+    if stream_format:
+        return await send_stream(send, generator.iter_batch(jobs, seed), stream_format)
+
+    results = await run_batch(jobs, seed)
+    await send_json(send, {"success": True, "count": len(results), "results": results})
+
+
+async def generate_hooks(data, scope, send):
+    """Generate content hooks"""
+    category = data.get("category")
+    count = get_count(data, 5)
+    seed = get_seed(data)
+
+    stream_format = get_stream_format(data, header(scope, b"accept"))
+    if stream_format:
+        return await send_stream(send, generator.iter_content_hooks(category, count, seed), stream_format)
+
+    hooks, cache_hit = await compute(lambda: cached_generate(
+        "hooks", data, lambda: generator.generate_content_hooks(category, count, seed)
+    ), count)
+    await send_json(send, {"success": True, "hooks": hooks}, cache_hit=cache_hit)
+
+
+async def generate_quick_ideas(data, scope, send):
+    """Generate quick content ideas"""
+    count = data.get("count", 3)
+    seed = get_seed(data)
+    ideas = await compute(lambda: build_quick_ideas(count, seed), count)
+    await send_json(send, {"success": True, "ideas": ideas})
+
+
+async def generate_custom(data, scope, send):
+    """Generate content based on user's custom topic/idea"""
+    user_topic = data.get("topic", "").strip()
+    content_type = data.get("content_type", "reel")
+    num_tips = get_num_tips(data)
+    seed = get_seed(data)
+
+    if not user_topic:
+        return await send_json(send, {"success": False, "error": "Please provide a topic"}, 400)
+
+    result, cache_hit = await compute(lambda: cached_generate(
+        "custom", data, lambda: generator.generate_custom_content(user_topic, content_type, num_tips, seed=seed)
+    ), num_tips)
+    await send_json(send, {"success": True, "content": result}, cache_hit=cache_hit)
+
+
+# POST routes served natively; everything else goes to Flask
+ASYNC_ROUTES = {
+    "/api/generate/reel": generate_reel,
+    "/api/generate/batch": generate_batch,
+    "/api/generate/hooks": generate_hooks,
+    "/api/generate/quick-ideas": generate_quick_ideas,
+    "/api/generate/custom": generate_custom,
+    "/api/export": export_content,
+}
+# GET routes served natively; their parameters come from the query string
+ASYNC_GET_ROUTES = {
+    "/api/export": export_content,
+}
+
+
+def header(scope, name):
+    """First value of a request header, decoded ('' if absent)"""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+async def app(scope, receive, send):
+    """ASGI application"""
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] == "POST":
+        handler = ASYNC_ROUTES.get(scope["path"])
+    elif scope["method"] == "GET":
+        handler = ASYNC_GET_ROUTES.get(scope["path"])
+    else:
+        handler = None
+    if handler is None:
+        return await call_flask(scope, receive, send)
+
+    try:
+        data = await read_json(receive) if scope["method"] == "POST" else {}
+        await handler(data, scope, send)
+    except HTTPError as e:
+        await send_json(send, {"success": False, "error": str(e)}, e.status)
+    except ValueError as e:
+        await send_json(send, {"success": False, "error": str(e)}, 400)
+    except Exception as e:
+        await send_json(send, {"success": False, "error": str(e)}, 500)
+
+
+async def lifespan(receive, send):
+    """Start up / shut down (the batch process pool is stopped on shutdown)"""
+    global _process_pool
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            if _process_pool is not None:
+                _process_pool.shutdown(cancel_futures=True)
+                _process_pool = None
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def call_flask(scope, receive, send):
+    """Serve a request with the Flask WSGI app on a worker thread"""
+    try:
+        body = await read_body(receive)
+    except HTTPError as e:
+        return await send_json(send, {"success": False, "error": str(e)}, e.status)
+
+    environ = wsgi_environ(scope, body)
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+        return lambda data: None
+
+    def run():
+        result = flask_app.wsgi_app(environ, start_response)
+        try:
+            return b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+
+    content = await asyncio.get_running_loop().run_in_executor(None, run)
+    await send({"type": "http.response.start", "status": response["status"], "headers": response["headers"]})
+    await send({"type": "http.response.body", "body": content})
+
+
+def wsgi_environ(scope, body):
+    """Build a WSGI environ for an ASGI HTTP scope"""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope["headers"]:
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            environ[name] = value
+        else:
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
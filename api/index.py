@@ -1,41 +1,226 @@
-from flask import Flask, request, jsonify, send_from_directory
+import os
+import time
+_phase_start = time.perf_counter()
+
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import sys
-import os
+import json
+import hashlib
+import threading
+
+# Cold-start phase -> seconds, exported at /api/metrics (CONTENT_STARTUP_REPORT=1 also prints them)
+startup_timings = {}
+STARTUP_REPORT = os.environ.get('CONTENT_STARTUP_REPORT', '').lower() in ('1', 'true', 'yes')
+
+
+def record_startup(phase, start):
+    """Record how long a startup phase took since `start` (a perf_counter value)"""
+    seconds = time.perf_counter() - start
+    startup_timings[phase] = seconds
+    if STARTUP_REPORT:
+        print(f"Startup: {phase} took {seconds * 1000:.1f}ms")
+
+
+record_startup('import_flask', _phase_start)
+_phase_start = time.perf_counter()
 
 # Add parent directory to path to import content_generator
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from content_generator_core import ContentGenerator
+from content_generator_core import ContentGenerator, MessagingFrameworks, VideoShotLibrary, make_rng
+from response_cache import ResponseCache
+from static_page import StaticPage
+from records import Record, json_default
+from exporters import EXPORT_FORMATS, iter_export
+
+record_startup('import_generator', _phase_start)
+_phase_start = time.perf_counter()
+
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes generator records (Reel, Hook, ...) at the response boundary"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, Record):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
 
 app = Flask(__name__, static_folder='../public', static_url_path='')
+app.json = RecordJSONProvider(app)
 CORS(app)
 
-# Initialize generator
-generator = ContentGenerator()
+# Per-stage generation timing served at /api/metrics (CONTENT_PROFILE=1 to enable)
+PROFILE_STAGES = os.environ.get('CONTENT_PROFILE', '').lower() in ('1', 'true', 'yes')
 
 
-@app.route('/')
-def home():
-    """Serve the main page"""
-    # Try multiple paths to find index.html
-    possible_paths = [
-        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'index.html'),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'index.html'),
-        '/var/task/index.html',  # Vercel path
-        './index.html',
-        '../index.html',
-    ]
+class LazyGenerator:
+    """Stands in for the ContentGenerator and builds it on first use, keeping it off the cold-start path"""
+
+    def __init__(self, factory):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    @property
+    def loaded(self):
+        """Whether the generator has been built yet"""
+        return self._instance is not None
+
+    def _get(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    object.__setattr__(self, '_instance', self._factory())
+            instance = self._instance
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
+
+def build_generator():
+    """Construct the module's ContentGenerator"""
+    start = time.perf_counter()
+    instance = ContentGenerator()
+    if PROFILE_STAGES:
+        instance.enable_profiling()
+    record_startup('build_generator', start)
+    return instance
+
+
+# Initialize generator (built by the first request that uses it)
+generator = LazyGenerator(build_generator)
+
+# Response cache for seeded generate requests (CONTENT_CACHE_BACKEND=memory|sqlite|off)
+response_cache = ResponseCache.from_env()
+
+
+# Streaming output formats for large generation jobs
+STREAM_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream',
+}
+
+
+def get_stream_format(data, accept=None):
+    """Pick a streaming format from the request body's 'stream' field or the Accept header"""
+    stream = data.get('stream')
+    if stream is True:
+        return 'ndjson'
+    if stream in STREAM_MIMETYPES:
+        return stream
+
+    if accept is None:
+        accept = request.headers.get('Accept', '')
+    for stream_format, mimetype in STREAM_MIMETYPES.items():
+        if mimetype in accept:
+            return stream_format
+    return None
+
+
+def encode_stream_item(item, stream_format, event=None):
+    """Encode one streamed item as an NDJSON line or an SSE event"""
+    payload = json.dumps(item, ensure_ascii=False, default=json_default)
+    if stream_format == 'sse':
+        prefix = f"event: {event}\n" if event else ""
+        return f"{prefix}data: {payload}\n\n"
+    return payload + "\n"
 
-    for index_path in possible_paths:
+
+def stream_response(items, stream_format):
+    """Stream each generated item as soon as it is produced (NDJSON lines or SSE events)"""
+    def generate():
         try:
-            if os.path.exists(index_path):
-                with open(index_path, 'r', encoding='utf-8') as f:
-                    return f.read(), 200, {'Content-Type': 'text/html; charset=utf-8'}
+            for item in items:
+                yield encode_stream_item(item, stream_format)
         except Exception as e:
-            continue
-
-    # Fallback to API info page
-    return """
+            yield encode_stream_item({'success': False, 'error': str(e)}, stream_format, event='error')
+            return
+        if stream_format == 'sse':
+            yield encode_stream_item({'success': True}, stream_format, event='done')
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=STREAM_MIMETYPES[stream_format],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def get_seed(data):
+    """Read the optional 'seed' field for reproducible generation (int or string)"""
+    seed = data.get('seed')
+    if seed is None or (isinstance(seed, (int, str)) and not isinstance(seed, bool)):
+        return seed
+    raise ValueError('seed must be an integer or a string')
+
+
+def get_count(data, default):
+    """Read the 'count' field, which must be a positive integer"""
+    count = data.get('count', default)
+    if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+        raise ValueError('count must be a positive integer')
+    return count
+
+
+def get_num_tips(data, default=3):
+    """Read the 'num_tips' field, which must be a positive integer"""
+    num_tips = data.get('num_tips', default)
+    if isinstance(num_tips, bool) or not isinstance(num_tips, int) or num_tips < 1:
+        raise ValueError('num_tips must be a positive integer')
+    return num_tips
+
+
+def cached_generate(endpoint, data, compute):
+    """Serve a seeded request from the response cache; unseeded requests are always fresh"""
+    if response_cache is None or data.get('seed') is None:
+        return compute(), None
+
+    key = response_cache.make_key(endpoint, data, generator.data_version)
+    return response_cache.get_or_compute(key, compute)
+
+
+def cached_json(payload, cache_hit):
+    """jsonify a generate response, tagging cache hits/misses"""
+    response = jsonify(payload)
+    if cache_hit is not None:
+        response.headers['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+    return response
+
+
+# Serialized catalog responses: name -> (data version, body bytes, etag)
+catalog_cache = {}
+CATALOG_CACHE_CONTROL = 'public, max-age=60, must-revalidate'
+
+
+def catalog_response(name, build, cacheable=True):
+    """Serve a static catalog payload serialized once, with a strong ETag and If-None-Match -> 304"""
+    version = generator.data_version
+    entry = catalog_cache.get(name)
+    if entry is None or entry[0] != version:
+        body = app.json.dumps(build()).encode('utf-8') + b'\n'
+        entry = (version, body, hashlib.sha256(body).hexdigest()[:32])
+        if cacheable:
+            catalog_cache[name] = entry
+    body, etag = entry[1], entry[2]
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = CATALOG_CACHE_CONTROL
+    return response
+
+
+# API info page served when index.html can't be found
+FALLBACK_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -60,6 +245,7 @@ def home():
         <ul>
             <li><strong>GET /api/topics</strong> - Get all available topics</li>
             <li><strong>POST /api/generate/reel</strong> - Generate Instagram Reel</li>
+            <li><strong>POST /api/generate/batch</strong> - Generate many reels/hooks in one request</li>
             <li><strong>POST /api/generate/hooks</strong> - Generate content hooks</li>
             <li><strong>POST /api/generate/quick-ideas</strong> - Generate quick ideas</li>
             <li><strong>GET /api/frameworks</strong> - Get content frameworks</li>
@@ -74,13 +260,44 @@ curl -X POST https://your-app.vercel.app/api/generate/reel \\
         </pre>
     </body>
     </html>
-    """, 200, {'Content-Type': 'text/html; charset=utf-8'}
+    """
+
+# index.html is read on the first request, then served from memory
+index_page = StaticPage([
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'index.html'),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'index.html'),
+    '/var/task/index.html',  # Vercel path
+    './index.html',
+    '../index.html',
+], FALLBACK_HTML)
+
+
+@app.route('/')
+def home():
+    """Serve the main page from memory, precompressed when the client accepts it"""
+    # In dev mode pick up edits to index.html without a restart
+    if app.debug:
+        index_page.refresh_if_changed()
+
+    encoding = index_page.negotiate(request.accept_encodings)
+    body, etag = index_page.get(encoding)
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, content_type='text/html; charset=utf-8')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @app.route('/api/topics', methods=['GET'])
 def get_topics():
     """Get all available topics"""
-    return jsonify({
+    return catalog_response('topics', lambda: {
         'success': True,
         'topics': generator.topics
     })
@@ -92,14 +309,69 @@ def generate_reel():
     try:
         data = request.get_json() or {}
         topic = data.get('topic')
-        num_tips = data.get('num_tips', 3)
+        num_tips = get_num_tips(data)
+        seed = get_seed(data)
 
-        reel = generator.generate_instagram_reel(topic, num_tips)
+        reel, cache_hit = cached_generate(
+            'reel', data, lambda: generator.generate_instagram_reel(topic, num_tips, seed=seed)
+        )
 
-        return jsonify({
+        return cached_json({
             'success': True,
             'reel': reel
+        }, cache_hit)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+# Upper bound on jobs per batch request
+MAX_BATCH_JOBS = 500
+
+
+@app.route('/api/generate/batch', methods=['POST'])
+def generate_batch():
+    """Generate many reels/hooks/quick ideas in one request"""
+    try:
+        data = request.get_json() or {}
+        jobs = data.get('jobs')
+
+        if not isinstance(jobs, list) or not jobs:
+            return jsonify({
+                'success': False,
+                'error': 'Please provide a non-empty list of jobs'
+            }), 400
+
+        if len(jobs) > MAX_BATCH_JOBS:
+            return jsonify({
+                'success': False,
+                'error': f'Too many jobs (max {MAX_BATCH_JOBS})'
+            }), 400
+
+        seed = get_seed(data)
+        stream_format = get_stream_format(data)
+        if stream_format:
+            return stream_response(generator.iter_batch(jobs, seed), stream_format)
+
+        results = generator.generate_batch(jobs, seed)
+
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'results': results
         })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -113,14 +385,27 @@ def generate_hooks():
     try:
         data = request.get_json() or {}
         category = data.get('category')
-        count = data.get('count', 5)
+        # Checked up front: a streamed response has already sent its 200 by the time generation fails
+        count = get_count(data, 5)
+        seed = get_seed(data)
 
-        hooks = generator.generate_content_hooks(category, count)
+        stream_format = get_stream_format(data)
+        if stream_format:
+            return stream_response(generator.iter_content_hooks(category, count, seed), stream_format)
 
-        return jsonify({
+        hooks, cache_hit = cached_generate(
+            'hooks', data, lambda: generator.generate_content_hooks(category, count, seed)
+        )
+
+        return cached_json({
             'success': True,
             'hooks': hooks
-        })
+        }, cache_hit)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -128,32 +413,41 @@ def generate_hooks():
         }), 500
 
 
+def build_quick_ideas(count, seed=None):
+    """Pick topics from a random category and give each a hook"""
+    rng = make_rng(seed)
+    category = rng.choice(list(generator.topics.keys()))
+    topics = rng.sample(generator.topics[category], min(count, len(generator.topics[category])))
+
+    ideas = []
+    for i, topic in enumerate(topics, 1):
+        hooks = generator.generate_hooks(topic, 1, rng=rng)
+        ideas.append({
+            'number': i,
+            'topic': topic,
+            'hook': hooks[0],
+            'format': '60-second reel or short-form video',
+            'cta': generator.style.signature_cta
+        })
+    return ideas
+
+
 @app.route('/api/generate/quick-ideas', methods=['POST'])
 def generate_quick_ideas():
     """Generate quick content ideas"""
     try:
         data = request.get_json() or {}
-        count = data.get('count', 3)
-
-        import random
-        category = random.choice(list(generator.topics.keys()))
-        topics = random.sample(generator.topics[category], min(count, len(generator.topics[category])))
-
-        ideas = []
-        for i, topic in enumerate(topics, 1):
-            hooks = generator.generate_hooks(topic, 1)
-            ideas.append({
-                'number': i,
-                'topic': topic,
-                'hook': hooks[0],
-                'format': '60-second reel or short-form video',
-                'cta': generator.style.signature_cta
-            })
+        ideas = build_quick_ideas(data.get('count', 3), get_seed(data))
 
         return jsonify({
             'success': True,
             'ideas': ideas
         })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -186,6 +480,13 @@ def get_frameworks():
 def get_framework(framework_type):
     """Get a specific content framework"""
     try:
+        # Unknown types fall back to a random framework, so only known ones are cacheable
+        if framework_type in MessagingFrameworks.FRAMEWORKS:
+            return catalog_response(f'framework:{framework_type}', lambda: {
+                'success': True,
+                'framework': MessagingFrameworks.get_framework(framework_type)
+            })
+
         framework = generator.generate_content_framework(framework_type)
 
         return jsonify({
@@ -206,7 +507,8 @@ def generate_custom():
         data = request.get_json() or {}
         user_topic = data.get('topic', '').strip()
         content_type = data.get('content_type', 'reel')
-        num_tips = data.get('num_tips', 3)
+        num_tips = get_num_tips(data)
+        seed = get_seed(data)
 
         if not user_topic:
             return jsonify({
@@ -214,11 +516,127 @@ def generate_custom():
                 'error': 'Please provide a topic'
             }), 400
 
-        result = generator.generate_custom_content(user_topic, content_type, num_tips)
+        result, cache_hit = cached_generate(
+            'custom', data, lambda: generator.generate_custom_content(user_topic, content_type, num_tips, seed=seed)
+        )
 
-        return jsonify({
+        return cached_json({
             'success': True,
             'content': result
+        }, cache_hit)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+# Upper bound on reels per export request
+MAX_EXPORT_REELS = 50000
+
+
+def get_int_param(data, name, default):
+    """Read an integer field from a JSON body or a query string"""
+    value = data.get(name, default)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f'{name} must be an integer')
+    return value
+
+
+def start_export(data, from_query=False):
+    """Validate export parameters and return (text chunks, mimetype, extra headers); nothing is generated yet"""
+    if from_query and data.get('seed', '').lstrip('-').isdigit():
+        # ?seed=5 reproduces a JSON body's "seed": 5
+        data['seed'] = int(data['seed'])
+    export_format = data.get('format', 'jsonl')
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'Invalid format (use one of {", ".join(EXPORT_FORMATS)})')
+
+    count = get_int_param(data, 'count', 1)
+    if isinstance(count, int) and count > MAX_EXPORT_REELS:
+        raise ValueError(f'Too many reels (max {MAX_EXPORT_REELS})')
+
+    reels = generator.iter_reels(
+        count, data.get('topic'), get_int_param(data, 'num_tips', 3), data.get('category'), seed=get_seed(data)
+    )
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    headers = {
+        'Content-Disposition': f'attachment; filename="reels.{extension}"',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    }
+    return iter_export(reels, export_format), mimetype, headers
+
+
+@app.route('/api/export', methods=['GET', 'POST'])
+def export_content():
+    """Stream generated reels as a JSONL, CSV, SRT subtitle or teleprompter file"""
+    try:
+        if request.method == 'POST':
+            chunks, mimetype, headers = start_export(request.get_json(silent=True) or {})
+        else:
+            chunks, mimetype, headers = start_export(request.args.to_dict(), from_query=True)
+        return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Get response cache hit/miss counts"""
+    return jsonify({
+        'success': True,
+        'enabled': response_cache is not None,
+        'stats': response_cache.stats() if response_cache else None
+    })
+
+
+def startup_prometheus():
+    """Cold-start phase timings as Prometheus gauges"""
+    lines = [
+        "# HELP content_startup_seconds Wall time of each cold-start phase",
+        "# TYPE content_startup_seconds gauge",
+    ]
+    for phase, seconds in startup_timings.items():
+        lines.append(f'content_startup_seconds{{phase="{phase}"}} {seconds!r}')
+    return "\n".join(lines) + "\n"
+
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Cold-start timings and per-stage generation timing histograms in Prometheus text format"""
+    body = startup_prometheus()
+    # Reporting metrics shouldn't build the generator on an otherwise idle instance
+    if generator.loaded and generator.profiler is not None:
+        body += generator.profiler.to_prometheus()
+    elif not PROFILE_STAGES:
+        body += "# Stage profiling is disabled; set CONTENT_PROFILE=1 to enable it\n"
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/templates/coverage', methods=['GET'])
+def get_template_coverage():
+    """Get the placeholder coverage report for hook templates"""
+    try:
+        return jsonify({
+            'success': True,
+            'coverage': generator.get_template_coverage()
         })
     except Exception as e:
         return jsonify({
@@ -231,12 +649,9 @@ def generate_custom():
 def get_video_types():
     """Get all video types for mix-and-match"""
     try:
-        from content_generator_core import VideoShotLibrary
-        video_types = VideoShotLibrary.get_all_video_types()
-
-        return jsonify({
+        return catalog_response('video-types', lambda: {
             'success': True,
-            'video_types': video_types
+            'video_types': VideoShotLibrary.get_all_video_types()
         })
     except Exception as e:
         return jsonify({
@@ -249,12 +664,9 @@ def get_video_types():
 def get_shot_types():
     """Get all shot types for mix-and-match"""
     try:
-        from content_generator_core import VideoShotLibrary
-        shot_types = VideoShotLibrary.get_all_shot_types()
-
-        return jsonify({
+        return catalog_response('shot-types', lambda: {
             'success': True,
-            'shot_types': shot_types
+            'shot_types': VideoShotLibrary.get_all_shot_types()
         })
     except Exception as e:
         return jsonify({
@@ -267,15 +679,12 @@ def get_shot_types():
 def get_suggested_shots(video_type):
     """Get suggested shot types for a specific video type"""
     try:
-        from content_generator_core import VideoShotLibrary
-        suggested = VideoShotLibrary.suggest_shots_for_video(video_type)
-        video_info = VideoShotLibrary.get_video_type(video_type)
-
-        return jsonify({
+        # Only known video types are kept, so arbitrary paths can't grow the catalog cache
+        return catalog_response(f'video-shots:{video_type}', lambda: {
             'success': True,
-            'video_type': video_info,
-            'suggested_shots': suggested
-        })
+            'video_type': VideoShotLibrary.get_video_type(video_type),
+            'suggested_shots': VideoShotLibrary.suggest_shots_for_video(video_type)
+        }, cacheable=video_type in VideoShotLibrary.VIDEO_TYPES)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -350,6 +759,8 @@ def catch_all(path):
 # Vercel will use the app directly
 app_handler = app
 
+record_startup('module_init', _phase_start)
+
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
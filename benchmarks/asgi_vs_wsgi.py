@@ -0,0 +1,198 @@
+"""
+Compare the ASGI entry point (api/asgi.py under uvicorn) with the Flask WSGI app
+(threaded werkzeug server, as used by `python3 api/index.py`) under concurrent load.
+
+Usage:
+    pip install uvicorn
+    python3 benchmarks/asgi_vs_wsgi.py [--concurrency 64] [--requests 2000] [--slow-clients 50]
+
+Each scenario fires requests from a pool of concurrent asyncio clients and
+reports throughput and latency percentiles. The slow-client scenario keeps
+streaming downloads open that are read at a trickle while measuring reel
+latency, which is where a thread-per-request server starts to suffer.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(ROOT, "api")
+
+SCENARIOS = [
+    ("reel", "/api/generate/reel", {"topic": "building confidence", "num_tips": 3}),
+    ("hooks x20", "/api/generate/hooks", {"category": "mindset", "count": 20}),
+    ("hooks stream x200", "/api/generate/hooks", {"count": 200, "stream": "ndjson"}),
+    ("batch x100", "/api/generate/batch", {"jobs": [{"topic": "time management"}] * 100}),
+    ("topics (Flask route)", "/api/topics", None),
+]
+
+
+def free_port():
+    """Pick an unused local port"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve_wsgi(port):
+    """Serve the Flask app with werkzeug's threaded server (blocking)"""
+    sys.path.insert(0, API_DIR)
+    from werkzeug.serving import make_server
+    from index import app
+    make_server("127.0.0.1", port, app, threaded=True).serve_forever()
+
+
+def start_server(kind, port):
+    """Start a server subprocess and wait until it accepts connections"""
+    if kind == "wsgi":
+        command = [sys.executable, os.path.abspath(__file__), "--serve-wsgi", str(port)]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "asgi:app", "--app-dir", API_DIR,
+                   "--port", str(port), "--log-level", "warning"]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{kind} server did not start")
+
+
+def build_request(path, body):
+    """Raw HTTP/1.1 request bytes"""
+    if body is None:
+        return f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode()
+    payload = json.dumps(body).encode()
+    head = (f"POST {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n")
+    return head.encode() + payload
+
+
+async def fetch(port, request, read_delay=0.0):
+    """Send one request and read the response to EOF; returns (latency seconds, ok)"""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    first = await reader.read(65536)
+    ok = first.startswith(b"HTTP/1.1 200") or first.startswith(b"HTTP/1.0 200")
+    while True:
+        if read_delay:
+            await asyncio.sleep(read_delay)
+        chunk = await reader.read(1024 if read_delay else 65536)
+        if not chunk:
+            break
+    writer.close()
+    return time.perf_counter() - start, ok
+
+
+async def load(port, request, total, concurrency):
+    """Fire `total` requests with `concurrency` clients; returns (elapsed, latencies, errors)"""
+    latencies, errors = [], 0
+    remaining = iter(range(total))
+
+    async def client():
+        nonlocal errors
+        for _ in remaining:
+            try:
+                latency, ok = await fetch(port, request)
+                latencies.append(latency)
+                errors += not ok
+            except OSError:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    return time.perf_counter() - start, latencies, errors
+
+
+async def load_with_slow_clients(port, total, concurrency, slow_clients):
+    """Reel load while slow clients trickle-read long hook streams"""
+    slow_request = build_request("/api/generate/hooks", {"count": 5000, "stream": "ndjson"})
+    slow = [asyncio.ensure_future(fetch(port, slow_request, read_delay=0.05)) for _ in range(slow_clients)]
+    await asyncio.sleep(0.5)
+    result = await load(port, build_request(*SCENARIOS[0][1:]), total, concurrency)
+    for task in slow:
+        task.cancel()
+    await asyncio.gather(*slow, return_exceptions=True)
+    return result
+
+
+def summarize(name, elapsed, latencies, errors):
+    """One result row"""
+    latencies = sorted(latencies) or [0.0]
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {
+        "scenario": name,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(pct(0.50), 2),
+        "p95_ms": round(pct(0.95), 2),
+        "p99_ms": round(pct(0.99), 2),
+        "errors": errors,
+    }
+
+
+async def run_suite(port, args):
+    """All scenarios against one server"""
+    rows = []
+    for name, path, body in SCENARIOS:
+        request = build_request(path, body)
+        await load(port, request, min(50, args.requests), args.concurrency)  # warm up
+        total = args.requests if "batch" not in name and "stream" not in name else max(1, args.requests // 10)
+        rows.append(summarize(name, *await load(port, request, total, args.concurrency)))
+    name = f"reel + {args.slow_clients} slow clients"
+    rows.append(summarize(name, *await load_with_slow_clients(port, args.requests, args.concurrency, args.slow_clients)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ASGI vs WSGI load benchmark")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--slow-clients", type=int, default=50)
+    parser.add_argument("--serve-wsgi", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_wsgi:
+        return serve_wsgi(args.serve_wsgi)
+
+    servers = ["wsgi"]
+    try:
+        import uvicorn  # noqa: F401
+        servers.append("asgi")
+    except ImportError:
+        print("Note: uvicorn is not installed (pip install uvicorn); benchmarking WSGI only")
+
+    results = {}
+    for kind in servers:
+        port = free_port()
+        process = start_server(kind, port)
+        try:
+            results[kind] = asyncio.run(run_suite(port, args))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"\n{'scenario':<28}{'server':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for index in range(len(results["wsgi"])):
+        for kind in servers:
+            row = results[kind][index]
+            print(f"{row['scenario']:<28}{kind:<8}{row['requests_per_sec']:>10}{row['p50_ms']:>10}"
+                  f"{row['p95_ms']:>10}{row['p99_ms']:>10}{row['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Cold-start benchmark for the serverless entry point (api/index.py).
+
+Usage:
+    python3 benchmarks/cold_start.py                  # 10 fresh interpreters, report medians
+    python3 benchmarks/cold_start.py --budget-ms 400  # exit 1 if import + first request exceeds the budget
+    python3 benchmarks/cold_start.py --importtime     # also list the slowest modules to import
+
+Every run starts a new Python process, the way a serverless instance does, and
+measures the time to import the app and to serve the first generate request,
+along with the startup phases the app records itself. Bytecode caches are warm
+(as they are in a deployed bundle); the interpreter's own startup is reported
+separately.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(ROOT, "api")
+
+# Runs inside each fresh interpreter and prints one JSON line
+CHILD = r"""
+import io, json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {api_dir!r})
+import index
+imported = time.perf_counter()
+
+body = json.dumps({{"topic": "building confidence", "num_tips": 3}}).encode()
+environ = {{
+    "REQUEST_METHOD": "POST", "PATH_INFO": "/api/generate/reel", "SCRIPT_NAME": "", "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1",
+    "CONTENT_TYPE": "application/json", "CONTENT_LENGTH": str(len(body)),
+    "wsgi.version": (1, 0), "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(body), "wsgi.errors": sys.stderr,
+    "wsgi.multithread": False, "wsgi.multiprocess": False, "wsgi.run_once": False,
+}}
+status = []
+request_start = time.perf_counter()
+result = index.app(environ, lambda s, h, e=None: status.append(s))
+b"".join(result)
+done = time.perf_counter()
+
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (done - request_start) * 1000,
+    "status": status[0],
+    "phases_ms": {{phase: seconds * 1000 for phase, seconds in getattr(index, "startup_timings", {{}}).items()}},
+}}))
+"""
+
+
+def run_once(env):
+    """One fresh interpreter; returns its measurements plus total process wall time"""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD.format(api_dir=API_DIR)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    wall_ms = (time.perf_counter() - start) * 1000
+    sample = json.loads(output.strip().splitlines()[-1])
+    sample["process_ms"] = wall_ms
+    return sample
+
+
+def interpreter_startup_ms(env, runs):
+    """Median wall time of a bare `python -c pass`, for reference"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], env=env, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def slowest_imports(env, limit):
+    """(module, cumulative microseconds) for the slowest modules imported directly by index.py"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {API_DIR!r}); import index"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stderr
+    # importtime lists a module after its imports, each nesting level indented two more spaces
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match:
+            rows.append((match.group(3), int(match.group(1)), len(match.group(2))))
+    end = max(i for i, row in enumerate(rows) if row[0] == "index")
+    depth = rows[end][2]
+    start = end
+    while start > 0 and rows[start - 1][2] > depth:
+        start -= 1
+    direct = [row[:2] for row in rows[start:end] if row[2] == depth + 2]
+    return sorted(direct, key=lambda row: row[1], reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serverless cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, help="fail if median import + first request exceeds this")
+    parser.add_argument("--importtime", action="store_true", help="list the slowest modules index.py imports")
+    parser.add_argument("--json", action="store_true", help="print raw samples as JSON")
+    args = parser.parse_args()
+
+    env = dict(os.environ, CONTENT_CACHE_BACKEND="memory")
+    env.pop("CONTENT_STARTUP_REPORT", None)
+    run_once(env)  # make sure bytecode caches exist
+    samples = [run_once(env) for _ in range(args.runs)]
+    if args.json:
+        print(json.dumps(samples, indent=2))
+
+    def median(key):
+        return statistics.median(sample[key] for sample in samples)
+
+    phases = sorted({phase for sample in samples for phase in sample["phases_ms"]})
+    cold_ms = median("import_ms") + median("first_request_ms")
+    print(f"{'interpreter startup':<28}{interpreter_startup_ms(env, args.runs):>10.1f} ms")
+    print(f"{'import api/index.py':<28}{median('import_ms'):>10.1f} ms")
+    for phase in phases:
+        value = statistics.median(sample["phases_ms"].get(phase, 0.0) for sample in samples)
+        print(f"{'  ' + phase:<28}{value:>10.1f} ms")
+    print(f"{'first generate request':<28}{median('first_request_ms'):>10.1f} ms")
+    print(f"{'import + first request':<28}{cold_ms:>10.1f} ms")
+    print(f"{'whole process':<28}{median('process_ms'):>10.1f} ms")
+
+    if args.importtime:
+        print("\nSlowest imports of api/index.py:")
+        for module, micros in slowest_imports(env, 10):
+            print(f"  {module:<40}{micros / 1000:>8.1f} ms")
+
+    if any(not sample["status"].startswith("200") for sample in samples):
+        print("Note: first request did not return 200")
+        sys.exit(1)
+    if args.budget_ms is not None and cold_ms > args.budget_ms:
+        print(f"Cold start {cold_ms:.1f}ms is over the {args.budget_ms:.0f}ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Benchmark suite for every generation path and every Flask endpoint.
+
+Usage:
+    python3 benchmarks/run.py                    # run, write benchmarks/results.json, compare to baseline
+    python3 benchmarks/run.py --update-baseline  # run and store the results as the new baseline
+    python3 benchmarks/run.py --filter reel      # only benchmarks whose name contains "reel"
+    python3 benchmarks/run.py --filter reel --update-baseline  # re-baseline only those, keeping the rest
+
+All generation uses fixed seeds and the response cache is disabled, so every run
+measures the same work. Each benchmark is timed in repeated rounds and the
+best time per operation is compared with benchmarks/baseline.json; anything
+slower than the baseline by more than --threshold is flagged and the exit status
+is 1. Times are normalized by a fixed calibration workload measured in the same
+run, which cancels out overall machine speed and load, but baselines are still
+best refreshed on the machine you compare on.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+RESULTS_PATH = os.path.join(BENCH_DIR, "results.json")
+
+# Measure generation, not cache hits
+os.environ["CONTENT_CACHE_BACKEND"] = "off"
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "api"))
+
+from content_generator_core import ContentGenerator, HookLibrary, HookPoints  # noqa: E402
+from example_store import ExampleStore  # noqa: E402
+import index  # noqa: E402
+
+SEED = 1234
+
+
+def generation_benchmarks(generator):
+    """(name, callable) pairs for the core generation paths, small and large counts"""
+    reel = generator.generate_instagram_reel("building confidence", 3, seed=SEED)
+    rng = random.Random(SEED)
+    jobs = [{"topic": "time management"}, ["hooks", None, 5], ["quick_idea", "focus", 3]] * 34
+
+    return [
+        ("reel", lambda: generator.generate_instagram_reel("building confidence", 3, seed=SEED)),
+        ("reel random topic", lambda: generator.generate_instagram_reel(None, 3, seed=SEED)),
+        ("reel 10 tips", lambda: generator.generate_instagram_reel("leadership skills", 10, seed=SEED)),
+        ("tips x3", lambda: generator.generate_tips("delegation skills", 3, seed=SEED)),
+        ("tips x10", lambda: generator.generate_tips("delegation skills", 10, seed=SEED)),
+        ("tips generic topic x3", lambda: generator.generate_tips("sourdough baking", 3, seed=SEED)),
+        ("hook library get_hook", lambda: HookLibrary.get_hook("managing stress", rng=rng)),
+        ("hook point get_hook_point", lambda: HookPoints.get_hook_point("future_pacing", "managing stress", rng=rng)),
+        ("hooks x5", lambda: generator.generate_hooks("setting boundaries", 5, seed=SEED)),
+        ("hooks x100", lambda: generator.generate_hooks("setting boundaries", 100, seed=SEED)),
+        ("content hooks x5", lambda: generator.generate_content_hooks("mindset", 5, seed=SEED)),
+        ("content hooks x200", lambda: generator.generate_content_hooks("mindset", 200, seed=SEED)),
+        ("custom reel", lambda: generator.generate_custom_content("Delegating work", "reel", 3, seed=SEED)),
+        ("custom hooks x10", lambda: generator.generate_custom_content("Delegating work", "hooks", 10, seed=SEED)),
+        ("custom quick idea", lambda: generator.generate_custom_content("Delegating work", "quick_idea", seed=SEED)),
+        ("topic resolution", lambda: generator.resolve_topic("time-management tips")),
+        ("compile reel script", lambda: generator.compile_reel_script(reel)),
+        ("framework", lambda: generator.generate_content_framework("brutal_honesty", seed=SEED)),
+        ("batch x102", lambda: generator.generate_batch(jobs, seed=SEED)),
+        ("calendar 30x3 (1 worker)", lambda: generator.generate_calendar(30, 3, seed=SEED, workers=1)),
+    ]
+
+
+def endpoint_benchmarks(client):
+    """(name, callable) pairs covering every route in api/index.py via the Flask test client"""
+    def consume(response):
+        # Read the whole body so streamed responses are actually generated
+        response.get_data()
+        response.close()
+
+    def get(path, **kwargs):
+        return lambda: consume(client.get(path, **kwargs))
+
+    def post(path, body):
+        return lambda: consume(client.post(path, json=body))
+
+    tip = {"title": "bench tip", "explanation": "benchmark", "b_roll": False}
+    return {
+        "home": [("GET /", get("/")), ("GET / gzip", get("/", headers={"Accept-Encoding": "gzip"}))],
+        "static": [("GET /index.html (static)", get("/index.html"))],
+        "get_topics": [("GET /api/topics", get("/api/topics"))],
+        "generate_reel": [("POST /api/generate/reel", post("/api/generate/reel", {"topic": "building confidence", "seed": SEED}))],
+        "generate_batch": [
+            ("POST /api/generate/batch x20", post("/api/generate/batch", {"jobs": [{"topic": "time management"}] * 20, "seed": SEED})),
+            ("POST /api/generate/batch x20 stream", post("/api/generate/batch", {"jobs": [{"topic": "time management"}] * 20, "seed": SEED, "stream": True})),
+        ],
+        "generate_hooks": [
+            ("POST /api/generate/hooks x5", post("/api/generate/hooks", {"category": "mindset", "count": 5, "seed": SEED})),
+            ("POST /api/generate/hooks x100 stream", post("/api/generate/hooks", {"count": 100, "seed": SEED, "stream": "sse"})),
+        ],
+        "generate_quick_ideas": [("POST /api/generate/quick-ideas", post("/api/generate/quick-ideas", {"seed": SEED}))],
+        "get_frameworks": [("GET /api/frameworks", get("/api/frameworks"))],
+        "get_framework": [("GET /api/framework/<type>", get("/api/framework/brutal_honesty"))],
+        "generate_custom": [("POST /api/generate/custom", post("/api/generate/custom", {"topic": "Delegating work", "seed": SEED}))],
+        "export_content": [
+            ("GET /api/export csv x20", get(f"/api/export?format=csv&count=20&seed={SEED}")),
+            ("POST /api/export srt x20", post("/api/export", {"format": "srt", "count": 20, "seed": SEED})),
+        ],
+        "get_cache_stats": [("GET /api/cache/stats", get("/api/cache/stats"))],
+        "get_metrics": [("GET /api/metrics", get("/api/metrics"))],
+        "get_template_coverage": [("GET /api/templates/coverage", get("/api/templates/coverage"))],
+        "get_video_types": [("GET /api/video-types", get("/api/video-types"))],
+        "get_shot_types": [("GET /api/shot-types", get("/api/shot-types"))],
+        "get_suggested_shots": [("GET /api/video-shots/<type>", get("/api/video-shots/talking_head"))],
+        "get_user_examples": [("GET /api/user-examples", get("/api/user-examples"))],
+        "catch_all": [("GET /<path> (catch-all)", get("/some/page"))],
+        # Writes to a temporary copy of the examples (see isolate_user_examples); runs last
+        "add_user_example": [("POST /api/user-examples/add", post("/api/user-examples/add", {"type": "tip", "topic": "bench", "content": tip}))],
+    }
+
+
+def isolate_user_examples(tmp_dir):
+    """Point the API's generator at a temporary copy of user_examples.json so adds don't touch the repo"""
+    path = os.path.join(tmp_dir, "user_examples.json")
+    source = os.path.join(ROOT, "user_examples.json")
+    if os.path.exists(source):
+        shutil.copy(source, path)
+    index.generator.example_store = ExampleStore(path)
+    index.generator.load_user_examples()
+
+
+def time_op(func, min_time, rounds):
+    """Seconds per call: median and best of `rounds` rounds, each at least `min_time` long"""
+    func()  # warm up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples = [elapsed / loops]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return statistics.median(samples), min(samples), loops
+
+
+def calibrate(min_time, rounds):
+    """Best time of a fixed pure-Python workload, used to normalize away machine speed"""
+    payload = {"topic": "calibration", "tips": [{"title": f"tip {i}", "n": i} for i in range(20)]}
+
+    def workload():
+        rng = random.Random(0)
+        text = json.dumps(payload)
+        return sum(rng.random() for _ in range(200)) + len(text.split())
+
+    best = min(time_op(workload, min_time, rounds)[1] for _ in range(3))
+    return round(best * 1e6, 3)
+
+
+def run(benchmarks, min_time, rounds, name_filter=None):
+    """Time each benchmark, printing one line per result"""
+    results = {}
+    for group, name, func in benchmarks:
+        if name_filter and name_filter.lower() not in name.lower():
+            continue
+        median, best, loops = time_op(func, min_time, rounds)
+        results[name] = {
+            "group": group,
+            "median_us": round(median * 1e6, 2),
+            "best_us": round(best * 1e6, 2),
+            "ops_per_sec": round(1 / median, 1) if median else None,
+            "loops": loops,
+        }
+        print(f"  {name:<42}{median * 1e6:>12.1f} us/op{1 / median:>12.0f} ops/s")
+    return results
+
+
+def compare(report, baseline, threshold):
+    """Print machine-normalized changes against the baseline and return the names of regressions"""
+    regressions = []
+    # How much faster/slower this run's machine is than the baseline's
+    speed = report["calibration_us"] / baseline["calibration_us"] if baseline.get("calibration_us") else 1.0
+    print(f"\nCompared with baseline ({baseline.get('created', 'unknown date')}), threshold +{threshold:.0%}, "
+          f"machine speed factor {speed:.2f}:")
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            print(f"  {name:<42}{'new':>12}")
+            continue
+        ratio = result["best_us"] / (previous["best_us"] * speed) if previous["best_us"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = "  (faster)"
+        print(f"  {name:<42}{ratio:>11.2f}x{flag}")
+    return regressions
+
+
+def merge_baseline(report, baseline):
+    """The baseline with this (filtered) run's results replacing or adding theirs, rescaled to its calibration"""
+    scale = baseline["calibration_us"] / report["calibration_us"] if baseline.get("calibration_us") else 1.0
+    merged = dict(baseline, results=dict(baseline.get("results", {})))
+    for name, result in report["results"].items():
+        median_us = round(result["median_us"] * scale, 2)
+        merged["results"][name] = dict(result, median_us=median_us, best_us=round(result["best_us"] * scale, 2),
+                                       ops_per_sec=round(1e6 / median_us, 1) if median_us else None)
+    return merged
+
+
+def git_commit():
+    """Current commit hash, if available"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generation paths and API endpoints")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per timing round (default 0.1)")
+    parser.add_argument("--rounds", type=int, default=7, help="Timing rounds per benchmark (default 7)")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed slowdown before flagging (default 0.3 = 30%%)")
+    parser.add_argument("--output", default=RESULTS_PATH, help="Where to write results JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    args = parser.parse_args()
+
+    generator = ContentGenerator()
+    client = index.app.test_client()
+    endpoints = endpoint_benchmarks(client)
+
+    # Every route must have a benchmark, so new endpoints can't slip through unmeasured
+    missing = sorted(rule.endpoint for rule in index.app.url_map.iter_rules() if rule.endpoint not in endpoints)
+    if missing:
+        print(f"Error: no benchmark for endpoints: {', '.join(missing)}")
+        return 2
+
+    benchmarks = [("generation", name, func) for name, func in generation_benchmarks(generator)]
+    benchmarks += [("endpoint", name, func) for routes in endpoints.values() for name, func in routes]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        isolate_user_examples(tmp_dir)
+        print(f"Running {len(benchmarks)} benchmarks (python {platform.python_version()})")
+        calibration = calibrate(args.min_time, args.rounds)
+        results = run(benchmarks, args.min_time, args.rounds, args.filter)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "calibration_us": calibration,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(args.output)}")
+
+    if args.update_baseline:
+        baseline = report
+        # A filtered run only re-baselines the benchmarks it ran
+        if args.filter and os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+                baseline = merge_baseline(report, json.load(f))
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline updated: {os.path.relpath(BASELINE_PATH)}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("Note: No baseline yet; run with --update-baseline to create one")
+        return 0
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
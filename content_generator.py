@@ -4,8 +4,11 @@ Social Media Content Generator
 Generates engaging content ideas in your unique style to grow engagement and business.
 """
 
+import argparse
+import os
 import random
 import json
+import sys
 from typing import Dict, List
 from datetime import datetime
 
@@ -512,5 +515,115 @@ def main():
             print("\n❌ Invalid choice. Please choose 1-6.")
 
 
+def print_progress(done: int, total: int):
+    """Progress line for long-running commands (stderr, so stdout stays clean JSON)"""
+    sys.stderr.write(f"\r⚙️  Generated {done}/{total} items ({done * 100 // total}%)")
+    if done == total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def run_calendar(args):
+    """Generate a content calendar with the full generator and write it as JSON"""
+    from content_generator_core import ContentGenerator as CoreGenerator
+    from records import to_json
+
+    generator = CoreGenerator()
+    categories = [category.strip() for category in args.categories.split(",")] if args.categories else None
+    content_types = [content_type.strip() for content_type in args.types.split(",")]
+    try:
+        calendar = generator.generate_calendar(
+            args.days, args.per_day, categories, workers=args.workers, seed=args.seed,
+            content_types=content_types, num_tips=args.num_tips, start_date=args.start,
+            progress=None if args.quiet else print_progress
+        )
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    payload = to_json(calendar, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"✅ Saved {calendar['count']} items to {args.output} (seed {calendar['seed']})", file=sys.stderr)
+    else:
+        print(payload)
+    return 0
+
+
+def run_export(args):
+    """Stream generated reels to a file (or stdout) in an export format"""
+    from content_generator_core import ContentGenerator as CoreGenerator
+    from exporters import iter_export
+
+    generator = CoreGenerator()
+    try:
+        reels = generator.iter_reels(args.count, args.topic, args.num_tips, args.category, seed=args.seed)
+        chunks = iter_export(reels, args.format)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    # About a hundred progress updates, however many reels there are
+    step = max(1, args.count // 100)
+    try:
+        for done, chunk in enumerate(chunks, 1):
+            out.write(chunk)
+            if not args.quiet and (done % step == 0 or done == args.count):
+                print_progress(done, args.count)
+    except BrokenPipeError:
+        # The reader (e.g. `head`) stopped early; silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if args.output:
+            out.close()
+    if args.output:
+        print(f"✅ Saved {args.count} reels to {args.output}", file=sys.stderr)
+    return 0
+
+
+def seed_arg(value: str):
+    """--seed value: numeric seeds become ints, so `--seed 5` reproduces the API's "seed": 5"""
+    return int(value) if value.lstrip('-').isdigit() else value
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line subcommands (run without arguments for the interactive menu)"""
+    parser = argparse.ArgumentParser(
+        description="Social Media Content Generator. Run without arguments for the interactive menu."
+    )
+    subcommands = parser.add_subparsers(dest="command")
+
+    calendar = subcommands.add_parser("calendar", help="Generate a content calendar in bulk")
+    calendar.add_argument("--days", type=int, default=90, help="Number of days (default 90)")
+    calendar.add_argument("--per-day", type=int, default=1, help="Items per day (default 1)")
+    calendar.add_argument("--categories", help="Comma-separated categories to rotate through (default all)")
+    calendar.add_argument("--types", default="reel", help="Comma-separated content types per slot: reel, hooks, quick_idea")
+    calendar.add_argument("--num-tips", type=int, default=3, help="Tips per reel / hooks per item (default 3)")
+    calendar.add_argument("--workers", type=int, default=0, help="Worker processes (default: one per CPU)")
+    calendar.add_argument("--seed", type=seed_arg, help="Seed for a reproducible calendar")
+    calendar.add_argument("--start", help="Date of day 1 (YYYY-MM-DD)")
+    calendar.add_argument("--output", "-o", help="Write JSON here instead of stdout")
+    calendar.add_argument("--quiet", action="store_true", help="No progress output")
+    calendar.set_defaults(handler=run_calendar)
+
+    export = subcommands.add_parser("export", help="Export generated reels as JSONL, CSV, SRT or teleprompter text")
+    export.add_argument("--format", "-f", default="jsonl", choices=["jsonl", "csv", "srt", "teleprompter"])
+    export.add_argument("--count", type=int, default=1, help="Number of reels (default 1)")
+    export.add_argument("--topic", help="Topic for every reel (default: a random topic each)")
+    export.add_argument("--category", help="Pick each reel's topic from this category")
+    export.add_argument("--num-tips", type=int, default=3, help="Tips per reel (default 3)")
+    export.add_argument("--seed", type=seed_arg, help="Seed for a reproducible export")
+    export.add_argument("--output", "-o", help="Write here instead of stdout")
+    export.add_argument("--quiet", action="store_true", help="No progress output")
+    export.set_defaults(handler=run_export)
+    return parser
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        cli_args = build_arg_parser().parse_args()
+        sys.exit(cli_args.handler(cli_args))
     main()
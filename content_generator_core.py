@@ -5,10 +5,92 @@ Generates engaging content ideas in your unique style to grow engagement and bus
 Now with 101 hook templates, 20+ messaging frameworks, and creative variety!
 """
 
+import os
 import random
 import json
-from typing import Dict, List
-from datetime import datetime
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence
+from datetime import datetime, timedelta
+
+from content_packs import LazyAttribute, pack_attribute
+from example_store import ExampleStore
+from template_engine import (
+    DeckGroup, TemplateCoverage, TemplateSpace, build_coverage, build_spaces, compile_slots,
+    compile_templates, slot_choices
+)
+from records import FormattedTip, Hook, Reel, ReelSection, Tip
+from stage_profiler import StageProfiler
+from startup_snapshot import load_snapshot
+from timeline import Timeline
+from topic_index import TopicIndex, TopicMatch
+from weighted_sampler import WeightRegistry
+
+_thread_rngs = threading.local()
+
+# Seconds between checks for outside edits to user_examples.json (0 disables hot reload)
+EXAMPLES_RELOAD_INTERVAL = float(os.environ.get("CONTENT_RELOAD_INTERVAL", 2))
+# Batch reels whose tips are drawn in one bulk call (each holds its RNG until it's built)
+TIP_DRAW_CHUNK = 256
+# Bulk tip draws for at least this many reels use NumPy when it's installed
+NUMPY_MIN_DRAWS = 64
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+# The numpy module once a bulk draw has imported it, False if it isn't installed
+_numpy = None
+
+
+def make_rng(seed=None, rng: random.Random = None) -> random.Random:
+    """Resolve the RNG for one generation call: explicit instance, seeded instance, or a per-thread default"""
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+
+    # Unseeded calls share one instance per thread (re-created after fork so workers don't repeat)
+    pid = os.getpid()
+    if getattr(_thread_rngs, "pid", None) != pid:
+        _thread_rngs.rng = random.Random()
+        _thread_rngs.pid = pid
+    return _thread_rngs.rng
+
+
+def _tip_key(seed) -> int:
+    """64-bit key a batch reel's tips are drawn with, from the reel's seed (any int or string)"""
+    return int.from_bytes(hashlib.blake2b(repr(seed).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer: a well-mixed 64-bit value from any 64-bit value"""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _load_numpy():
+    """NumPy, imported on the first bulk draw (it would slow serverless cold starts), or False"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy  # Optional: pip install numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+
+def _template_source(template) -> str:
+    """Weight key of a compiled template: its source text"""
+    return template.source
+
+
+def pick_template(templates: List, rng: random.Random, weights: WeightRegistry = None):
+    """Draw a template, weighted by its "hook_template" weight when a registry is given"""
+    if weights is None:
+        return rng.choice(templates)
+    return weights.choice("hook_template", templates, rng, key=_template_source)
 
 
 class StyleGuide:
@@ -23,17 +105,23 @@ class StyleGuide:
         self.signature_cta = "If you found this helpful, follow along and share this with someone who might need it today. Let's grow together."
         self.tone = "straightforward, no-BS, strategic, empathetic when necessary, hip hop authenticity"
 
-    def get_intro(self) -> str:
+    def get_intro(self, rng: random.Random = None) -> str:
         """Generate credibility statement with variations"""
+        rng = rng or random
         intros = [
             f"Hi my name is {self.name}. I'm a {self.credentials['day_job']} by day and by night I {self.credentials['mission']}.",
             f"I'm {self.name}. {self.credentials['day_job']} by day, helping people grow by night.",
             f"I'm {self.name}, a {self.credentials['day_job']}. I {self.credentials['mission']}.",
         ]
-        return random.choice(intros)
+        return rng.choice(intros)
 
-    def get_cta(self, content_type: str = "standard") -> str:
-        """Generate CTA with variations based on content type"""
+    # CTA kinds in the order variations are drawn from
+    CTA_KINDS = ("standard", "share", "follow", "planner", "clients", "comment")
+
+    def get_cta(self, content_type: str = "standard", rng: random.Random = None,
+                weights: WeightRegistry = None) -> str:
+        """Generate CTA with variations based on content type (variation odds and mix from `weights`)"""
+        rng = rng or random
         ctas = {
             "standard": self.signature_cta,
             "share": "If this resonated with you, share it with someone who needs to hear it. Let's grow together.",
@@ -44,711 +132,125 @@ class StyleGuide:
         }
 
         # Mostly return standard, sometimes vary
-        if random.random() < 0.15:  # 15% chance to vary
-            return random.choice(list(ctas.values()))
+        variation = weights.probability("cta_variation") if weights else 0.15
+        if rng.random() < variation:
+            return ctas[weights.choice("cta", self.CTA_KINDS, rng) if weights else rng.choice(self.CTA_KINDS)]
         return ctas.get(content_type, self.signature_cta)
 
 
 class HookLibrary:
     """Library of 101 hook templates from Creator Blueprints"""
 
-    HOOK_TEMPLATES = [
-        # Direct Question Hooks
-        "Want to {desired_result} but don't want to {thing_they_dont_want}? Try this.",
-        "Want to {desired_result} without {thing_they_dont_want}? Here's how.",
-        "Trying to {desired_result}? Stop doing {common_mistake}.",
-        "Struggling with {problem}? Here's what's really holding you back.",
-
-        # Pattern Interrupt Hooks
-        "Here's why most {target_audience} fail to {desired_result}",
-        "The #1 reason {target_audience} struggle with {problem}",
-        "This is what nobody tells you about {topic}",
-        "The truth about {topic} that most people miss",
-
-        # Controversial/Bold Claims
-        "Unpopular opinion: {controversial_take}",
-        "{common_belief} is actually making things worse",
-        "Stop {common_advice}. Do this instead.",
-        "I used to believe {old_belief}. I was wrong.",
-
-        # Story-Based Hooks
-        "I learned this the hard way: {lesson}",
-        "Here's what changed everything for me about {topic}",
-        "The moment I realized {insight}",
-        "3 years ago, I {past_situation}. Today, {current_situation}.",
-
-        # Problem-Focused Hooks
-        "If you're {struggling_with}, you're not alone. Here's why.",
-        "{problem} is costing you more than you think",
-        "The biggest mistake I see with {topic}",
-        "{problem}? Most people do this. Big mistake.",
-
-        # List/Number Hooks
-        "{number} signs you're {situation}",
-        "{number} things I wish I knew about {topic}",
-        "{number} ways to {desired_result} (the last one changed everything)",
-        "Here are {number} things successful people do differently",
-
-        # Curiosity Gaps
-        "The one thing that separates {successful_group} from everyone else",
-        "What {successful_person} won't tell you about {topic}",
-        "The secret to {desired_result} (it's not what you think)",
-        "I tried {number} different approaches to {topic}. Only one worked.",
-
-        # Relatability Hooks
-        "Can we normalize {relatable_struggle}?",
-        "Is it just me or is {common_situation} getting worse?",
-        "Tell me I'm not the only one who {relatable_behavior}",
-        "Raise your hand if you've ever {relatable_situation}",
-
-        # Mistake/Failure Hooks
-        "I wasted {time_period} doing {mistake}. Don't make the same mistake.",
-        "Here's what I got wrong about {topic}",
-        "The {number} mistakes keeping you from {desired_result}",
-        "I used to {old_behavior}. Then I learned this.",
-
-        # Transformation Hooks
-        "How I went from {before_state} to {after_state}",
-        "Before vs After: What changed when I {action}",
-        "The simple shift that transformed my {area_of_life}",
-        "{time_period} ago I couldn't {struggle}. Now I {achievement}.",
-
-        # Objection Handling
-        "Think you need {perceived_requirement} to {desired_result}? Think again.",
-        "You don't need {common_solution} to {desired_result}",
-        "No {resource}, no problem. Here's how to {desired_result}",
-        "{excuse} is not stopping you. This is.",
-
-        # Authority/Credibility
-        "After {number} years of {experience}, here's what I've learned",
-        "I've helped {number} people with {problem}. This is what works.",
-        "From my {number} years as a {profession}, here's the truth",
-        "In my career as a {profession}, I've seen {observation}",
-
-        # Comparison Hooks
-        "{topic} vs {alternative}: Which one actually works?",
-        "The difference between {approach_a} and {approach_b}",
-        "Why {solution_a} beats {solution_b} every time",
-        "Everyone's doing {popular_thing}. I'm doing this instead.",
-
-        # Warning/Caution Hooks
-        "If you're planning to {action}, read this first",
-        "Before you {action}, you need to know this",
-        "Don't {action} until you {prerequisite}",
-        "This mistake with {topic} could cost you everything",
-
-        # Myth-Busting
-        "The myth about {topic} that's holding you back",
-        "Let's debunk the biggest lie about {topic}",
-        "Everything you think you know about {topic}? Wrong.",
-        "The {topic} myth that needs to die",
-
-        # Personal Confession
-        "I'll be honest: I struggled with {problem} for years",
-        "Can I be real with you about {topic}?",
-        "Here's something I never talk about: {vulnerable_topic}",
-        "The truth I wish someone told me about {topic}",
-
-        # Challenge/Dare
-        "Try this {action} for {time_period} and watch what happens",
-        "I challenge you to {action}",
-        "What would happen if you {hypothetical_action}?",
-        "Here's an experiment: {challenge}",
-
-        # Pain Point Amplification
-        "Tired of {frustration}? You're doing this wrong.",
-        "Still {struggling}? This is why.",
-        "Fed up with {problem}? There's a better way.",
-        "{frustration} doesn't have to be your reality",
-
-        # Social Proof
-        "This helped {number} people {achieve_result}",
-        "Why everyone's talking about {topic}",
-        "The strategy that {successful_group} use",
-        "What the top {percentage}% do differently",
-
-        # Future Pacing
-        "Imagine if you could {desired_outcome}",
-        "What if I told you {desired_result} was possible in {timeframe}?",
-        "Picture this: {ideal_scenario}",
-        "In {timeframe}, you could {achievement}. Here's how.",
-
-        # Contrarian
-        "Forget everything you know about {topic}",
-        "What if {common_belief} is backwards?",
-        "The opposite of {common_advice} actually works better",
-        "{conventional_wisdom} is outdated. Try this.",
-
-        # Behind the Scenes
-        "Here's what really happens when {situation}",
-        "The behind-the-scenes truth about {topic}",
-        "What they don't show you about {topic}",
-        "The reality of {topic} (unfiltered)",
-
-        # Urgency/Timing
-        "Now is the time to {action}. Here's why.",
-        "If you don't {action} now, {negative_consequence}",
-        "The window for {opportunity} is closing",
-        "Why {current_moment} is perfect for {action}",
-
-        # Simplification
-        "{topic} doesn't have to be complicated",
-        "The simple truth about {topic}",
-        "How to {desired_result} in {number} simple steps",
-        "I simplified {topic} down to this",
-
-        # Recognition/Validation
-        "Shoutout to everyone who {struggle}",
-        "This one's for the people who {situation}",
-        "To anyone who's ever {experience}: I see you",
-        "If you've been {struggling}, this is your sign",
-
-        # Stakes/Consequence
-        "What's at stake if you ignore {problem}",
-        "The cost of not addressing {issue}",
-        "Here's what you're losing by {inaction}",
-        "{problem} has bigger consequences than you think",
-
-        # Process Reveal
-        "My exact process for {desired_result}",
-        "The step-by-step breakdown of {achievement}",
-        "Here's my framework for {topic}",
-        "The system I use to {desired_result}",
-    ]
+    # Template sources (packs/hooks.pack) and placeholder defaults (packs/slots.pack: strings may
+    # reference {topic}, lists are random choices), loaded on first use
+    HOOK_TEMPLATES = pack_attribute("hooks", "templates")
+    SLOT_DEFAULTS = pack_attribute("slots", "hook_library")
 
-    @classmethod
-    def get_hook(cls, topic: str, context: Dict = None) -> str:
-        """Get a random hook template and fill it with topic-specific content"""
-        template = random.choice(cls.HOOK_TEMPLATES)
-
-        # Default context
-        default_context = {
-            'desired_result': f"master {topic}",
-            'thing_they_dont_want': "spend years struggling",
-            'common_mistake': "the same old approach",
-            'problem': topic,
-            'target_audience': "people",
-            'topic': topic,
-            'controversial_take': f"{topic} is misunderstood",
-            'common_belief': f"traditional advice about {topic}",
-            'common_advice': "what everyone else says",
-            'old_belief': f"{topic} was impossible",
-            'lesson': f"how to approach {topic}",
-            'insight': f"the real key to {topic}",
-            'past_situation': f"struggled with {topic}",
-            'current_situation': f"I've mastered {topic}",
-            'struggling_with': f"dealing with {topic}",
-            'number': random.choice(['3', '4', '5', '7']),
-            'situation': f"facing {topic}",
-            'successful_group': "high performers",
-            'successful_person': "experts",
-            'relatable_struggle': f"struggling with {topic}",
-            'common_situation': topic,
-            'relatable_behavior': f"struggled with {topic}",
-            'relatable_situation': f"dealt with {topic}",
-            'time_period': random.choice(['years', 'months', '6 months', 'too long']),
-            'mistake': f"the wrong approach to {topic}",
-            'old_behavior': f"avoid {topic}",
-            'action': f"tackle {topic}",
-            'before_state': f"struggling with {topic}",
-            'after_state': f"mastering {topic}",
-            'area_of_life': topic,
-            'achievement': f"handle it with ease",
-            'perceived_requirement': random.choice(['years of experience', 'special skills', 'perfect conditions']),
-            'common_solution': "the traditional approach",
-            'resource': random.choice(['time', 'money', 'experience']),
-            'excuse': random.choice(['Time', 'Money', 'Experience']),
-            'experience': random.choice(['managing people', 'leadership', 'personal development']),
-            'profession': "senior project manager",
-            'observation': f"what really works with {topic}",
-            'alternative': "the old way",
-            'approach_a': "this method",
-            'approach_b': "traditional advice",
-            'solution_a': "this approach",
-            'solution_b': "what everyone else does",
-            'popular_thing': "the common approach",
-            'prerequisite': "understand this",
-            'vulnerable_topic': f"my journey with {topic}",
-            'hypothetical_action': f"approached {topic} differently",
-            'challenge': f"try this with {topic}",
-            'frustration': f"dealing with {topic}",
-            'achieve_result': f"improve their {topic}",
-            'percentage': random.choice(['1', '5', '10']),
-            'desired_outcome': f"finally master {topic}",
-            'timeframe': random.choice(['30 days', '3 months', '90 days', 'a year']),
-            'ideal_scenario': f"you've conquered {topic}",
-            'conventional_wisdom': f"old advice about {topic}",
-            'opportunity': f"growth in {topic}",
-            'current_moment': "right now",
-            'negative_consequence': "you'll keep struggling",
-            'struggle': f"deal with {topic}",
-            'experience': f"faced {topic}",
-            'issue': topic,
-            'inaction': f"not addressing {topic}",
-        }
+    SLOTS = LazyAttribute(lambda cls: compile_slots(cls.SLOT_DEFAULTS))
+    COMPILED_TEMPLATES = LazyAttribute(lambda cls: compile_templates(cls.HOOK_TEMPLATES))
 
-        # Merge with provided context
-        if context:
-            default_context.update(context)
+    # Templates referencing placeholders we can't fill are quarantined on load, never sampled
+    COVERAGE = LazyAttribute(lambda cls: TemplateCoverage(cls.COMPILED_TEMPLATES, cls.SLOTS))
+    FILLABLE_TEMPLATES = LazyAttribute(lambda cls: cls.COVERAGE.fillable)
+    # Every distinct hook the fillable templates can render, for duplicate-free sampling
+    SPACE = LazyAttribute(lambda cls: TemplateSpace(cls.FILLABLE_TEMPLATES, cls.SLOTS, slot_choices(cls.SLOT_DEFAULTS)))
 
-        # Fill template
-        try:
-            return template.format(**default_context)
-        except KeyError:
-            # If template has keys we don't have, return a simpler version
+    @classmethod
+    def get_hook(cls, topic: str, context: Dict = None, rng: random.Random = None,
+                 weights: WeightRegistry = None) -> str:
+        """Get a random (optionally weighted) hook template and fill it with topic-specific content"""
+        rng = rng or random
+        if not cls.FILLABLE_TEMPLATES:
             return f"Here's what you need to know about {topic}"
 
+        # Fill template, building only the placeholders it references
+        template = pick_template(cls.FILLABLE_TEMPLATES, rng, weights)
+        return template.render(cls.SLOTS, topic, context, rng)
+
+    @classmethod
+    def coverage_report(cls) -> Dict:
+        """Get the load-time placeholder coverage report for the hook templates"""
+        return cls.COVERAGE.to_dict()
+
 
 class MessagingFrameworks:
     """20+ messaging frameworks for content variety"""
 
-    FRAMEWORKS = {
-        "natural_law_metaphor": {
-            "name": "Natural Law Metaphor",
-            "structure": [
-                "Hook: Present a natural law or phenomenon",
-                "Bridge: Connect it to personal/professional growth",
-                "Application: How this applies to your audience's life",
-                "Action: What they should do with this insight"
-            ]
-        },
-        "common_unseen_mistake": {
-            "name": "Common Unseen Mistake",
-            "structure": [
-                "Hook: Most people do [X]",
-                "Problem: But they're missing [Y]",
-                "Why: Here's what's really happening",
-                "Solution: Do this instead",
-                "Result: What changes when you fix it"
-            ]
-        },
-        "brutal_honesty": {
-            "name": "Brutal Honesty Callout",
-            "structure": [
-                "Hook: Call out the hard truth",
-                "Reality: No sugar-coating",
-                "Why it matters: The cost of denial",
-                "Path forward: What to do about it"
-            ]
-        },
-        "cost_of_inaction": {
-            "name": "Cost of Inaction",
-            "structure": [
-                "Hook: Present the status quo",
-                "Hidden costs: What's being lost",
-                "Compound effect: How it gets worse over time",
-                "Alternative: What action creates"
-            ]
-        },
-        "best_of_both_worlds": {
-            "name": "Best of Both Worlds",
-            "structure": [
-                "Hook: The false choice",
-                "Option A: Traditional path",
-                "Option B: Alternative path",
-                "Option C: The hybrid approach",
-                "Why it works: Benefits of both"
-            ]
-        },
-        "deeper_problem": {
-            "name": "The Deeper Problem",
-            "structure": [
-                "Hook: Surface problem everyone sees",
-                "Dig deeper: What's really causing it",
-                "Root cause: The actual issue",
-                "Real solution: Address the root"
-            ]
-        },
-        "i_used_to_believe": {
-            "name": "I Used To Believe",
-            "structure": [
-                "Hook: Old belief",
-                "Experience: What changed",
-                "Realization: New understanding",
-                "Application: How to shift perspective"
-            ]
-        },
-        "point_of_high_drama": {
-            "name": "Point of High Drama",
-            "structure": [
-                "Hook: The critical moment",
-                "Stakes: What was on the line",
-                "Decision: What happened",
-                "Lesson: What it taught",
-                "Application: How you can use this"
-            ]
-        },
-        "linear_roadmap": {
-            "name": "Linear Roadmap",
-            "structure": [
-                "Hook: Where you want to go",
-                "Step 1: First action",
-                "Step 2: Next move",
-                "Step 3: Final step",
-                "Destination: What success looks like"
-            ]
-        },
-        "calling_out_enemy": {
-            "name": "Calling Out The Enemy",
-            "structure": [
-                "Hook: Name the enemy",
-                "Impact: How it's hurting people",
-                "Why it persists: The system keeping it alive",
-                "Fight back: How to resist",
-                "Victory: What winning looks like"
-            ]
-        },
-        "great_paradox": {
-            "name": "The Great Paradox",
-            "structure": [
-                "Hook: The contradiction",
-                "Side A: One truth",
-                "Side B: Opposite truth",
-                "Resolution: How both are true",
-                "Wisdom: Living with paradox"
-            ]
-        },
-        "unlikely_hero": {
-            "name": "The Unlikely Hero",
-            "structure": [
-                "Hook: The underdog",
-                "Disadvantage: What was against them",
-                "Secret strength: Hidden advantage",
-                "Victory: How they won",
-                "Lesson: What this teaches us"
-            ]
-        },
-        "the_reporter": {
-            "name": "The Reporter",
-            "structure": [
-                "Hook: The observation",
-                "Data: What you're seeing",
-                "Analysis: What it means",
-                "Implications: Why it matters",
-                "Forecast: What's coming"
-            ]
-        },
-        "controversial_perspective": {
-            "name": "Controversial Perspective",
-            "structure": [
-                "Hook: The unpopular opinion",
-                "Common view: What most believe",
-                "Counter-argument: Why they're wrong",
-                "Evidence: Supporting your view",
-                "Conclusion: Stand by your position"
-            ]
-        },
-        "vulnerable_admission": {
-            "name": "Vulnerable Admission",
-            "structure": [
-                "Hook: The confession",
-                "Struggle: What you faced",
-                "Shame: How it felt",
-                "Growth: What you learned",
-                "Freedom: Sharing helps others"
-            ]
-        },
-    }
+    # name -> framework (packs/frameworks.pack), each parsed on first use
+    FRAMEWORKS = pack_attribute("frameworks")
+    FRAMEWORK_NAMES = LazyAttribute(lambda cls: tuple(cls.FRAMEWORKS))
 
     @classmethod
-    def get_random_framework(cls) -> Dict:
-        """Get a random messaging framework"""
-        return random.choice(list(cls.FRAMEWORKS.values()))
+    def get_random_framework(cls, rng: random.Random = None, weights: WeightRegistry = None) -> Dict:
+        """Get a random (optionally weighted) messaging framework"""
+        rng = rng or random
+        name = weights.choice("framework", cls.FRAMEWORK_NAMES, rng) if weights else rng.choice(cls.FRAMEWORK_NAMES)
+        return cls.FRAMEWORKS[name]
 
     @classmethod
-    def get_framework(cls, framework_name: str) -> Dict:
+    def get_framework(cls, framework_name: str, rng: random.Random = None, weights: WeightRegistry = None) -> Dict:
         """Get a specific framework"""
-        return cls.FRAMEWORKS.get(framework_name, cls.get_random_framework())
+        framework = cls.FRAMEWORKS.get(framework_name)
+        return framework if framework else cls.get_random_framework(rng, weights)
 
 
 class HookPoints:
     """10 Hook Point techniques for attention-grabbing openings"""
 
-    TECHNIQUES = {
-        "future_pacing": {
-            "name": "Future Pacing",
-            "description": "Paint a picture of the desired future",
-            "templates": [
-                "Imagine waking up every day {positive_outcome}",
-                "Picture yourself {ideal_scenario}",
-                "What if {timeframe} from now, you {achievement}?",
-                "Envision a life where {desired_state}"
-            ]
-        },
-        "unresolved_problems": {
-            "name": "Unresolved Problems",
-            "description": "Address ongoing struggles",
-            "templates": [
-                "Still struggling with {problem}? Here's why.",
-                "Can't seem to {desired_result}? This is the missing piece.",
-                "Tired of {frustration}? There's a reason.",
-                "{problem} won't go away until you {action}"
-            ]
-        },
-        "situational_relatability": {
-            "name": "Situational Relatability",
-            "description": "Create instant connection",
-            "templates": [
-                "Ever feel like {relatable_feeling}?",
-                "You know that moment when {relatable_situation}?",
-                "We've all been there: {common_experience}",
-                "Raise your hand if {relatable_struggle}"
-            ]
-        },
-        "context_framing": {
-            "name": "Context Framing",
-            "description": "Set the stage with context",
-            "templates": [
-                "Here's something they don't teach you about {topic}",
-                "The thing about {topic} that nobody talks about",
-                "In all my years {experience}, I've learned {lesson}",
-                "After {credential}, here's what I know about {topic}"
-            ]
-        },
-        "stories": {
-            "name": "Stories",
-            "description": "Draw people in with narrative",
-            "templates": [
-                "{timeframe} ago, I {past_situation}. Everything changed when {turning_point}.",
-                "I'll never forget the day {memorable_moment}",
-                "There was a time when I {past_struggle}. Then {transformation}.",
-                "The moment I realized {insight} changed everything"
-            ]
-        },
-        "controversy": {
-            "name": "Controversy",
-            "description": "Challenge common beliefs",
-            "templates": [
-                "Unpopular opinion: {controversial_take}",
-                "Hot take: {bold_claim}",
-                "Let's be honest: {uncomfortable_truth}",
-                "I'm going to say what everyone's thinking: {truth_bomb}"
-            ]
-        },
-        "novelty": {
-            "name": "Novelty",
-            "description": "Present something new",
-            "templates": [
-                "I just discovered {new_insight} about {topic}",
-                "Here's a fresh take on {topic}",
-                "What if we approached {topic} completely differently?",
-                "I tried something new with {topic}. The results were {outcome}."
-            ]
-        },
-        "insight": {
-            "name": "Insight",
-            "description": "Share valuable knowledge",
-            "templates": [
-                "The difference between {success} and {failure} comes down to {key_insight}",
-                "Here's what separates {achievers} from everyone else",
-                "The secret to {desired_result} is {insight}",
-                "Most people miss this about {topic}: {revelation}"
-            ]
-        },
-        "five_senses": {
-            "name": "5 Senses",
-            "description": "Create vivid imagery",
-            "templates": [
-                "You know that feeling when {sensory_experience}?",
-                "Picture this: {vivid_scenario}",
-                "Remember the last time you {sensory_memory}?",
-                "Imagine {sensory_future_pace}"
-            ]
-        },
-        "common_enemies": {
-            "name": "Common Enemies",
-            "description": "Unite against a shared obstacle",
-            "templates": [
-                "Can we talk about how {common_enemy} is holding us back?",
-                "{obstacle} is the real problem. Here's why.",
-                "We've been fighting the wrong battle. {real_enemy} is what we should address.",
-                "Everyone's focused on {distraction}. Meanwhile, {actual_problem} is the issue."
-            ]
-        }
-    }
+    # technique -> hook point (packs/hook_points.pack) and placeholder defaults (packs/slots.pack),
+    # loaded on first use
+    TECHNIQUES = pack_attribute("hook_points")
+    SLOT_DEFAULTS = pack_attribute("slots", "hook_points")
+
+    SLOTS = LazyAttribute(lambda cls: compile_slots(cls.SLOT_DEFAULTS))
+    COMPILED_TEMPLATES = LazyAttribute(lambda cls: {
+        technique: compile_templates(hook_point['templates'])
+        for technique, hook_point in cls.TECHNIQUES.items()
+    })
+
+    # Per-technique coverage; unfillable templates are quarantined on load
+    COVERAGE = LazyAttribute(lambda cls: build_coverage(cls.COMPILED_TEMPLATES, cls.SLOTS))
+    FILLABLE_TEMPLATES = LazyAttribute(
+        lambda cls: {technique: coverage.fillable for technique, coverage in cls.COVERAGE.items()}
+    )
+    SPACES = LazyAttribute(lambda cls: build_spaces(cls.FILLABLE_TEMPLATES, cls.SLOTS, slot_choices(cls.SLOT_DEFAULTS)))
+
+    TECHNIQUE_NAMES = LazyAttribute(lambda cls: tuple(cls.TECHNIQUES))
 
     @classmethod
-    def get_hook_point(cls, technique: str, topic: str, context: Dict = None) -> str:
+    def get_hook_point(cls, technique: str, topic: str, context: Dict = None, rng: random.Random = None,
+                       weights: WeightRegistry = None) -> str:
         """Get a hook using a specific technique"""
-        hook_point = cls.TECHNIQUES.get(technique, cls.TECHNIQUES['future_pacing'])
-        template = random.choice(hook_point['templates'])
-
-        # Default context
-        default_context = {
-            'positive_outcome': f"feeling confident about {topic}",
-            'ideal_scenario': f"mastering {topic}",
-            'timeframe': random.choice(['6 months', 'a year', '90 days']),
-            'achievement': f"conquered {topic}",
-            'desired_state': f"{topic} is no longer a struggle",
-            'problem': topic,
-            'desired_result': f"master {topic}",
-            'frustration': f"struggling with {topic}",
-            'action': "change your approach",
-            'relatable_feeling': f"overwhelmed by {topic}",
-            'relatable_situation': f"you're stuck with {topic}",
-            'common_experience': f"facing challenges with {topic}",
-            'relatable_struggle': f"you've struggled with {topic}",
-            'topic': topic,
-            'experience': "in my career",
-            'lesson': f"what really works",
-            'credential': "years of experience",
-            'past_situation': f"struggled with {topic}",
-            'turning_point': "I learned this",
-            'memorable_moment': "everything clicked",
-            'past_struggle': f"couldn't handle {topic}",
-            'transformation': "I found a better way",
-            'insight': f"the key to {topic}",
-            'controversial_take': f"{topic} is misunderstood",
-            'bold_claim': f"most advice about {topic} is wrong",
-            'uncomfortable_truth': f"{topic} requires more than we think",
-            'truth_bomb': f"{topic} isn't the real issue",
-            'new_insight': "something surprising",
-            'outcome': "unexpected",
-            'success': "those who succeed",
-            'failure': "those who struggle",
-            'key_insight': "one simple shift",
-            'achievers': "high performers",
-            'revelation': f"it's simpler than you think",
-            'sensory_experience': "everything finally makes sense",
-            'vivid_scenario': f"confidently handling {topic}",
-            'sensory_memory': f"struggled with {topic}",
-            'sensory_future_pace': f"easily managing {topic}",
-            'common_enemy': f"outdated advice about {topic}",
-            'obstacle': "the wrong approach",
-            'real_enemy': f"misunderstanding {topic}",
-            'distraction': "surface symptoms",
-            'actual_problem': "the root cause"
-        }
+        rng = rng or random
+        templates = cls.FILLABLE_TEMPLATES.get(technique, cls.FILLABLE_TEMPLATES['future_pacing'])
+        if not templates:
+            return f"Let's talk about {topic}"
 
-        if context:
-            default_context.update(context)
+        template = pick_template(templates, rng, weights)
+        return template.render(cls.SLOTS, topic, context, rng)
 
-        try:
-            return template.format(**default_context)
-        except KeyError:
-            return f"Let's talk about {topic}"
+    @classmethod
+    def coverage_report(cls) -> Dict:
+        """Get the load-time placeholder coverage report, per technique"""
+        return {technique: coverage.to_dict() for technique, coverage in cls.COVERAGE.items()}
 
 
 class VideoShotLibrary:
     """Library of video types and shot types for visual variety"""
 
-    VIDEO_TYPES = {
-        "b_roll_storyteller": {
-            "name": "B-Roll Storyteller",
-            "description": "Overlay visuals of you working, writing, coaching, traveling, or with your planner while your voice narrates.",
-            "best_for": "Tips, motivation, or storytelling posts",
-            "suggested_shots": ["Close-Up", "Detail/Macro", "POV", "Tracking/Movement"]
-        },
-        "micro_documentary": {
-            "name": "Micro-Documentary",
-            "description": "Mix interviews (of you or others), B-roll, and ambient sound.",
-            "best_for": "Behind the brand or 'what I've learned as a coach' pieces",
-            "suggested_shots": ["Medium Shot", "Close-Up", "Cutaway/Insert", "Wide Shot"]
-        },
-        "day_in_life": {
-            "name": "Day-in-the-Life / Workflow",
-            "description": "Real moments—morning routine, content setup, client calls, journaling.",
-            "best_for": "Authenticity and relatability",
-            "suggested_shots": ["Wide Shot", "POV", "Detail/Macro", "Tracking/Movement"]
-        },
-        "tutorial_demo": {
-            "name": "Tutorial / Demo",
-            "description": "Show your planner in action, a journaling method, or productivity technique.",
-            "best_for": "Educational content, how-to guides",
-            "suggested_shots": ["Over-the-Shoulder", "Close-Up", "Detail/Macro", "Medium Shot"]
-        },
-        "voiceover_reel": {
-            "name": "Voiceover Reel",
-            "description": "No talking head at all — just clips + music + your narration.",
-            "best_for": "Motivational or emotional posts",
-            "suggested_shots": ["Cinematic", "Detail/Macro", "Wide Shot", "Tracking/Movement"]
-        },
-        "reaction_duet": {
-            "name": "Reaction / Duet",
-            "description": "React to a trending clip, quote, or topic.",
-            "best_for": "Quick engagement boost; lets you show personality",
-            "suggested_shots": ["Medium Shot", "Close-Up", "Split Screen"]
-        },
-        "text_motion": {
-            "name": "Text-Only with Motion",
-            "description": "On-screen text with music, ambient video, or minimalist motion graphics.",
-            "best_for": "Clean way to drop quotes or '1-minute takeaways'",
-            "suggested_shots": ["Wide Shot", "Detail/Macro", "Cinematic"]
-        },
-        "cinematic_sequence": {
-            "name": "Cinematic Sequence",
-            "description": "Use slow motion, lens flares, or natural light transitions to set a mood.",
-            "best_for": "Branding intros, promo reels, or seasonal posts",
-            "suggested_shots": ["Wide Shot", "Close-Up", "Low Angle", "Tracking/Movement"]
-        }
-    }
-
-    SHOT_TYPES = {
-        "wide_shot": {
-            "name": "Wide Shot (Establishing)",
-            "description": "Sets the scene — office, coffee shop, street.",
-            "best_for": "Opening context or transitions",
-            "examples": ["Office overview", "Coffee shop exterior", "Street scene"]
-        },
-        "medium_shot": {
-            "name": "Medium Shot",
-            "description": "Waist-up, your go-to for natural conversation or gestures.",
-            "best_for": "Natural conversation, presenting tips",
-            "examples": ["Talking to camera", "Gesturing while explaining"]
-        },
-        "close_up": {
-            "name": "Close-Up",
-            "description": "Focus on expressions or objects — writing in planner, flipping a page, sipping coffee.",
-            "best_for": "Intimacy and detail",
-            "examples": ["Facial expressions", "Hand writing", "Coffee cup"]
-        },
-        "over_shoulder": {
-            "name": "Over-the-Shoulder (OTS)",
-            "description": "Great for tutorials, journaling, or showing a client call setup.",
-            "best_for": "Tutorials, showing work in progress",
-            "examples": ["Writing in planner", "Typing on laptop", "Reading notes"]
-        },
-        "pov": {
-            "name": "POV (Point-of-View)",
-            "description": "Your hands typing, holding your phone, walking.",
-            "best_for": "Immersive and personal moments",
-            "examples": ["Walking forward", "Hands typing", "Opening a door"]
-        },
-        "cutaway": {
-            "name": "Cutaway / Insert Shot",
-            "description": "B-roll that matches your script — e.g., 'I had to pause and reset' → show you exhaling or closing a notebook.",
-            "best_for": "Emphasizing key moments in narration",
-            "examples": ["Closing notebook", "Deep breath", "Looking away"]
-        },
-        "tracking": {
-            "name": "Tracking / Movement Shot",
-            "description": "You walking through a hallway or into a room.",
-            "best_for": "Adding life, direction, and momentum",
-            "examples": ["Walking through office", "Entering room", "Moving through space"]
-        },
-        "angle_shot": {
-            "name": "Low Angle / High Angle",
-            "description": "Low = power and confidence. High = vulnerability or reflection.",
-            "best_for": "Setting tone and emotion",
-            "examples": ["Low: looking powerful", "High: looking vulnerable"]
-        },
-        "detail_macro": {
-            "name": "Detail / Macro",
-            "description": "Pen tip, hand on planner, morning coffee pour.",
-            "best_for": "Texture and rhythm in editing",
-            "examples": ["Pen writing", "Coffee pouring", "Page turning"]
-        }
-    }
+    # type -> description (packs/video_types.pack, packs/shot_types.pack), each parsed on first use
+    VIDEO_TYPES = pack_attribute("video_types")
+    SHOT_TYPES = pack_attribute("shot_types")
 
     @classmethod
     def get_all_video_types(cls) -> Dict:
         """Get all video types"""
-        return cls.VIDEO_TYPES
+        return dict(cls.VIDEO_TYPES)
 
     @classmethod
     def get_all_shot_types(cls) -> Dict:
         """Get all shot types"""
-        return cls.SHOT_TYPES
+        return dict(cls.SHOT_TYPES)
 
     @classmethod
     def get_video_type(cls, video_type: str) -> Dict:
@@ -767,9 +269,134 @@ class VideoShotLibrary:
         return video.get("suggested_shots", [])
 
 
+class TipStore:
+    """Curated tip bank with REAL insights (packs/tips.pack), each topic's tips parsed on first use"""
+
+    # topic -> curated tips (built-in and expertise banks, merged when the pack was built)
+    TIPS = pack_attribute("tips")
+    # Fallback patterns for topics without curated tips - still avoid platitudes
+    GENERIC_TIP_PATTERNS = pack_attribute("generic_tips", "patterns")
+
+    # topic -> its Tip records, filled as topics are first used
+    _records: Dict[str, tuple] = {}
+
+    @classmethod
+    def get_tips(cls, topic: str) -> tuple:
+        """Get the curated Tip records for a topic (empty tuple if none)"""
+        tips = cls._records.get(topic)
+        if tips is None:
+            if topic not in cls.TIPS:
+                return ()
+            tips = cls._records.setdefault(topic, tuple(Tip.from_dict(tip) for tip in cls.TIPS[topic]))
+        return tips
+
+    @classmethod
+    def has_topic(cls, topic: str) -> bool:
+        """Check whether a topic has curated tips"""
+        return topic in cls.TIPS
+
+    @classmethod
+    def get_topics(cls) -> List[str]:
+        """Get all topics with curated tips"""
+        return list(cls.TIPS)
+
+    @classmethod
+    def render_generic_tips(cls, topic: str) -> tuple:
+        """Every generic pattern filled in for a topic, in pattern order"""
+        clean_topic = topic.replace('_', ' ')
+        return tuple(
+            Tip(pattern["title"], pattern["explanation"].format(topic=clean_topic))
+            for pattern in cls.GENERIC_TIP_PATTERNS
+        )
+
+    @classmethod
+    def get_generic_tips(cls, topic: str, count: int, rng: random.Random = None) -> List[Tip]:
+        """Fill a random sample of the generic patterns for a topic"""
+        rendered = cls.render_generic_tips(topic)
+        # Sampling ids draws exactly what sampling the patterns themselves would
+        ids = (rng or random).sample(range(len(rendered)), min(count, len(rendered)))
+        return [rendered[i] for i in ids]
+
+    @staticmethod
+    def draw_many(size: int, count: int, keys: Sequence[int]) -> List[List[int]]:
+        """`count` distinct ids into a pool of `size` tips per key (_tip_key), for many reels in one call"""
+        # A partial Fisher-Yates shuffle whose j-th swap is picked by hashing (key, j): a key draws the
+        # same ids alone or in bulk, with or without NumPy, whatever the reel's RNG has drawn
+        count = min(count, size)
+        numpy = _load_numpy() if len(keys) >= NUMPY_MIN_DRAWS else False
+        if not numpy:
+            draws = []
+            for key in keys:
+                ids = list(range(size))
+                for j in range(count):
+                    pick = j + _mix64((key + (j + 1) * _GOLDEN64) & _MASK64) % (size - j)
+                    ids[j], ids[pick] = ids[pick], ids[j]
+                draws.append(ids[:count])
+            return draws
+
+        keys = numpy.array(keys, dtype=numpy.uint64)
+        rows = numpy.arange(len(keys))
+        ids = numpy.tile(numpy.arange(size, dtype=numpy.int64), (len(keys), 1))
+        for j in range(count):
+            value = keys + numpy.uint64(((j + 1) * _GOLDEN64) & _MASK64)
+            value = (value ^ (value >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+            value = (value ^ (value >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+            value ^= value >> numpy.uint64(31)
+            picks = j + (value % numpy.uint64(size - j)).astype(numpy.int64)
+            chosen = ids[rows, picks]
+            ids[rows, picks] = ids[rows, j]
+            ids[rows, j] = chosen
+        return ids[:, :count].tolist()
+
+
 class ContentGenerator:
     """Main content generator class with creative variety"""
 
+    # Topic -> actionable phrasings used by topic_to_action (also indexed as topic aliases)
+    ACTION_VARIATIONS = {
+        "dealing with negative people": [
+            "work with people you don't get along with",
+            "handle difficult personalities",
+            "maintain your energy around negativity",
+            "set boundaries with toxic people"
+        ],
+        "building confidence": [
+            "boost your confidence",
+            "develop unshakeable self-belief",
+            "build authentic confidence",
+            "trust yourself more"
+        ],
+        "overcoming self-doubt": [
+            "overcome self-doubt",
+            "silence your inner critic",
+            "move past uncertainty",
+            "trust your abilities"
+        ],
+        "setting boundaries": [
+            "set healthy boundaries",
+            "protect your energy",
+            "say no without guilt",
+            "establish clear limits"
+        ]
+    }
+
+    CUSTOM_HOOK_TEMPLATES = compile_templates([
+        "Let's talk about {topic}. Most people get this completely wrong.",
+        "Here's the thing about {topic} nobody wants to admit.",
+        "If you're struggling with {topic}, this might be why.",
+        "I've been thinking a lot about {topic} lately. Here's what I've realized.",
+        "The truth about {topic}? It's simpler than you think.",
+        "Real talk: {topic} doesn't have to be this hard.",
+        "Three years of working on {topic} taught me this.",
+        "Everyone's talking about {topic}. But are they getting it right?",
+        "Here's what changed my perspective on {topic}.",
+        "The biggest misconception about {topic}? Let me break it down."
+    ])
+    CUSTOM_HOOK_SLOTS = compile_slots({"topic": "{topic}"})
+    CUSTOM_HOOK_SPACE = TemplateSpace(CUSTOM_HOOK_TEMPLATES, CUSTOM_HOOK_SLOTS, {})
+    # Hook generation methods, in the order _generate_creative_hook draws them
+    HOOK_METHODS = ('hook_library', 'hook_point', 'custom')
+
     def __init__(self):
         self.style = StyleGuide()
         self.topics = self.load_topics()
@@ -777,49 +404,139 @@ class ContentGenerator:
         self.frameworks = MessagingFrameworks()
         self.hook_points = HookPoints()
         self.video_shot_library = VideoShotLibrary()
-        self.user_examples = self.load_user_examples()
+        # topic -> (user tips, merged tip pool); shared across calls and batch jobs
+        self._tip_pools = {}
+        self._topic_index = None
+        # Optional StageProfiler; None means generation isn't timed
+        self.profiler = None
+        self._data_version = None
+        self._examples_seen = None  # example store data the derived state above was built from
+        # Template/technique/framework/CTA weights (uniform unless configured, e.g. via CONTENT_WEIGHTS)
+        self.weights = WeightRegistry()
+        self._weights_version = self.weights.version
+        weights_path = os.environ.get("CONTENT_WEIGHTS")
+        if weights_path:
+            self.load_weights(weights_path)
+        # Speaking rate and target length that reel timestamps are computed from (CONTENT_WPM, CONTENT_REEL_SECONDS)
+        self.timeline = Timeline()
+        self._timeline_seen = self.timeline
+        self.example_store = ExampleStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'user_examples.json'),
+                                          reload_interval=EXAMPLES_RELOAD_INTERVAL)
+        self.load_user_examples()
+
+    @property
+    def data_version(self) -> str:
+        """Fingerprint of topics, user examples, sampling weights and timeline; changes whenever any is edited"""
+        if (self._data_version is None or self._weights_version != self.weights.version
+                or self._timeline_seen is not self.timeline):
+            self._weights_version = self.weights.version
+            self._timeline_seen = self.timeline
+            parts = [self.topics, self.user_examples]
+            fingerprint = self.weights.fingerprint()
+            if fingerprint:
+                parts.append(fingerprint)
+            if not self.timeline.is_default():
+                parts.append(self.timeline.to_dict())
+            payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+            self._data_version = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+        return self._data_version
+
+    def load_weights(self, path: str) -> bool:
+        """Load sampling weights from a JSON weights file (see weighted_sampler.py for the format)"""
+        try:
+            self.weights.load(path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Note: Could not load weights from {path}: {e}")
+            return False
+
+    def _content_changed(self) -> None:
+        """Drop state derived from topics/user examples after they change"""
+        self._tip_pools.clear()
+        self._topic_index = None
+        self._data_version = None
+
+    def enable_profiling(self, profiler: StageProfiler = None) -> StageProfiler:
+        """Start timing generation stages (into a new or given profiler)"""
+        self.profiler = profiler or StageProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Stop timing generation stages"""
+        self.profiler = None
+
+    @contextmanager
+    def profiling(self, profiler: StageProfiler = None) -> Iterator[StageProfiler]:
+        """Time generation stages inside a with-block, restoring the previous profiler afterwards"""
+        previous = self.profiler
+        try:
+            yield self.enable_profiling(profiler)
+        finally:
+            self.profiler = previous
+
+    @property
+    def topic_index(self) -> TopicIndex:
+        """Fuzzy index from topic names/aliases to tip banks, rebuilt after content changes"""
+        index = self._topic_index
+        if index is None:
+            # A prebuilt index (startup_snapshot.py) is used when it matches the current sources and data
+            snapshot = load_snapshot(self.data_version)
+            index = snapshot["topic_index"] if snapshot else self.build_topic_index()
+            self._topic_index = index
+        return index
+
+    def build_topic_index(self) -> TopicIndex:
+        """Build the fuzzy topic index from the current topics and user examples"""
+        user_tips = self.user_examples.get("tips", {})
+        banks = list(user_tips) + TipStore.get_topics()
+        aliases = {}
+        # topic_to_action phrasings point at their topic's bank
+        for topic, phrases in self.ACTION_VARIATIONS.items():
+            for phrase in phrases:
+                aliases[phrase] = topic if topic in banks else None
+        # Known topics without a bank still get entries so they don't fuzzy-match a neighbour
+        for topics in self.topics.values():
+            for topic in topics:
+                aliases.setdefault(topic, None)
+        for topic in self.user_examples.get("hooks", {}):
+            aliases.setdefault(topic, None)
+        return TopicIndex.build(banks, aliases)
+
+    def resolve_topic(self, topic: str) -> TopicMatch:
+        """Best-matching tip bank for a free-text topic (None when nothing is close enough)"""
+        match = self.topic_index.resolve(topic)
+        if match is None or match.topic is None:
+            return None
+        return match
+
+    @property
+    def user_examples(self) -> Dict:
+        """User's own content examples (current snapshot from the example store)"""
+        store = self.example_store
+        store.poll()
+        data = store.data
+        if data is not self._examples_seen:
+            # Swapped by a save or a hot reload: tip pools, topic index and data version are stale
+            self._examples_seen = data
+            self._content_changed()
+        return data
 
     def load_user_examples(self) -> Dict:
         """Load user's own content examples - PRIORITIZED over built-in content"""
-        import os
-        user_file = os.path.join(os.path.dirname(__file__), 'user_examples.json')
-
         try:
-            if os.path.exists(user_file):
-                with open(user_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            self.example_store.load()
         except Exception as e:
             print(f"Note: Could not load user examples: {e}")
 
-        # Return empty structure if file doesn't exist or has errors
-        return {
-            "tips": {},
-            "hooks": {},
-            "full_scripts": []
-        }
+        # The store keeps an empty structure if the file doesn't exist or has errors
+        self._content_changed()
+        return self.example_store.data
 
     def save_user_example(self, example_type: str, topic: str, content: Dict) -> bool:
-        """Save a new user example to the JSON file"""
-        import os
-        user_file = os.path.join(os.path.dirname(__file__), 'user_examples.json')
-
+        """Save a new user example (O(1) journal append, crash-safe)"""
         try:
-            # Add to current examples
-            if example_type == "tip":
-                if topic not in self.user_examples["tips"]:
-                    self.user_examples["tips"][topic] = []
-                self.user_examples["tips"][topic].append(content)
-            elif example_type == "hook":
-                if topic not in self.user_examples["hooks"]:
-                    self.user_examples["hooks"][topic] = []
-                self.user_examples["hooks"][topic].append(content)
-            elif example_type == "full_script":
-                self.user_examples["full_scripts"].append(content)
-
-            # Save to file
-            with open(user_file, 'w', encoding='utf-8') as f:
-                json.dump(self.user_examples, f, indent=2, ensure_ascii=False)
-
+            self.example_store.add(example_type, topic, content)
+            self._content_changed()
             return True
         except Exception as e:
             print(f"Error saving user example: {e}")
@@ -881,132 +598,212 @@ class ContentGenerator:
             ]
         }
 
-    def generate_instagram_reel(self, topic: str = None, num_tips: int = 3) -> Dict:
+    def generate_instagram_reel(self, topic: str = None, num_tips: int = 3, seed=None, rng: random.Random = None) -> Dict:
         """Generate Instagram Reel content with creative variety"""
-        if not topic:
-            category = random.choice(list(self.topics.keys()))
-            topic = random.choice(self.topics[category])
+        rng = make_rng(seed, rng)
+        if self.profiler is None:
+            return self._build_reel(topic, num_tips, rng, None).to_dict()
+        with self.profiler.request("reel") as timer:
+            reel = self._build_reel(topic, num_tips, rng, timer).to_dict()
+            # Tip scripts and the full script are formatted here, when the record is serialized
+            timer.lap("serialize")
+            return reel
+
+    def build_reel(self, topic: str = None, num_tips: int = 3, seed=None, rng: random.Random = None) -> Reel:
+        """Generate an Instagram Reel as a compact Reel record (serialized only when needed)"""
+        return self._timed_reel(topic, num_tips, make_rng(seed, rng))
+
+    def _timed_reel(self, topic: str, num_tips: int, rng: random.Random, tips: tuple = None) -> Reel:
+        """_build_reel under the profiler, if one is enabled"""
+        if self.profiler is None:
+            return self._build_reel(topic, num_tips, rng, None, tips)
+        with self.profiler.request("reel") as timer:
+            return self._build_reel(topic, num_tips, rng, timer, tips)
+
+    def iter_reels(self, count: int = 1, topic: str = None, num_tips: int = 3, category: str = None,
+                   seed=None, rng: random.Random = None) -> Iterator[Reel]:
+        """Yield `count` Reel records one at a time (for exports too large to hold in memory)"""
+        # Validated here rather than in the generator, so bad arguments fail before anything streams
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        if isinstance(num_tips, bool) or not isinstance(num_tips, int) or num_tips < 1:
+            raise ValueError("num_tips must be a positive integer")
+        if category is not None and category not in self.topics:
+            raise ValueError(f"Unknown category: {category}")
+        return self._iter_reels(count, topic, num_tips, category, make_rng(seed, rng))
+
+    def _iter_reels(self, count: int, topic: str, num_tips: int, category: str, batch_rng: random.Random) -> Iterator[Reel]:
+        """Reels seeded the way batch jobs are, so reel i matches job i of an equivalent batch"""
+        for start in range(0, count, TIP_DRAW_CHUNK):
+            seeds = [batch_rng.getrandbits(32) for _ in range(min(TIP_DRAW_CHUNK, count - start))]
+            rngs = [random.Random(seed) for seed in seeds]
+            reels = [
+                (topic or (rng.choice(self.topics[category]) if category else self._random_topic(rng)), num_tips, _tip_key(seed))
+                for rng, seed in zip(rngs, seeds)
+            ]
+            for rng, tips in zip(rngs, self._draw_reel_tips(reels)):
+                yield self._timed_reel(tips[0], num_tips, rng, tips)
+
+    def _random_topic(self, rng: random.Random) -> str:
+        """A topic from a random category"""
+        category = rng.choice(list(self.topics.keys()))
+        return rng.choice(self.topics[category])
+
+    def _draw_reel_tips(self, reels: List[tuple]) -> List[tuple]:
+        """(topic, selected tips, pool) for each (topic, num_tips, tip key) reel, one bulk draw per pool"""
+        groups = {}
+        for position, (topic, num_tips, _) in enumerate(reels):
+            groups.setdefault((topic, num_tips), []).append(position)
+        drawn = [None] * len(reels)
+        for (topic, num_tips), positions in groups.items():
+            pool = self._tip_draw_pool(topic, num_tips)
+            draws = TipStore.draw_many(len(pool), num_tips, [reels[position][2] for position in positions])
+            for position, ids in zip(positions, draws):
+                drawn[position] = (topic, [pool[i] for i in ids], pool)
+        return drawn
+
+    def _tip_draw_pool(self, topic: str, count: int) -> tuple:
+        """The pool a batch reel's tips are drawn from, by the priorities of _select_tips"""
+        user_tips, tip_pool, generic_pool = self._get_tip_pool(topic)
+        if user_tips and len(user_tips) >= count:
+            return user_tips
+        return tip_pool or generic_pool
+
+    def _build_reel(self, topic: str, num_tips: int, rng: random.Random, timer, tips: tuple = None) -> Reel:
+        """Assemble a reel stage by stage, lapping the profiler timer (if any) after each stage"""
+        # `tips` is the reel's (topic, selected tips, pool) from a bulk draw; without it tips come from `rng`
+        if tips is not None:
+            topic = tips[0]
+        elif not topic:
+            topic = self._random_topic(rng)
+            if timer is not None:
+                timer.lap("topic")
 
         # Generate hook using varied techniques
-        hook = self._generate_creative_hook(topic)
+        hook = self._generate_creative_hook(topic, rng)
+        if timer is not None:
+            timer.lap("hook")
 
-        # Generate tips with variety
-        tips = self.generate_tips(topic, num_tips)
+        # Generate tips with variety (fitted to the timeline once the other sections are known)
+        selected_tips, tip_candidates = tips[1:] if tips is not None else self._select_tips(topic, num_tips, rng)
+        if timer is not None:
+            timer.lap("tip_selection")
 
-        # Vary the transition
+        # Vary the transition ({count} becomes the number of tips that fit)
         transitions = [
-            f"[start B-roll] Whether in your personal life or professional journey [end B-roll] here are {num_tips} ways to {self.topic_to_action(topic)}.",
-            f"[start B-roll] Let me share {num_tips} strategies that actually work [end B-roll] for {topic}.",
-            f"Here are {num_tips} things that made all the difference for me with {topic}.",
-            f"[start B-roll] I've narrowed it down to {num_tips} key approaches [end B-roll] that really move the needle on {topic}.",
-            f"After years of working on this, here are the {num_tips} most important things about {topic}."
+            f"[start B-roll] Whether in your personal life or professional journey [end B-roll] here are {{count}} ways to {self.topic_to_action(topic, rng=rng)}.",
+            f"[start B-roll] Let me share {{count}} strategies that actually work [end B-roll] for {topic}.",
+            f"Here are {{count}} things that made all the difference for me with {topic}.",
+            f"[start B-roll] I've narrowed it down to {{count}} key approaches [end B-roll] that really move the needle on {topic}.",
+            f"After years of working on this, here are the {{count}} most important things about {topic}."
         ]
-
-        # Build the reel structure
-        reel = {
-            "content_type": "Instagram Reel",
-            "topic": topic,
-            "duration": "55-60 seconds",
-            "structure": {
-                "hook": {
-                    "timestamp": "0-3 seconds",
-                    "visual": "Talking Head",
-                    "script": hook
-                },
-                "intro": {
-                    "timestamp": "3-8 seconds",
-                    "visual": "Talking Head",
-                    "script": self.style.get_intro()
-                },
-                "transition": {
-                    "timestamp": "8-12 seconds",
-                    "visual": random.choice(["Talking Head → B-roll", "Talking Head with B-roll overlay"]),
-                    "script": random.choice(transitions)
-                },
-                "tips": tips,
-                "cta": {
-                    "timestamp": "55-60 seconds",
-                    "visual": "Talking Head",
-                    "script": self.style.get_cta()  # Use varied CTAs
-                }
-            }
-        }
-
-        # Generate full script
-        reel["full_script"] = self.compile_reel_script(reel)
-
-        return reel
-
-    def _generate_creative_hook(self, topic: str) -> str:
+        intro = self.style.get_intro(rng)
+        if timer is not None:
+            timer.lap("intro")
+        transition_visual = rng.choice(["Talking Head → B-roll", "Talking Head with B-roll overlay"])
+        transition = rng.choice(transitions)
+        if timer is not None:
+            timer.lap("transition")
+        cta = self.style.get_cta(rng=rng, weights=self.weights)  # Use varied CTAs
+        if timer is not None:
+            timer.lap("cta")
+
+        # Fit the tips into what's left of the target duration, then time every section by its length
+        timeline = self.timeline
+        # The transition's "{count}" is one word, like the number replacing it
+        fixed_seconds = timeline.seconds_each((hook, intro, transition, cta))
+        selected_tips, tip_seconds = timeline.fit_tips(
+            selected_tips[:num_tips], tip_candidates, timeline.tip_budget(fixed_seconds)
+        )
+        transition = transition.replace("{count}", str(len(selected_tips)))
+        bounds = timeline.place(fixed_seconds[:3] + tip_seconds + fixed_seconds[3:])
+        tips = [FormattedTip(i + 1, bounds[i + 3], bounds[i + 4], tip) for i, tip in enumerate(selected_tips)]
+        if timer is not None:
+            timer.lap("timeline")
+
+        # Build the reel structure (the full script is joined when the reel is serialized)
+        return Reel(
+            topic,
+            ReelSection(0, bounds[1], "Talking Head", hook),
+            ReelSection(bounds[1], bounds[2], "Talking Head", intro),
+            ReelSection(bounds[2], bounds[3], transition_visual, transition),
+            tips,
+            ReelSection(bounds[-2], bounds[-1], "Talking Head", cta)
+        )
+
+    def _generate_creative_hook(self, topic: str, rng: random.Random) -> str:
         """Generate a hook using varied techniques"""
 
         # PRIORITY 1: Check user's own hooks first (30% chance if available)
         user_hooks = self.user_examples.get("hooks", {}).get(topic, [])
-        if user_hooks and random.random() < 0.3:
+        if user_hooks and rng.random() < self.weights.probability("user_hook"):
             # Use user's proven hooks
-            return random.choice(user_hooks)["hook"]
+            return rng.choice(user_hooks)["hook"]
 
         # PRIORITY 2: Use generation methods
-        # Randomly choose between different hook generation methods
-        method = random.choice(['hook_library', 'hook_point', 'custom'])
+        # Choose between hook generation methods (uniform unless weights are configured)
+        weights = self.weights
+        method = weights.choice("hook_method", self.HOOK_METHODS, rng)
 
         if method == 'hook_library':
-            return self.hook_library.get_hook(topic)
+            return self.hook_library.get_hook(topic, rng=rng, weights=weights)
         elif method == 'hook_point':
-            technique = random.choice(list(self.hook_points.TECHNIQUES.keys()))
-            return self.hook_points.get_hook_point(technique, topic)
+            technique = weights.choice("hook_technique", self.hook_points.TECHNIQUE_NAMES, rng)
+            return self.hook_points.get_hook_point(technique, topic, rng=rng, weights=weights)
         else:
             # Custom hooks
-            return self._generate_custom_hook(topic)
+            return self._generate_custom_hook(topic, rng)
 
-    def _generate_custom_hook(self, topic: str) -> str:
+    def _generate_custom_hook(self, topic: str, rng: random.Random) -> str:
         """Generate custom hooks with variety"""
-        custom_hooks = [
-            f"Let's talk about {topic}. Most people get this completely wrong.",
-            f"Here's the thing about {topic} nobody wants to admit.",
-            f"If you're struggling with {topic}, this might be why.",
-            f"I've been thinking a lot about {topic} lately. Here's what I've realized.",
-            f"The truth about {topic}? It's simpler than you think.",
-            f"Real talk: {topic} doesn't have to be this hard.",
-            f"Three years of working on {topic} taught me this.",
-            f"Everyone's talking about {topic}. But are they getting it right?",
-            f"Here's what changed my perspective on {topic}.",
-            f"The biggest misconception about {topic}? Let me break it down."
-        ]
-        return random.choice(custom_hooks)
-
-    def topic_to_action(self, topic: str) -> str:
-        """Convert topic to actionable phrase with variations"""
-        action_variations = {
-            "dealing with negative people": [
-                "work with people you don't get along with",
-                "handle difficult personalities",
-                "maintain your energy around negativity",
-                "set boundaries with toxic people"
-            ],
-            "building confidence": [
-                "boost your confidence",
-                "develop unshakeable self-belief",
-                "build authentic confidence",
-                "trust yourself more"
-            ],
-            "overcoming self-doubt": [
-                "overcome self-doubt",
-                "silence your inner critic",
-                "move past uncertainty",
-                "trust your abilities"
-            ],
-            "setting boundaries": [
-                "set healthy boundaries",
-                "protect your energy",
-                "say no without guilt",
-                "establish clear limits"
-            ]
+        template = pick_template(self.CUSTOM_HOOK_TEMPLATES, rng, self.weights)
+        return template.render(self.CUSTOM_HOOK_SLOTS, topic)
+
+    def iter_unique_hooks(self, topic: str, seed=None, rng: random.Random = None, seen: set = None) -> Iterator[str]:
+        """Yield distinct hooks for a topic until the (method, template, slot choice) space runs out"""
+        rng = make_rng(seed, rng)
+        seen = set() if seen is None else seen
+        user_hooks = list(dict.fromkeys(example["hook"] for example in self.user_examples.get("hooks", {}).get(topic, [])))
+        # Same method mix as _generate_creative_hook, but each deck only hands out unused combinations
+        # (decks draw uniformly over what's left; only the user-hook odds follow the weights)
+        user_hook_probability = self.weights.probability("user_hook")
+        methods = DeckGroup([
+            self.hook_library.SPACE.deck(),
+            DeckGroup([space.deck() for space in self.hook_points.SPACES.values()]),
+            self.CUSTOM_HOOK_SPACE.deck(),
+        ])
+
+        while user_hooks or len(methods):
+            if user_hooks and (not len(methods) or rng.random() < user_hook_probability):
+                position = rng.randrange(len(user_hooks))
+                hook = user_hooks[position]
+                user_hooks[position] = user_hooks[-1]
+                user_hooks.pop()
+            else:
+                hook = methods.draw(topic, rng)
+            # Different combinations can still render the same text; those are skipped, not retried
+            if hook is not None and hook not in seen:
+                seen.add(hook)
+                yield hook
+
+    def get_hook_capacity(self, topic: str = None) -> Dict:
+        """How many distinct hooks each method can supply for a topic (an upper bound on unique hooks)"""
+        user_hooks = self.user_examples.get("hooks", {}).get(topic, []) if topic else []
+        capacity = {
+            "user_hooks": len({example["hook"] for example in user_hooks}),
+            "hook_library": self.hook_library.SPACE.capacity,
+            "hook_point": sum(space.capacity for space in self.hook_points.SPACES.values()),
+            "custom": self.CUSTOM_HOOK_SPACE.capacity,
         }
+        capacity["total"] = sum(capacity.values())
+        return capacity
 
+    def topic_to_action(self, topic: str, seed=None, rng: random.Random = None) -> str:
+        """Convert topic to actionable phrase with variations"""
+        rng = make_rng(seed, rng)
         # Check if we have specific variations for this topic
-        if topic in action_variations:
-            return random.choice(action_variations[topic])
+        if topic in self.ACTION_VARIATIONS:
+            return rng.choice(self.ACTION_VARIATIONS[topic])
         # Default variations
         default_actions = [
             f"improve your {topic}",
@@ -1015,364 +812,91 @@ class ContentGenerator:
             f"handle {topic} with confidence",
             f"transform your {topic}"
         ]
-        return random.choice(default_actions)
+        return rng.choice(default_actions)
 
-    def generate_hooks(self, topic: str, count: int = 3) -> List[str]:
+    def generate_hooks(self, topic: str, count: int = 3, seed=None, rng: random.Random = None) -> List[str]:
         """Generate varied attention-grabbing hooks"""
-        hooks = []
+        return list(self.iter_hooks(topic, count, seed, rng))
+
+    def iter_hooks(self, topic: str, count: int = 3, seed=None, rng: random.Random = None) -> Iterator[str]:
+        """Yield distinct attention-grabbing hooks one at a time (fewer if the topic runs out)"""
+        hooks = self.iter_unique_hooks(topic, seed, rng)
         for _ in range(count):
-            hooks.append(self._generate_creative_hook(topic))
-        return hooks
+            hook = next(hooks, None)
+            if hook is None:
+                return
+            yield hook
 
-    def generate_tips(self, topic: str, count: int = 3) -> List[Dict]:
+    def generate_tips(self, topic: str, count: int = 3, seed=None, rng: random.Random = None) -> List[Dict]:
         """Generate actionable tips with REAL insights from expertise"""
+        return [tip.to_dict() for tip in self._generate_tips(topic, count, make_rng(seed, rng))]
 
-        # PRIORITY 1: Check user's own examples first
-        user_tips = self.user_examples.get("tips", {}).get(topic, [])
-        if user_tips and len(user_tips) >= count:
-            # Use user's tips - they know their voice best
-            selected_tips = random.sample(user_tips, count)
-            return self._format_tips(selected_tips, count)
-
-        # PRIORITY 2: Built-in tip bank with REAL insights
-        tip_bank = {
-            "dealing with negative people": [
-                {
-                    "title": "limit your interaction",
-                    "explanation": "Do what you have to do and get the job done, but you don't necessarily need to give them access to your energy.",
-                    "b_roll": False
-                },
-                {
-                    "title": "try empathizing",
-                    "explanation": "[start B-roll] You don't have to like someone, but if you try to understand where they're coming from [end B-roll] you'd be surprised how a couple of genuine questions can transform a relationship.",
-                    "b_roll": True
-                },
-                {
-                    "title": "set clear boundaries",
-                    "explanation": "[start B-roll] Let them know what's acceptable and what's not, [end B-roll] then respect your own boundaries. If they want to live in negativity, that's their choice, but you don't have to join them.",
-                    "b_roll": True
-                },
-                {
-                    "title": "don't take it personally",
-                    "explanation": "Their negativity is about them, not you. [start B-roll] When you realize their behavior reflects their internal state, [end B-roll] it becomes easier to not absorb their energy.",
-                    "b_roll": True
-                },
-                {
-                    "title": "focus on solutions, not complaints",
-                    "explanation": "When they start complaining, redirect to problem-solving. [start B-roll] Ask 'what would help?' instead of engaging with the negativity. [end B-roll] It shifts the energy of the conversation.",
-                    "b_roll": True
-                },
-                {
-                    "title": "protect your peace",
-                    "explanation": "You can be professional, you can be kind, but [start B-roll] you don't owe anyone access to your peace of mind. [end B-roll] Guard it like the precious resource it is.",
-                    "b_roll": True
-                }
-            ],
-            "building confidence": [
-                {
-                    "title": "confidence comes from doing, not feeling",
-                    "explanation": "[start B-roll] You're not going to feel ready. Do it anyway. [end B-roll] Confidence is built through evidence, and evidence comes from action.",
-                    "b_roll": True
-                },
-                {
-                    "title": "track your wins, especially the small ones",
-                    "explanation": "Your brain forgets progress. [start B-roll] Write down what you accomplished, even the tiny stuff. [end B-roll] When doubt shows up, you've got receipts.",
-                    "b_roll": True
-                },
-                {
-                    "title": "stop waiting for external validation",
-                    "explanation": "[start B-roll] If you need everyone's approval, you'll never move. [end B-roll] Build internal confidence - know your worth independent of other people's opinions.",
-                    "b_roll": True
-                },
-                {
-                    "title": "competence builds confidence, not the other way around",
-                    "explanation": "Get good at something. [start B-roll] Real confidence comes from knowing you can deliver, not from affirmations. [end B-roll] Put in the reps.",
-                    "b_roll": True
-                },
-                {
-                    "title": "comparison will kill your confidence",
-                    "explanation": "[start B-roll] You're comparing your behind-the-scenes to everyone else's highlight reel. [end B-roll] Stay in your lane. Focus on your own growth.",
-                    "b_roll": True
-                },
-            ],
-            "overcoming self-doubt": [
-                {
-                    "title": "question the doubt",
-                    "explanation": "[start B-roll] Don't accept every thought as truth. [end B-roll] Ask yourself: is this doubt based on facts or fear?",
-                    "b_roll": True
-                },
-                {
-                    "title": "collect evidence of your capability",
-                    "explanation": "Keep a record of times you succeeded despite doubts. [start B-roll] When doubt shows up, review your track record. [end B-roll] Past success predicts future capability.",
-                    "b_roll": True
-                },
-                {
-                    "title": "separate feeling from fact",
-                    "explanation": "[start B-roll] Just because you feel incapable doesn't mean you are. [end B-roll] Feelings are temporary visitors, not permanent truth.",
-                    "b_roll": True
-                },
-                {
-                    "title": "expect doubt and move anyway",
-                    "explanation": "Doubt isn't a stop sign, it's scenery on the journey. [start B-roll] Successful people feel doubt too - they just don't let it make decisions. [end B-roll]",
-                    "b_roll": True
-                },
-                {
-                    "title": "focus on process, not perfection",
-                    "explanation": "[start B-roll] Self-doubt thrives on perfectionism. [end B-roll] Shift your focus to progress and learning. That's where real growth happens.",
-                    "b_roll": True
-                }
-            ],
-            "setting boundaries": [
-                {
-                    "title": "start with small boundaries",
-                    "explanation": "[start B-roll] You don't have to overhaul everything at once. [end B-roll] Practice saying no in low-stakes situations first. Build the muscle.",
-                    "b_roll": True
-                },
-                {
-                    "title": "communicate clearly, not harshly",
-                    "explanation": "Boundaries aren't about being mean, they're about being clear. [start B-roll] You can be kind and firm at the same time. [end B-roll]",
-                    "b_roll": True
-                },
-                {
-                    "title": "expect pushback",
-                    "explanation": "[start B-roll] When you start setting boundaries, people who benefited from you having none will resist. [end B-roll] That's not a sign you're wrong, it's confirmation you're doing it right.",
-                    "b_roll": True
-                },
-                {
-                    "title": "release guilt",
-                    "explanation": "Protecting your energy isn't selfish, it's self-respect. [start B-roll] You can't pour from an empty cup. [end B-roll] Your well-being matters.",
-                    "b_roll": True
-                },
-                {
-                    "title": "be consistent",
-                    "explanation": "[start B-roll] Boundaries only work if you maintain them. [end B-roll] Inconsistency teaches people your limits are negotiable. They're not.",
-                    "b_roll": True
-                }
-            ],
-            "leadership skills": [
-                {
-                    "title": "make the call, then explain",
-                    "explanation": "In high-stakes environments, indecision costs more than a wrong decision. [start B-roll] Make the call with the info you have, then bring people along. [end B-roll] You can course-correct, but you can't lead from confusion.",
-                    "b_roll": True
-                },
-                {
-                    "title": "your energy sets the tone",
-                    "explanation": "[start B-roll] If you're frantic, your team's frantic. If you're steady, they're steady. [end B-roll] You can't fake this - manage your state before you manage your team.",
-                    "b_roll": True
-                },
-                {
-                    "title": "build trust before you need it",
-                    "explanation": "When the pressure hits, it's too late to build relationships. [start B-roll] Invest in your people when things are calm [end B-roll] so they trust you when things get rough.",
-                    "b_roll": True
-                },
-                {
-                    "title": "say the hard thing early",
-                    "explanation": "[start B-roll] Address the issue when it's small, not when it's a crisis. [end B-roll] Real leaders don't avoid difficult conversations - they have them before they have to.",
-                    "b_roll": True
-                },
-                {
-                    "title": "develop your replacement",
-                    "explanation": "Your job isn't to be irreplaceable. [start B-roll] It's to build someone who can do your job so you can do the next one. [end B-roll] That's how you actually move up.",
-                    "b_roll": True
-                },
-            ],
-            "delegation skills": [
-                {
-                    "title": "match the task to the person's growth edge",
-                    "explanation": "Don't just delegate what you hate. [start B-roll] Match tasks to where someone's ready to stretch, not where they'll drown or coast. [end B-roll] That's how you build trust and capability at the same time.",
-                    "b_roll": True
-                },
-                {
-                    "title": "adjust your delivery to their personality",
-                    "explanation": "[start B-roll] Some people need context and the why. Others just want the what and when. [end B-roll] How you deliver the ask matters as much as what you're asking for.",
-                    "b_roll": True
-                },
-                {
-                    "title": "be clear about authority and expectations",
-                    "explanation": "Tell them exactly what decisions they can make without you. [start B-roll] Vague delegation creates confusion and kills momentum. [end B-roll] Clarity upfront saves everyone time later.",
-                    "b_roll": True
-                },
-                {
-                    "title": "follow up without micromanaging",
-                    "explanation": "[start B-roll] Check in at agreed milestones, not every five minutes. [end B-roll] You're building capability, not babysitting. Trust the process you set up.",
-                    "b_roll": True
-                },
-                {
-                    "title": "own the outcome, share the credit",
-                    "explanation": "When it goes well, shine the light on them. When it doesn't, that's on you as the leader. [start B-roll] That's how you build a team that runs through walls for you. [end B-roll]",
-                    "b_roll": True
-                },
-            ],
-            "time management": [
-                {
-                    "title": "protect your high-value hours",
-                    "explanation": "[start B-roll] Figure out when you do your best thinking. [end B-roll] Guard those hours for your most important work. Don't waste them on meetings that could be emails.",
-                    "b_roll": True
-                },
-                {
-                    "title": "time block, don't just to-do list",
-                    "explanation": "A to-do list tells you what. A time block tells you when. [start B-roll] If it's not on your calendar, it's not real. [end B-roll]",
-                    "b_roll": True
-                },
-                {
-                    "title": "batch similar tasks together",
-                    "explanation": "[start B-roll] Context switching kills productivity. [end B-roll] Group similar tasks - all your calls, all your deep work, all your admin. Your brain will thank you.",
-                    "b_roll": True
-                },
-                {
-                    "title": "build in buffer time",
-                    "explanation": "Back-to-back meetings all day is a setup for failure. [start B-roll] Leave 15 minutes between commitments. [end B-roll] You need space to think and transition.",
-                    "b_roll": True
-                },
-                {
-                    "title": "say no to protect your yes",
-                    "explanation": "[start B-roll] Every yes to something unimportant is a no to something that matters. [end B-roll] Be ruthless about what gets your time.",
-                    "b_roll": True
-                },
-            ],
-            "effective communication": [
-                {
-                    "title": "lead with the bottom line",
-                    "explanation": "Don't bury your point. [start B-roll] Start with what you need, then explain if needed. [end B-roll] Respect people's time - say it straight.",
-                    "b_roll": True
-                },
-                {
-                    "title": "match your communication to your audience",
-                    "explanation": "[start B-roll] Executives want the headline. Your team wants the context. [end B-roll] Same message, different delivery. Know who you're talking to.",
-                    "b_roll": True
-                },
-                {
-                    "title": "listen to understand, not to respond",
-                    "explanation": "If you're thinking about your response, you're not listening. [start B-roll] Hear them out fully before you speak. [end B-roll] Real communication is two-way.",
-                    "b_roll": True
-                },
-                {
-                    "title": "over-communicate in high-stakes situations",
-                    "explanation": "[start B-roll] When the stakes are high, assume nothing is understood. [end B-roll] Repeat key points. Confirm understanding. Clarity saves crises.",
-                    "b_roll": True
-                },
-                {
-                    "title": "own your mistakes immediately",
-                    "explanation": "If you mess up, say it fast. [start B-roll] Don't wait, don't spin, don't deflect. [end B-roll] Own it, fix it, move on. That's how you keep trust.",
-                    "b_roll": True
-                },
-            ],
-            "managing stress": [
-                {
-                    "title": "identify what you actually control",
-                    "explanation": "[start B-roll] Stress comes from trying to control what you can't. [end B-roll] Make a list - what can you influence, what can't you? Focus your energy accordingly.",
-                    "b_roll": True
-                },
-                {
-                    "title": "build buffers before you need them",
-                    "explanation": "In high-pressure jobs, you need margin built in. [start B-roll] Time buffers, energy buffers, financial buffers. [end B-roll] Stress hits hardest when you're running on empty.",
-                    "b_roll": True
-                },
-                {
-                    "title": "stress is information, not the enemy",
-                    "explanation": "[start B-roll] Your stress is telling you something. [end B-roll] Listen to it. What's actually overwhelming you? Don't just push through - address the root.",
-                    "b_roll": True
-                },
-                {
-                    "title": "protect your recovery time",
-                    "explanation": "You can sprint, but not forever. [start B-roll] Recovery isn't optional, it's strategic. [end B-roll] Guard your off time like it's part of the job - because it is.",
-                    "b_roll": True
-                },
-                {
-                    "title": "get real about what 'urgent' actually means",
-                    "explanation": "[start B-roll] Not everything that feels urgent is urgent. [end B-roll] Learn to tell the difference. Real urgency is rare - manufactured urgency is everywhere.",
-                    "b_roll": True
-                },
-            ],
-        }
-
-        # PRIORITY 3: Mix user tips with built-in tips if needed
-        all_available_tips = []
-
-        # Add user tips first (if any)
-        if user_tips:
-            all_available_tips.extend(user_tips)
-
-        # Add built-in tips
-        if topic in tip_bank:
-            all_available_tips.extend(tip_bank[topic])
-        else:
-            # Generate generic tips if no specific ones exist
-            all_available_tips.extend(self.generate_creative_generic_tips(topic, count))
-
-        # Select random mix
-        selected_tips = random.sample(all_available_tips, min(count, len(all_available_tips)))
-
+    def _generate_tips(self, topic: str, count: int, rng: random.Random) -> List[FormattedTip]:
+        """Select and format tips"""
+        selected_tips, _ = self._select_tips(topic, count, rng)
         return self._format_tips(selected_tips, count)
 
-    def _format_tips(self, tips: List[Dict], count: int) -> List[Dict]:
-        """Format tips with timestamps and visuals"""
-        formatted_tips = []
-        base_timestamp = 12
+    def _select_tips(self, topic: str, count: int, rng: random.Random) -> tuple:
+        """Pick tips for a topic: (selected tips, the pool they came from)"""
+        user_tips, tip_pool, generic_pool = self._get_tip_pool(topic)
 
-        for i, tip in enumerate(tips[:count]):
-            timestamp_start = base_timestamp + (i * 13)
-            timestamp_end = timestamp_start + 13
-            visual = "Talking Head with B-roll overlay" if tip.get("b_roll", False) else "Talking Head"
-
-            formatted_tips.append({
-                "number": i + 1,
-                "timestamp": f"{timestamp_start}-{timestamp_end} seconds",
-                "visual": visual,
-                "title": tip["title"],
-                "script": f"{i + 1}, {tip['title']}. {tip['explanation']}"
-            })
-
-        return formatted_tips
-
-    def generate_creative_generic_tips(self, topic: str, count: int) -> List[Dict]:
-        """Generate tips when we don't have topic-specific ones - still avoid platitudes"""
-        clean_topic = topic.replace('_', ' ')
-        tip_patterns = [
-            {
-                "title": f"start small, get specific",
-                "explanation": f"Don't try to fix everything at once with {clean_topic}. [start B-roll] Pick one thing, get good at it, then move to the next. [end B-roll] Specific beats vague every time.",
-                "b_roll": True
-            },
-            {
-                "title": f"find someone who's done it",
-                "explanation": f"[start B-roll] You don't have to figure out {clean_topic} from scratch. [end B-roll] Find people ahead of you and learn from what worked for them.",
-                "b_roll": True
-            },
-            {
-                "title": f"track what's actually working",
-                "explanation": f"You can't improve {clean_topic} if you're guessing. [start B-roll] Measure something - anything. [end B-roll] Data beats feelings when you're trying to get better.",
-                "b_roll": True
-            },
-            {
-                "title": f"get honest feedback",
-                "explanation": f"[start B-roll] Ask people who'll tell you the truth about your {clean_topic}. [end B-roll] Not people who'll make you feel good - people who'll make you better.",
-                "b_roll": True
-            },
-            {
-                "title": f"focus on what you control",
-                "explanation": f"A lot of {clean_topic} comes down to what's in your control vs what isn't. [start B-roll] Put your energy where you can actually make a difference. [end B-roll]",
-                "b_roll": True
-            },
-            {
-                "title": f"build systems, not just goals",
-                "explanation": f"[start B-roll] Goals tell you where you want to go. Systems get you there. [end B-roll] What's the repeatable process for improving your {clean_topic}?",
-                "b_roll": True
-            },
-            {
-                "title": f"expect it to be messy at first",
-                "explanation": f"Getting better at {clean_topic} isn't a straight line. [start B-roll] You're going to have setbacks. That's not failure, that's the process. [end B-roll]",
-                "b_roll": True
-            },
-            {
-                "title": f"protect your energy for what matters",
-                "explanation": f"[start B-roll] Not everything deserves your attention. [end B-roll] Be ruthless about where you invest your time and energy with {clean_topic}.",
-                "b_roll": True
-            },
+        # PRIORITY 1: Check user's own examples first
+        if user_tips and len(user_tips) >= count:
+            # Use user's tips - they know their voice best
+            return rng.sample(user_tips, count), user_tips
+
+        # PRIORITY 2: Built-in tip bank with REAL insights, mixed with user tips if needed
+        if tip_pool:
+            return rng.sample(tip_pool, min(count, len(tip_pool))), tip_pool
+
+        # PRIORITY 3: Generic tips if no specific ones exist, mixed with any user tips.
+        # Drawn as ids into the pool (user tips, then every generic pattern pre-rendered for the topic),
+        # making the same draws as sampling freshly built lists without building any.
+        user_count = len(user_tips)
+        generic_count = len(generic_pool) - user_count
+        generic_ids = rng.sample(range(generic_count), min(count, generic_count))
+        mixed_count = user_count + len(generic_ids)
+        picks = rng.sample(range(mixed_count), min(count, mixed_count))
+        selected_tips = [
+            generic_pool[pick] if pick < user_count else generic_pool[user_count + generic_ids[pick - user_count]]
+            for pick in picks
         ]
-
-        # Randomly select tips
-        return random.sample(tip_patterns, min(count, len(tip_patterns)))
+        return selected_tips, generic_pool
+
+    # Bound on cached tip pools; free-text topics would otherwise grow the cache forever
+    MAX_TIP_POOLS = 4096
+
+    def _get_tip_pool(self, topic: str) -> tuple:
+        """Get (user tips, user + built-in tips, user + generic tips) for a topic, built once and reused"""
+        pools = self._tip_pools.get(topic)
+        if pools is None:
+            user_bank = self.user_examples.get("tips", {})
+            bank = topic
+            if bank not in user_bank and not TipStore.has_topic(bank):
+                # Free-text topic: reuse the closest curated bank if there is a confident match
+                match = self.resolve_topic(topic)
+                if match is not None:
+                    bank = match.topic
+            user_tips = tuple(Tip.from_dict(tip) for tip in user_bank.get(bank, []))
+            builtin_tips = TipStore.get_tips(bank)
+            tip_pool = user_tips + builtin_tips if builtin_tips else ()
+            # Topics without curated tips fall back to the generic patterns, rendered once here
+            generic_pool = () if builtin_tips else user_tips + TipStore.render_generic_tips(topic)
+            pools = (user_tips, tip_pool, generic_pool)
+            if len(self._tip_pools) >= self.MAX_TIP_POOLS:
+                self._tip_pools.clear()
+            self._tip_pools[topic] = pools
+        return pools
+
+    def _format_tips(self, tips: List[Tip], count: int) -> List[FormattedTip]:
+        """Time tips back to back on their own timeline (visual and script are derived from the tip)"""
+        tips = tips[:count]
+        bounds = self.timeline.place([self.timeline.tip_seconds(tip) for tip in tips])
+        return [FormattedTip(i + 1, bounds[i], bounds[i + 1], tip) for i, tip in enumerate(tips)]
+
+    def generate_creative_generic_tips(self, topic: str, count: int, seed=None, rng: random.Random = None) -> List[Dict]:
+        """Generate tips when we don't have topic-specific ones - still avoid platitudes"""
+        return [tip.to_dict() for tip in TipStore.get_generic_tips(topic, count, make_rng(seed, rng))]
 
     def compile_reel_script(self, reel: Dict) -> str:
         """Compile the full script in order"""
@@ -1389,67 +913,289 @@ class ContentGenerator:
 
         return " ".join(script_parts)
 
-    def generate_content_hooks(self, category: str = None, count: int = 5) -> List[Dict]:
+    def generate_content_hooks(self, category: str = None, count: int = 5, seed=None, rng: random.Random = None) -> List[Dict]:
         """Generate hook ideas with massive variety"""
+        return [hook.to_dict() for hook in self.iter_content_hooks(category, count, seed, rng)]
+
+    def iter_content_hooks(self, category: str = None, count: int = 5, seed=None, rng: random.Random = None) -> Iterator[Hook]:
+        """Yield Hook records one at a time, so large requests run in constant memory"""
+        rng = make_rng(seed, rng)
         if not category:
-            category = random.choice(list(self.topics.keys()))
+            category = rng.choice(list(self.topics.keys()))
 
-        hooks = []
-        topics = self.topics.get(category, self.topics["personal_growth"])
+        topics = list(self.topics.get(category, self.topics["personal_growth"]))
 
+        # One duplicate-free hook stream per topic, sharing a seen set across the whole request
+        seen = set()
+        streams = {}
         for i in range(count):
-            topic = random.choice(topics)
-            # Use creative hook generation
-            hook = self._generate_creative_hook(topic)
-            hooks.append({
-                "number": i + 1,
+            hook = None
+            while hook is None and topics:
+                topic = rng.choice(topics)
+                stream = streams.get(topic)
+                if stream is None:
+                    stream = streams[topic] = self.iter_unique_hooks(topic, rng=rng, seen=seen)
+                hook = next(stream, None)
+                if hook is None:
+                    topics.remove(topic)
+            if hook is None:
+                return
+            yield Hook(i + 1, category, topic, hook, rng.choice([
+                "Instagram Reel, TikTok, YouTube Short",
+                "Instagram Story, Facebook Story",
+                "LinkedIn Post, Tweet Thread",
+                "YouTube Intro, Podcast Opening",
+                "Blog Post Opening, Email Newsletter"
+            ]))
+
+    BATCH_CONTENT_TYPES = ("reel", "hooks", "quick_idea")
+
+    def generate_batch(self, jobs: List, seed=None, rng: random.Random = None) -> List[Dict]:
+        """Generate many pieces of content in one call, sharing precomputed state across jobs"""
+        # Jobs are {content_type, topic, num_tips} dicts or [content_type, topic, num_tips] lists.
+        # A bad job reports its error without stopping the rest of the batch.
+        # Reel and hook results are records; serialize with records.to_json / json_default.
+        return list(self.iter_batch(jobs, seed, rng))
+
+    def iter_batch(self, jobs: List, seed=None, rng: random.Random = None) -> Iterator[Dict]:
+        """Yield batch job results one at a time as each job finishes"""
+        items = list(zip(range(len(jobs)), jobs, self.assign_batch_seeds(jobs, seed, rng)))
+        for start in range(0, len(items), TIP_DRAW_CHUNK):
+            yield from self._iter_batch_items(items[start:start + TIP_DRAW_CHUNK])
+
+    def assign_batch_seeds(self, jobs: List, seed=None, rng: random.Random = None) -> List:
+        """Pick every job's seed up front, so jobs can run in any order or process and still replay alone"""
+        batch_rng = make_rng(seed, rng)
+        job_seeds = []
+        for job in jobs:
+            # Explicit job seeds still advance the batch RNG, keeping later jobs' seeds stable
+            job_seed = batch_rng.getrandbits(32)
+            if isinstance(job, dict) and job.get("seed") is not None:
+                job_seed = job["seed"]
+            job_seeds.append(job_seed)
+        return job_seeds
+
+    def run_batch_item(self, index: int, job, job_seed) -> Dict:
+        """Run one batch job with its seed, reporting a bad job instead of raising"""
+        return self.run_batch_items([(index, job, job_seed)])[0]
+
+    def run_batch_items(self, items: List[tuple]) -> List[Dict]:
+        """run_batch_item for each (index, job, job_seed), drawing all their reels' tips in bulk"""
+        return list(self._iter_batch_items(items))
+
+    def _iter_batch_items(self, items: List[tuple]) -> Iterator[Dict]:
+        """Yield run_batch_item results for the items after one bulk draw of every reel job's tips"""
+        prepared, reels = [], {}
+        for position, (index, job, job_seed) in enumerate(items):
+            try:
+                content_type, topic, num_tips = self._normalize_batch_job(job)
+                rng = random.Random(job_seed)
+            except (TypeError, ValueError) as e:
+                prepared.append(e)
+                continue
+            if content_type == "reel":
+                reels[position] = (topic or self._random_topic(rng), num_tips, _tip_key(job_seed))
+            prepared.append((content_type, topic, num_tips, rng))
+        drawn = dict(zip(reels, self._draw_reel_tips(list(reels.values()))))
+
+        for position, (index, job, job_seed) in enumerate(items):
+            try:
+                if isinstance(prepared[position], Exception):
+                    raise prepared[position]
+                content_type, topic, num_tips, rng = prepared[position]
+                result = {
+                    "index": index,
+                    "success": True,
+                    "content_type": content_type,
+                    "topic": topic,
+                    "seed": job_seed,
+                    "result": self._run_batch_job(content_type, topic, num_tips, job, rng, drawn.get(position))
+                }
+            except (TypeError, ValueError) as e:
+                result = {
+                    "index": index,
+                    "success": False,
+                    "error": str(e)
+                }
+            yield result
+
+    def _normalize_batch_job(self, job) -> tuple:
+        """Validate a batch job and return (content_type, topic, num_tips)"""
+        if isinstance(job, dict):
+            content_type = job.get("content_type", "reel")
+            topic = job.get("topic")
+            num_tips = job.get("num_tips", 3)
+        elif isinstance(job, (list, tuple)) and 1 <= len(job) <= 3:
+            content_type, topic, num_tips = (list(job) + [None, 3])[:3]
+        else:
+            raise ValueError("Each job must be an object or a [content_type, topic, num_tips] list")
+
+        if content_type not in self.BATCH_CONTENT_TYPES:
+            raise ValueError(f"Invalid content type: {content_type}")
+        if topic is not None and not isinstance(topic, str):
+            raise ValueError("topic must be a string")
+        if isinstance(num_tips, bool) or not isinstance(num_tips, int) or num_tips < 1:
+            raise ValueError("num_tips must be a positive integer")
+
+        topic = topic.strip() if topic else None
+        if content_type == "quick_idea" and not topic:
+            raise ValueError("quick_idea jobs need a topic")
+        return content_type, topic, num_tips
+
+    def _run_batch_job(self, content_type: str, topic: str, num_tips: int, job, rng: random.Random, tips: tuple = None):
+        """Run one normalized batch job (reels and hooks stay records until serialized; `tips`: a reel's bulk draw)"""
+        if content_type == "reel":
+            return self._timed_reel(topic, num_tips, rng, tips)
+        if content_type == "hooks" and not topic:
+            category = job.get("category") if isinstance(job, dict) else None
+            return {"hooks": list(self.iter_content_hooks(category, num_tips, rng=rng))}
+        return self.generate_custom_content(topic, content_type, num_tips, rng=rng)
+
+    def generate_calendar(self, days: int, per_day: int = 1, categories: List[str] = None, workers: int = 1,
+                          seed=None, content_types: List[str] = ("reel",), num_tips: int = 3,
+                          start_date: str = None, progress: Callable[[int, int], None] = None) -> Dict:
+        """Generate a content calendar, fanning items out across a process pool"""
+        categories = list(categories or self.topics.keys())
+        unknown = [category for category in categories if category not in self.topics]
+        if unknown:
+            raise ValueError(f"Unknown categories: {', '.join(unknown)}")
+        invalid = [content_type for content_type in content_types if content_type not in self.BATCH_CONTENT_TYPES]
+        if invalid or not content_types:
+            raise ValueError(f"Invalid content types: {', '.join(invalid) or 'none given'}")
+        if days < 1 or per_day < 1:
+            raise ValueError("days and per_day must be positive")
+        if seed is None:
+            seed = make_rng().getrandbits(32)
+        start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+
+        # Every item is seeded from (seed, day, slot), so results don't depend on workers or chunking
+        plan = []
+        for day in range(days):
+            for slot in range(per_day):
+                position = day * per_day + slot
+                plan.append((
+                    day, slot,
+                    categories[position % len(categories)],
+                    content_types[slot % len(content_types)],
+                    f"{seed}:{day}:{slot}",
+                ))
+
+        items = [None] * len(plan)
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for start_index in range(0, len(plan), TIP_DRAW_CHUNK):
+                chunk = plan[start_index:start_index + TIP_DRAW_CHUNK]
+                for index, item in enumerate(self._iter_calendar_items(chunk, num_tips), start_index):
+                    items[index] = item
+                    if progress:
+                        progress(index + 1, len(plan))
+        else:
+            # Small chunks keep workers evenly loaded and progress updates frequent
+            chunk_size = max(1, min(500, len(plan) // (workers * 8)))
+            chunks = [(start_index, plan[start_index:start_index + chunk_size])
+                      for start_index in range(0, len(plan), chunk_size)]
+            done = 0
+            # Imported here: multiprocessing adds noticeably to serverless cold starts
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_calendar_worker,
+                                     initargs=(self.topics, self.user_examples, self.weights.to_dict(),
+                                               self.timeline.to_dict())) as pool:
+                futures = {pool.submit(_run_calendar_chunk, chunk, num_tips): start_index
+                           for start_index, chunk in chunks}
+                for future in as_completed(futures):
+                    results = future.result()
+                    items[futures[future]:futures[future] + len(results)] = results
+                    done += len(results)
+                    if progress:
+                        progress(done, len(plan))
+
+        if start:
+            for item in items:
+                item["date"] = (start + timedelta(days=item["day"] - 1)).strftime("%Y-%m-%d")
+
+        return {
+            "seed": seed,
+            "days": days,
+            "per_day": per_day,
+            "categories": categories,
+            "content_types": list(content_types),
+            "count": len(items),
+            "items": items
+        }
+
+    def _iter_calendar_items(self, plan: List[tuple], num_tips: int) -> Iterator[Dict]:
+        """Generate planned calendar slots, each from its own seed, after one bulk draw of every reel's tips"""
+        rngs = [random.Random(item_seed) for *_, item_seed in plan]
+        topics = [rng.choice(self.topics[planned[2]]) for rng, planned in zip(rngs, plan)]
+        reels = {
+            position: (topics[position], num_tips, _tip_key(planned[4]))
+            for position, planned in enumerate(plan) if planned[3] == "reel"
+        }
+        drawn = dict(zip(reels, self._draw_reel_tips(list(reels.values()))))
+
+        for position, (day, slot, category, content_type, item_seed) in enumerate(plan):
+            topic = topics[position]
+            yield {
+                "day": day + 1,
+                "slot": slot + 1,
                 "category": category,
+                "content_type": content_type,
                 "topic": topic,
-                "hook": hook,
-                "use_case": random.choice([
-                    "Instagram Reel, TikTok, YouTube Short",
-                    "Instagram Story, Facebook Story",
-                    "LinkedIn Post, Tweet Thread",
-                    "YouTube Intro, Podcast Opening",
-                    "Blog Post Opening, Email Newsletter"
-                ])
-            })
+                "seed": item_seed,
+                "result": self._run_batch_job(content_type, topic, num_tips, {}, rngs[position], drawn.get(position))
+            }
 
-        return hooks
+    def get_template_coverage(self) -> Dict:
+        """Report which hook templates are fillable and which were quarantined at load time"""
+        hook_points = self.hook_points.coverage_report()
+        quarantined = len(self.hook_library.COVERAGE.quarantined) + sum(
+            len(coverage["quarantined_templates"]) for coverage in hook_points.values()
+        )
+        return {
+            "quarantined_total": quarantined,
+            "unique_hook_capacity": self.get_hook_capacity(),
+            "hook_library": self.hook_library.coverage_report(),
+            "hook_points": hook_points
+        }
 
-    def generate_content_framework(self, framework_type: str = None) -> Dict:
+    def generate_content_framework(self, framework_type: str = None, seed=None, rng: random.Random = None) -> Dict:
         """Generate content using messaging frameworks with variety"""
+        rng = make_rng(seed, rng)
         if not framework_type:
             # Randomly select a framework
-            return self.frameworks.get_random_framework()
+            return self.frameworks.get_random_framework(rng, self.weights)
 
         # Try to get specific framework, fall back to random
-        framework = self.frameworks.get_framework(framework_type)
+        framework = self.frameworks.get_framework(framework_type, rng, self.weights)
         if not framework:
-            framework = self.frameworks.get_random_framework()
+            framework = self.frameworks.get_random_framework(rng, self.weights)
 
         return framework
 
-    def generate_custom_content(self, user_topic: str, content_type: str = "reel", num_tips: int = 3) -> Dict:
+    def generate_custom_content(self, user_topic: str, content_type: str = "reel", num_tips: int = 3,
+                                seed=None, rng: random.Random = None) -> Dict:
         """Generate content based on user's custom topic/idea with creativity"""
+        rng = make_rng(seed, rng)
         # Clean up the topic
         topic = user_topic.strip().lower()
 
         if content_type == "reel":
             # Generate a reel with the custom topic
-            reel = self.generate_instagram_reel(topic, num_tips)
+            reel = self.generate_instagram_reel(topic, num_tips, rng=rng)
             reel["custom_topic"] = True
             reel["original_input"] = user_topic
+            match = self.resolve_topic(topic)
+            reel["resolved_topic"] = match.topic if match else None
             return reel
         elif content_type == "hooks":
             # Generate hooks for the custom topic
-            hooks = self.generate_hooks(topic, num_tips)
+            hooks = self.generate_hooks(topic, num_tips, rng=rng)
             return {
                 "custom_topic": True,
                 "original_input": user_topic,
                 "topic": topic,
                 "hooks": hooks,
-                "use_case": random.choice([
+                "use_case": rng.choice([
                     "Instagram Reel, TikTok, YouTube Short",
                     "LinkedIn Post, Twitter Thread",
                     "Blog Post, Email Newsletter",
@@ -1458,14 +1204,14 @@ class ContentGenerator:
             }
         elif content_type == "quick_idea":
             # Generate a quick content idea
-            hook = self._generate_creative_hook(topic)
-            framework = self.generate_content_framework()
+            hook = self._generate_creative_hook(topic, rng)
+            framework = self.generate_content_framework(rng=rng)
             return {
                 "custom_topic": True,
                 "original_input": user_topic,
                 "topic": topic,
                 "hook": hook,
-                "format": random.choice([
+                "format": rng.choice([
                     "60-second reel or short-form video",
                     "Instagram carousel post (5-7 slides)",
                     "Twitter/LinkedIn thread (8-10 tweets)",
@@ -1489,4 +1235,27 @@ class ContentGenerator:
             if clean_topic and clean_topic not in self.topics[category]:
                 self.topics[category].append(clean_topic)
 
+        self._content_changed()
         return True
+
+
+# Per-process generator for calendar pool workers
+_calendar_generator = None
+
+
+def _init_calendar_worker(topics: Dict, user_examples: Dict, weights: Dict, timeline: Dict) -> None:
+    """Build a worker's generator with the parent's topics, user examples, weights and timeline"""
+    global _calendar_generator
+    _calendar_generator = ContentGenerator()
+    _calendar_generator.topics = topics
+    _calendar_generator.weights.update(weights, replace=True)
+    _calendar_generator.timeline = Timeline(**timeline)
+    # Pinned to the parent's examples for the whole run, so every item sees the same data
+    _calendar_generator.example_store.reload_interval = None
+    _calendar_generator.example_store.data = user_examples
+    _calendar_generator._content_changed()
+
+
+def _run_calendar_chunk(chunk: List[tuple], num_tips: int) -> List[Dict]:
+    """Generate a contiguous run of planned calendar items in a pool worker"""
+    return list(_calendar_generator._iter_calendar_items(chunk, num_tips))
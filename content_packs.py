@@ -0,0 +1,230 @@
+"""
+Versioned on-disk content packs.
+The content libraries (hook templates and slots, messaging frameworks, Hook
+Point techniques, video and shot types, tips) ship as pack files in packs/
+instead of Python literals, so importing the generator costs the same however
+large they grow. A pack is UTF-8 text: one header line (layout format, content
+version, digest and an offset index of the entries), then one compact JSON
+`[key, value]` line per entry. A pack is memory-mapped on first use and each
+entry is parsed only when it is read, so a worker that only serves hooks never
+parses a tip.
+
+Edit entry lines in place and re-index (a pack whose index no longer matches
+its entries is re-scanned on load, with a note), or round-trip a pack through
+plain JSON:
+    python3 content_packs.py reindex [pack ...]
+    python3 content_packs.py export tips > tips.json
+    python3 content_packs.py import tips tips.json
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACK_DIR = os.environ.get("CONTENT_PACK_DIR", os.path.join(ROOT, "packs"))
+PACK_EXTENSION = ".pack"
+# Layout of pack files; a reader refuses any other
+PACK_FORMAT = 1
+
+_packs = {}
+# Reentrant: lazy attributes are often built from other lazy attributes
+_lock = threading.RLock()
+
+
+class ContentPack(Mapping):
+    """Read-only mapping over one memory-mapped pack file; entries are parsed on first access and kept"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = json.loads(self._map.readline())
+        if header.get("format") != PACK_FORMAT:
+            raise ValueError(f"{path}: unsupported pack format {header.get('format')!r} (expected {PACK_FORMAT})")
+        self.name = header["name"]
+        self.version = header["version"]
+        self.digest = header["digest"]
+        self._body = self._map.tell()
+        index = header["index"]
+        if header["size"] != len(self._map) - self._body:
+            print(f"Note: Re-scanning {path}, its entries changed since it was indexed "
+                  f"(run python3 content_packs.py reindex {self.name})")
+            index = scan_entries(self._map, self._body)
+            self.digest = body_digest(self._map[self._body:])
+        # key -> (offset, length, record count), in pack order
+        self._index = {key: (offset, length, count) for key, offset, length, count in index}
+        self._entries = {}
+
+    def __getitem__(self, key: str):
+        try:
+            return self._entries[key]
+        except KeyError:
+            pass
+        offset, length, _ = self._index[key]
+        start = self._body + offset
+        entry_key, value = json.loads(self._map[start:start + length])
+        if entry_key != key:
+            raise ValueError(f"{self.path}: index is out of date (run python3 content_packs.py reindex {self.name})")
+        return self._entries.setdefault(key, value)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def count(self, key: str) -> int:
+        """Records in an entry (its length when it's a list, else 1) without parsing it"""
+        return self._index[key][2]
+
+    def parsed(self) -> int:
+        """How many entries have been parsed so far"""
+        return len(self._entries)
+
+
+def pack_path(name: str) -> str:
+    return os.path.join(PACK_DIR, name + PACK_EXTENSION)
+
+
+def load_pack(name: str) -> ContentPack:
+    """The pack of that name from PACK_DIR, opened once per process"""
+    pack = _packs.get(name)
+    if pack is None:
+        with _lock:
+            pack = _packs.get(name)
+            if pack is None:
+                pack = _packs[name] = ContentPack(pack_path(name))
+    return pack
+
+
+class LazyAttribute:
+    """Class attribute built by `build(cls)` on first access, then stored on the class in its place"""
+
+    def __init__(self, build: Callable):
+        self.build = build
+
+    def __set_name__(self, owner, name):
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance, owner=None):
+        with _lock:
+            value = self.owner.__dict__[self.name]
+            if value is self:
+                value = self.build(self.owner)
+                setattr(self.owner, self.name, value)
+        return value
+
+
+def pack_attribute(name: str, key: str = None) -> LazyAttribute:
+    """Lazy class attribute holding a whole pack, or one entry of it"""
+    if key is None:
+        return LazyAttribute(lambda cls: load_pack(name))
+    return LazyAttribute(lambda cls: load_pack(name)[key])
+
+
+def record_count(value) -> int:
+    return len(value) if isinstance(value, list) else 1
+
+
+def body_digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def scan_entries(data, start: int = 0) -> List[list]:
+    """Index [key, offset, length, count] of every entry line from `start` (offsets relative to it)"""
+    index = []
+    offset, end = start, len(data)
+    while offset < end:
+        stop = data.find(b"\n", offset)
+        if stop < 0:
+            stop = end
+        line = data[offset:stop]
+        if line.strip():
+            key, value = json.loads(line)
+            index.append([key, offset - start, stop - offset, record_count(value)])
+        offset = stop + 1
+    return index
+
+
+def read_entries(path: str) -> Iterator[Tuple[str, object]]:
+    """Every (key, value) in a pack file, in order, whatever the state of its index"""
+    with open(path, "rb") as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                key, value = json.loads(line)
+                yield key, value
+
+
+def write_pack(name: str, entries: Iterable[Tuple[str, object]], path: str = None) -> str:
+    """Write a pack atomically; the content version goes up by one whenever the entries change"""
+    path = path or pack_path(name)
+    lines, index, offset = [], [], 0
+    for key, value in entries:
+        line = json.dumps([key, value], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index.append([key, offset, len(line), record_count(value)])
+        lines.append(line)
+        offset += len(line) + 1
+    body = b"".join(line + b"\n" for line in lines)
+    digest = body_digest(body)
+
+    version = 1
+    try:
+        with open(path, "rb") as f:
+            previous = json.loads(f.readline())
+        version = previous["version"] + (previous["digest"] != digest)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    header = {"format": PACK_FORMAT, "name": name, "version": version, "digest": digest,
+              "size": len(body), "index": index}
+    temp_path = f"{path}.tmp-{os.getpid()}"
+    with open(temp_path, "wb") as f:
+        f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+        f.write(body)
+    os.replace(temp_path, path)
+    return path
+
+
+def pack_names() -> List[str]:
+    """Names of the packs in PACK_DIR"""
+    return sorted(entry[:-len(PACK_EXTENSION)] for entry in os.listdir(PACK_DIR) if entry.endswith(PACK_EXTENSION))
+
+
+def main(argv: List[str]) -> int:
+    usage = "usage: content_packs.py reindex [pack ...] | export <pack> | import <pack> <file.json>"
+    if not argv or argv[0] not in ("reindex", "export", "import"):
+        print(usage, file=sys.stderr)
+        return 2
+    command, names = argv[0], argv[1:]
+
+    if command == "reindex":
+        for name in names or pack_names():
+            path = write_pack(name, list(read_entries(pack_path(name))))
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+            print(f"{path}: {len(header['index'])} entries, version {header['version']}")
+    elif command == "export" and len(names) == 1:
+        json.dump(dict(read_entries(pack_path(names[0]))), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    elif command == "import" and len(names) == 2:
+        with open(names[1], encoding="utf-8") as f:
+            entries: Dict = json.load(f)
+        print(f"Wrote {write_pack(names[0], entries.items())} ({len(entries)} entries)")
+    else:
+        print(usage, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,300 @@
+"""
+Crash-safe storage for user examples.
+user_examples.json stays the hand-editable snapshot. New examples are appended
+to a journal next to it (one JSON record per line, fsync'd), so an add is O(1)
+and a crash mid-write can only lose the record being written. The journal is
+replayed on load and periodically folded into the snapshot with an atomic rename.
+Changes made by hand or by other worker processes are noticed by a cheap
+inode/mtime/size check of both files, run at most every `reload_interval`
+seconds; the new data is parsed on a background thread and swapped in whole,
+so readers never block and never see a half-loaded structure.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+from typing import Dict
+
+try:
+    import fcntl  # POSIX only; guards the files against other worker processes
+except ImportError:
+    fcntl = None
+
+# Example type -> key in the stored structure
+EXAMPLE_SECTIONS = {"tip": "tips", "hook": "hooks", "full_script": "full_scripts"}
+
+
+def empty_examples() -> Dict:
+    """Empty user examples structure"""
+    return {"tips": {}, "hooks": {}, "full_scripts": []}
+
+
+class ExampleStore:
+    """User examples as a JSON snapshot plus an append-only journal"""
+
+    def __init__(self, path: str, journal_path: str = None, compact_every: int = 200,
+                 reload_interval: float = None):
+        self.path = path
+        self.journal_path = journal_path or os.path.splitext(path)[0] + ".journal"
+        self.compact_every = compact_every
+        # Seconds between checks for outside changes (None or 0 disables hot reload)
+        self.reload_interval = reload_interval
+        self.data = empty_examples()
+        self._journal_entries = 0
+        self._lock = threading.RLock()
+        self._signature = None  # file signature self.data was loaded from / last written as
+        self._next_check = 0.0
+        self._reloading = False
+
+    def _file_lock(self, mode):
+        """Advisory lock shared by every process using this store (no-op without fcntl)"""
+        return _FileLock(self.path + ".lock", mode)
+
+    def load(self) -> Dict:
+        """Load the snapshot and replay the journal on top of it"""
+        with self._lock, self._file_lock("shared"):
+            return self._load_locked()
+
+    def _load_locked(self) -> Dict:
+        """Read both files and swap in the result (caller holds the locks)"""
+        # Taken before reading: an edit racing with the read just triggers another reload
+        signature = self._file_signature()
+        data, digest = self._read_snapshot()
+        records, base = self._read_journal()
+
+        # A journal whose base doesn't match the snapshot was already folded in by an
+        # interrupted compaction (or the snapshot was edited by hand): replay idempotently
+        exact = base == digest
+        for record in records:
+            _apply(data, record, skip_existing=not exact)
+
+        self.data = data
+        self._journal_entries = len(records)
+        self._signature = signature
+        return data
+
+    def _file_signature(self) -> tuple:
+        """(inode, mtime, size) of the snapshot and the journal; changes with any write or replace"""
+        signature = []
+        for path in (self.path, self.journal_path):
+            try:
+                info = os.stat(path)
+                signature.append((info.st_ino, info.st_mtime_ns, info.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def changed_on_disk(self) -> bool:
+        """Whether either file changed since this store last loaded or wrote it"""
+        return self._file_signature() != self._signature
+
+    def poll(self) -> None:
+        """Reload in the background if the files changed (checked at most every reload_interval seconds)"""
+        if not self.reload_interval:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        if self._reloading or not self.changed_on_disk():
+            return
+        self._reloading = True
+        threading.Thread(target=self._background_reload, name="example-store-reload", daemon=True).start()
+
+    def _background_reload(self) -> None:
+        """Parse the changed files off the request path; readers keep the old data until the swap"""
+        try:
+            self.load()
+        except Exception as e:
+            # Keep serving the last good data (e.g. while a hand edit is half-saved)
+            print(f"Note: Could not reload user examples: {e}")
+        finally:
+            self._reloading = False
+
+    def _read_snapshot(self) -> tuple:
+        """Read user_examples.json, returning (data, digest of its bytes)"""
+        if not os.path.exists(self.path):
+            return empty_examples(), None
+
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw.decode("utf-8"))
+        for section, default in empty_examples().items():
+            data.setdefault(section, default)
+        return data, hashlib.sha256(raw).hexdigest()
+
+    def _read_journal(self) -> tuple:
+        """Read journal records, returning (records, snapshot digest they apply to)"""
+        if not os.path.exists(self.journal_path):
+            return [], None
+
+        records, base = [], None
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-append; everything before it is intact
+                    print(f"Note: Skipping unreadable journal line {line_number} in {self.journal_path}")
+                    continue
+                if "base" in record:
+                    base = record["base"]
+                else:
+                    records.append(record)
+        return records, base
+
+    def add(self, example_type: str, topic: str, content) -> Dict:
+        """Durably append one example, then apply it in memory"""
+        if example_type not in EXAMPLE_SECTIONS:
+            raise ValueError(f"Invalid example type: {example_type}")
+
+        record = {"type": example_type, "topic": topic, "content": content}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock, self._file_lock("exclusive"):
+            if self.changed_on_disk():
+                # Another worker or a hand edit got there first: build on what's on disk,
+                # or a compaction below would drop their examples
+                self._load_locked()
+            if not os.path.exists(self.journal_path):
+                self._start_journal(self._snapshot_digest())
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Copy-on-write so readers holding the previous structure never see it change
+            self.data = _applied_copy(self.data, record)
+            self._journal_entries += 1
+
+            if self._journal_entries >= self.compact_every:
+                self._compact_locked()
+            # Our own write isn't an outside change
+            self._signature = self._file_signature()
+            return self.data
+
+    def compact(self) -> None:
+        """Fold the journal into user_examples.json"""
+        with self._lock, self._file_lock("exclusive"):
+            if self.changed_on_disk():
+                self._load_locked()
+            self._compact_locked()
+            self._signature = self._file_signature()
+
+    def _compact_locked(self) -> None:
+        """Atomically rewrite the snapshot, then start an empty journal based on it"""
+        payload = json.dumps(self.data, indent=2, ensure_ascii=False).encode("utf-8")
+        _atomic_write(self.path, payload)
+        # A crash here leaves the old journal, whose base no longer matches: replay is idempotent
+        self._start_journal(hashlib.sha256(payload).hexdigest())
+        self._journal_entries = 0
+
+    def _snapshot_digest(self):
+        """Digest of the snapshot file as it is on disk"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _start_journal(self, base) -> None:
+        """Atomically replace the journal with an empty one whose header names its snapshot"""
+        header = json.dumps({"base": base}) + "\n"
+        _atomic_write(self.journal_path, header.encode("utf-8"))
+
+
+class _FileLock:
+    """flock-based advisory lock on a sidecar file"""
+
+    def __init__(self, path: str, mode: str):
+        self.path = path
+        self.mode = mode
+        self._file = None
+
+    def __enter__(self):
+        if fcntl is None:
+            return self
+        try:
+            self._file = open(self.path, "a")
+        except OSError:
+            # Read-only filesystem (e.g. serverless): nothing to coordinate with
+            return self
+        fcntl.flock(self._file, fcntl.LOCK_SH if self.mode == "shared" else fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        return False
+
+
+def _apply(data: Dict, record: Dict, skip_existing: bool = False) -> None:
+    """Apply a journal record to examples in place"""
+    section = EXAMPLE_SECTIONS.get(record.get("type"))
+    if section is None:
+        return
+    content = record.get("content")
+    if section == "full_scripts":
+        target = data["full_scripts"]
+    else:
+        target = data[section].setdefault(record.get("topic", ""), [])
+    if skip_existing and content in target:
+        return
+    target.append(content)
+
+
+def _applied_copy(data: Dict, record: Dict) -> Dict:
+    """New examples structure with one record applied, sharing untouched parts"""
+    section = EXAMPLE_SECTIONS[record["type"]]
+    new_data = dict(data)
+    if section == "full_scripts":
+        new_data["full_scripts"] = data["full_scripts"] + [record["content"]]
+    else:
+        topics = dict(data[section])
+        topics[record["topic"]] = topics.get(record["topic"], []) + [record["content"]]
+        new_data[section] = topics
+    return new_data
+
+
+def _create_temp(path: str) -> tuple:
+    """Create a new temp file next to `path` with the usual mode for a new file: (fd, temp path)"""
+    directory, name = os.path.split(os.path.abspath(path))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(directory, f".tmp-{os.urandom(6).hex()}{name}")
+        try:
+            # Unlike mkstemp's owner-only 0o600, 0o666 lets the process umask decide
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Write a file via a fsync'd temp file and rename, so readers see old or new, never partial"""
+    fd, tmp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Keep the replaced file's mode (a new file keeps the temp file's)
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = None
+            if mode is not None:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), mode)
+                else:
+                    os.chmod(tmp_path, mode)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
@@ -1,194 +0,0 @@
-# Real insights from Dorian's expertise
-# These replace generic platitudes with specific, actionable advice
-
-EXPERTISE_TIP_BANK = {
-    "delegation skills": [
-        {
-            "title": "match the task to the person's growth edge",
-            "explanation": "Don't just delegate what you hate. [start B-roll] Match tasks to where someone's ready to stretch, not where they'll drown or coast. [end B-roll] That's how you build trust and capability at the same time.",
-            "b_roll": True
-        },
-        {
-            "title": "adjust your delivery to their personality",
-            "explanation": "[start B-roll] Some people need context and the why. Others just want the what and when. [end B-roll] How you deliver the ask matters as much as what you're asking for.",
-            "b_roll": True
-        },
-        {
-            "title": "be clear about authority and expectations",
-            "explanation": "Tell them exactly what decisions they can make without you. [start B-roll] Vague delegation creates confusion and kills momentum. [end B-roll] Clarity upfront saves everyone time later.",
-            "b_roll": True
-        },
-        {
-            "title": "follow up without micromanaging",
-            "explanation": "[start B-roll] Check in at agreed milestones, not every five minutes. [end B-roll] You're building capability, not babysitting. Trust the process you set up.",
-            "b_roll": True
-        },
-        {
-            "title": "own the outcome, share the credit",
-            "explanation": "When it goes well, shine the light on them. When it doesn't, that's on you as the leader. [start B-roll] That's how you build a team that runs through walls for you. [end B-roll]",
-            "b_roll": True
-        },
-    ],
-    "leadership skills": [
-        {
-            "title": "make the call, then explain",
-            "explanation": "In high-stakes environments, indecision costs more than a wrong decision. [start B-roll] Make the call with the info you have, then bring people along. [end B-roll] You can course-correct, but you can't lead from confusion.",
-            "b_roll": True
-        },
-        {
-            "title": "your energy sets the tone",
-            "explanation": "[start B-roll] If you're frantic, your team's frantic. If you're steady, they're steady. [end B-roll] You can't fake this - manage your state before you manage your team.",
-            "b_roll": True
-        },
-        {
-            "title": "build trust before you need it",
-            "explanation": "When the pressure hits, it's too late to build relationships. [start B-roll] Invest in your people when things are calm [end B-roll] so they trust you when things get rough.",
-            "b_roll": True
-        },
-        {
-            "title": "say the hard thing early",
-            "explanation": "[start B-roll] Address the issue when it's small, not when it's a crisis. [end B-roll] Real leaders don't avoid difficult conversations - they have them before they have to.",
-            "b_roll": True
-        },
-        {
-            "title": "develop your replacement",
-            "explanation": "Your job isn't to be irreplaceable. [start B-roll] It's to build someone who can do your job so you can do the next one. [end B-roll] That's how you actually move up.",
-            "b_roll": True
-        },
-    ],
-    "career transitions": [
-        {
-            "title": "your old skills transfer, but not how you think",
-            "explanation": "[start B-roll] Don't throw away what you know. Figure out how it applies in the new context. [end B-roll] The skills transfer, but you have to translate them.",
-            "b_roll": True
-        },
-        {
-            "title": "expect to feel incompetent for a minute",
-            "explanation": "Going from expert to beginner is uncomfortable. [start B-roll] That feeling isn't failure, it's growth. [end B-roll] You're supposed to not know everything right away.",
-            "b_roll": True
-        },
-        {
-            "title": "build your network before you need a job",
-            "explanation": "[start B-roll] Relationships aren't transactions. [end B-roll] Start connecting with people in your target space now, not when you're desperate. Real networks take time.",
-            "b_roll": True
-        },
-        {
-            "title": "get clear on your non-negotiables",
-            "explanation": "Money? Time? Growth? [start B-roll] Know what you won't compromise on before you start negotiating. [end B-roll] Otherwise every offer looks good.",
-            "b_roll": True
-        },
-        {
-            "title": "don't wait for permission to pivot",
-            "explanation": "[start B-roll] Nobody's going to tap you on the shoulder and say 'it's time.' [end B-roll] You decide when you're ready. Then you figure out how.",
-            "b_roll": True
-        },
-    ],
-    "managing stress": [
-        {
-            "title": "identify what you actually control",
-            "explanation": "[start B-roll] Stress comes from trying to control what you can't. [end B-roll] Make a list - what can you influence, what can't you? Focus your energy accordingly.",
-            "b_roll": True
-        },
-        {
-            "title": "build buffers before you need them",
-            "explanation": "In high-pressure jobs, you need margin built in. [start B-roll] Time buffers, energy buffers, financial buffers. [end B-roll] Stress hits hardest when you're running on empty.",
-            "b_roll": True
-        },
-        {
-            "title": "stress is information, not the enemy",
-            "explanation": "[start B-roll] Your stress is telling you something. [end B-roll] Listen to it. What's actually overwhelming you? Don't just push through - address the root.",
-            "b_roll": True
-        },
-        {
-            "title": "protect your recovery time",
-            "explanation": "You can sprint, but not forever. [start B-roll] Recovery isn't optional, it's strategic. [end B-roll] Guard your off time like it's part of the job - because it is.",
-            "b_roll": True
-        },
-        {
-            "title": "get real about what 'urgent' actually means",
-            "explanation": "[start B-roll] Not everything that feels urgent is urgent. [end B-roll] Learn to tell the difference. Real urgency is rare - manufactured urgency is everywhere.",
-            "b_roll": True
-        },
-    ],
-    "building confidence": [
-        {
-            "title": "confidence comes from doing, not feeling",
-            "explanation": "[start B-roll] You're not going to feel ready. Do it anyway. [end B-roll] Confidence is built through evidence, and evidence comes from action.",
-            "b_roll": True
-        },
-        {
-            "title": "track your wins, especially the small ones",
-            "explanation": "Your brain forgets progress. [start B-roll] Write down what you accomplished, even the tiny stuff. [end B-roll] When doubt shows up, you've got receipts.",
-            "b_roll": True
-        },
-        {
-            "title": "stop waiting for external validation",
-            "explanation": "[start B-roll] If you need everyone's approval, you'll never move. [end B-roll] Build internal confidence - know your worth independent of other people's opinions.",
-            "b_roll": True
-        },
-        {
-            "title": "competence builds confidence, not the other way around",
-            "explanation": "Get good at something. [start B-roll] Real confidence comes from knowing you can deliver, not from affirmations. [end B-roll] Put in the reps.",
-            "b_roll": True
-        },
-        {
-            "title": "comparison will kill your confidence",
-            "explanation": "[start B-roll] You're comparing your behind-the-scenes to everyone else's highlight reel. [end B-roll] Stay in your lane. Focus on your own growth.",
-            "b_roll": True
-        },
-    ],
-    "time management": [
-        {
-            "title": "protect your high-value hours",
-            "explanation": "[start B-roll] Figure out when you do your best thinking. [end B-roll] Guard those hours for your most important work. Don't waste them on meetings that could be emails.",
-            "b_roll": True
-        },
-        {
-            "title": "time block, don't just to-do list",
-            "explanation": "A to-do list tells you what. A time block tells you when. [start B-roll] If it's not on your calendar, it's not real. [end B-roll]",
-            "b_roll": True
-        },
-        {
-            "title": "batch similar tasks together",
-            "explanation": "[start B-roll] Context switching kills productivity. [end B-roll] Group similar tasks - all your calls, all your deep work, all your admin. Your brain will thank you.",
-            "b_roll": True
-        },
-        {
-            "title": "build in buffer time",
-            "explanation": "Back-to-back meetings all day is a setup for failure. [start B-roll] Leave 15 minutes between commitments. [end B-roll] You need space to think and transition.",
-            "b_roll": True
-        },
-        {
-            "title": "say no to protect your yes",
-            "explanation": "[start B-roll] Every yes to something unimportant is a no to something that matters. [end B-roll] Be ruthless about what gets your time.",
-            "b_roll": True
-        },
-    ],
-    "effective communication": [
-        {
-            "title": "lead with the bottom line",
-            "explanation": "Don't bury your point. [start B-roll] Start with what you need, then explain if needed. [end B-roll] Respect people's time - say it straight.",
-            "b_roll": True
-        },
-        {
-            "title": "match your communication to your audience",
-            "explanation": "[start B-roll] Executives want the headline. Your team wants the context. [end B-roll] Same message, different delivery. Know who you're talking to.",
-            "b_roll": True
-        },
-        {
-            "title": "listen to understand, not to respond",
-            "explanation": "If you're thinking about your response, you're not listening. [start B-roll] Hear them out fully before you speak. [end B-roll] Real communication is two-way.",
-            "b_roll": True
-        },
-        {
-            "title": "over-communicate in high-stakes situations",
-            "explanation": "[start B-roll] When the stakes are high, assume nothing is understood. [end B-roll] Repeat key points. Confirm understanding. Clarity saves crises.",
-            "b_roll": True
-        },
-        {
-            "title": "own your mistakes immediately",
-            "explanation": "If you mess up, say it fast. [start B-roll] Don't wait, don't spin, don't deflect. [end B-roll] Own it, fix it, move on. That's how you keep trust.",
-            "b_roll": True
-        },
-    ],
-}
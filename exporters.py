@@ -0,0 +1,132 @@
+"""
+Streaming exporters for generated reels.
+Each format is a generator that takes an iterable of Reel records and yields
+text one reel at a time, so an export of any size runs in constant memory as
+long as the reels themselves are produced lazily (ContentGenerator.iter_reels).
+
+Formats:
+    jsonl         one reel per line, in the same shape as /api/generate/reel
+    csv           one row per section (hook, intro, transition, each tip, CTA)
+    srt           subtitles from the section timestamps; reels follow each other on one timeline
+    teleprompter  plain text to read aloud, one paragraph per section
+"""
+
+import csv
+import io
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from records import B_ROLL_END, B_ROLL_START, Reel
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+    "srt": ("application/x-subrip", "srt"),
+    "teleprompter": ("text/plain", "txt"),
+}
+
+CSV_COLUMNS = ("reel", "topic", "section", "number", "start", "end", "timestamp", "visual", "title", "script")
+
+# Subtitle cues: at most two lines of this many characters
+SUBTITLE_LINE_CHARS = 42
+SUBTITLE_LINES = 2
+
+
+def iter_export(reels: Iterable[Reel], export_format: str) -> Iterator[str]:
+    """Text chunks of `reels` in an export format (raises ValueError for an unknown format)"""
+    writer = _WRITERS.get(export_format)
+    if writer is None:
+        raise ValueError(f"Invalid export format: {export_format} (use one of {', '.join(EXPORT_FORMATS)})")
+    return writer(reels)
+
+
+def spoken_text(script: str) -> str:
+    """A script without its B-roll markers (the words that are actually said)"""
+    return " ".join(script.replace(B_ROLL_START, " ").replace(B_ROLL_END, " ").split())
+
+
+def export_jsonl(reels: Iterable[Reel]) -> Iterator[str]:
+    """One compact JSON reel per line"""
+    for reel in reels:
+        yield reel.to_json() + "\n"
+
+
+def export_csv(reels: Iterable[Reel]) -> Iterator[str]:
+    """A header row, then one row per reel section"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    for index, reel in enumerate(reels, 1):
+        for name, section in reel.sections():
+            is_tip = name == "tip"
+            writer.writerow((
+                index, reel.topic, name,
+                section.number if is_tip else "",
+                section.start, section.end, section.timestamp, section.visual,
+                section.title if is_tip else "",
+                section.script,
+            ))
+        # Hand over each reel's rows as soon as they are written
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_srt(reels: Iterable[Reel]) -> Iterator[str]:
+    """SubRip cues for every section, each reel starting where the previous one ended"""
+    cue = 0
+    offset = 0.0
+    for reel in reels:
+        end_of_reel = 0.0
+        parts = []
+        for _, section in reel.sections():
+            chunks = subtitle_chunks(spoken_text(section.script))
+            total_chars = sum(len(chunk) for chunk in chunks) or 1
+            # Split the section's window across its cues in proportion to their length
+            start, span = offset + section.start, section.end - section.start
+            for chunk in chunks:
+                end = start + span * len(chunk) / total_chars
+                cue += 1
+                parts.append(f"{cue}\n{srt_time(start)} --> {srt_time(end)}\n{chunk}\n\n")
+                start = end
+            end_of_reel = max(end_of_reel, section.end)
+        offset += end_of_reel
+        yield "".join(parts)
+
+
+def export_teleprompter(reels: Iterable[Reel]) -> Iterator[str]:
+    """The script of each reel (as compile_reel_script orders it), one spoken paragraph per section"""
+    for index, reel in enumerate(reels, 1):
+        paragraphs = [spoken_text(section.script) for _, section in reel.sections()]
+        yield f"=== {index}. {reel.topic} ===\n\n" + "\n\n".join(paragraphs) + "\n\n\n"
+
+
+def subtitle_chunks(text: str) -> List[str]:
+    """Word-wrap text into subtitle cues of up to SUBTITLE_LINES lines"""
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > SUBTITLE_LINE_CHARS:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return ["\n".join(lines[i:i + SUBTITLE_LINES]) for i in range(0, len(lines), SUBTITLE_LINES)]
+
+
+def srt_time(seconds: float) -> str:
+    """HH:MM:SS,mmm"""
+    secs, millis = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    return "%02d:%02d:%02d,%03d" % (minutes // 60, minutes % 60, secs, millis)
+
+
+_WRITERS: Dict[str, Callable[[Iterable[Reel]], Iterator[str]]] = {
+    "jsonl": export_jsonl,
+    "csv": export_csv,
+    "srt": export_srt,
+    "teleprompter": export_teleprompter,
+}
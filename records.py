@@ -0,0 +1,293 @@
+"""
+Compact record types for generated content.
+Tips, hooks and reel sections are `__slots__` objects instead of dicts: a slot
+object has no per-instance dict of repeated keys, and derived text (tip
+scripts, timestamps, a reel's full script) is computed when serialized rather
+than stored. Records are turned into the API's JSON shape only at the
+boundary, via to_dict()/to_json() or json_default for json.dumps.
+
+Tip explanations are split at their B-roll markers once, when the Tip is
+built, into talking-head and B-roll segments; a tip's b_roll flag and visual
+come from those segments rather than a hand-set flag.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Tuple
+
+TALKING_HEAD = "Talking Head"
+B_ROLL_OVERLAY = "Talking Head with B-roll overlay"
+# Script markers around lines spoken over B-roll
+B_ROLL_START = "[start B-roll]"
+B_ROLL_END = "[end B-roll]"
+# Segment kinds
+TALKING_HEAD_SEGMENT = "talking_head"
+B_ROLL_SEGMENT = "b_roll"
+
+
+class Record(ABC):
+    """Base for slot records: equality, repr and JSON by way of to_dict()"""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self) -> Dict:
+        """The record in its JSON-ready dict shape"""
+
+    def to_json(self) -> str:
+        """Compact JSON for the record"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    # Compared by value but mutable (and a reel holds a list of tips), so deliberately unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def json_default(value):
+    """json.dumps default= hook that serializes records (and nothing else)"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json(value, **kwargs) -> str:
+    """json.dumps for values that may contain records"""
+    kwargs.setdefault("ensure_ascii", False)
+    return json.dumps(value, default=json_default, **kwargs)
+
+
+class Segment(Record):
+    """A talking-head or B-roll span of a script, as character offsets (markers excluded)"""
+
+    __slots__ = ("kind", "start", "end")
+
+    def __init__(self, kind: str, start: int, end: int):
+        self.kind = kind
+        self.start = start
+        self.end = end
+
+    def to_dict(self) -> Dict:
+        return {"kind": self.kind, "start": self.start, "end": self.end}
+
+
+def parse_segments(text: str) -> Tuple[Segment, ...]:
+    """Split text at its B-roll markers into segments; text[segment.start:segment.end] is the span's words"""
+    spans = []  # [kind, start, end]
+    kind, cursor = TALKING_HEAD_SEGMENT, 0
+    while True:
+        start_at = text.find(B_ROLL_START, cursor)
+        end_at = text.find(B_ROLL_END, cursor)
+        if start_at < 0 and end_at < 0:
+            break
+        if end_at < 0 or 0 <= start_at < end_at:
+            at, marker, next_kind = start_at, B_ROLL_START, B_ROLL_SEGMENT
+        else:
+            at, marker, next_kind = end_at, B_ROLL_END, TALKING_HEAD_SEGMENT
+            # An end marker without a start closes B-roll over the words since the previous marker
+            kind = B_ROLL_SEGMENT
+        _add_span(spans, kind, text, cursor, at)
+        kind, cursor = next_kind, at + len(marker)
+    _add_span(spans, kind, text, cursor, len(text))
+    return tuple(Segment(*span) for span in spans)
+
+
+def _add_span(spans: List[list], kind: str, text: str, start: int, end: int) -> None:
+    """Append text[start:end] without edge whitespace, merging it into a previous span of the same kind"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start == end:
+        return
+    if spans and spans[-1][0] == kind:
+        spans[-1][2] = end
+    else:
+        spans.append([kind, start, end])
+
+
+class Tip(Record):
+    """A source tip from the tip bank, user examples or a generic pattern, parsed into segments once"""
+
+    __slots__ = ("title", "explanation", "segments", "b_roll")
+
+    def __init__(self, title: str, explanation: str):
+        self.title = title
+        self.explanation = explanation
+        self.segments = parse_segments(explanation)
+        # Whether any of the explanation is spoken over B-roll
+        self.b_roll = any(segment.kind == B_ROLL_SEGMENT for segment in self.segments)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Tip":
+        """Build from a tip-bank / user-example dict (its b_roll flag is re-derived from the markers)"""
+        return cls(data.get("title", ""), data.get("explanation", ""))
+
+    def to_dict(self) -> Dict:
+        return {"title": self.title, "explanation": self.explanation, "b_roll": self.b_roll}
+
+
+class FormattedTip(Record):
+    """A tip placed in a reel: its number and time window, with script and visual derived from the tip"""
+
+    __slots__ = ("number", "start", "end", "tip")
+
+    def __init__(self, number: int, start: int, end: int, tip: Tip):
+        self.number = number
+        self.start = start
+        self.end = end
+        self.tip = tip
+
+    @property
+    def timestamp(self) -> str:
+        return f"{self.start}-{self.end} seconds"
+
+    @property
+    def visual(self) -> str:
+        return B_ROLL_OVERLAY if self.tip.b_roll else TALKING_HEAD
+
+    @property
+    def title(self) -> str:
+        return self.tip.title
+
+    @property
+    def script(self) -> str:
+        return f"{self.number}, {self.tip.title}. {self.tip.explanation}"
+
+    @property
+    def segments(self) -> List[Segment]:
+        """The tip's segments as offsets into `script` ("N, title." is spoken to camera)"""
+        return [Segment(**segment) for segment in script_segments(len(f"{self.number}, {self.tip.title}. "), self.tip)]
+
+    def to_dict(self) -> Dict:
+        # Inlined properties: this runs once per tip of every serialized reel
+        number, tip = self.number, self.tip
+        prefix = f"{number}, {tip.title}. "
+        return {
+            "number": number,
+            "timestamp": f"{self.start}-{self.end} seconds",
+            "visual": B_ROLL_OVERLAY if tip.b_roll else TALKING_HEAD,
+            "title": tip.title,
+            "script": prefix + tip.explanation,
+            "segments": script_segments(len(prefix), tip),
+        }
+
+
+def script_segments(offset: int, tip: Tip) -> List[Dict]:
+    """Segment dicts for a tip's explanation placed `offset` characters into a script, after a spoken lead-in"""
+    segments = [{"kind": TALKING_HEAD_SEGMENT, "start": 0, "end": offset - 1}]
+    for segment in tip.segments:
+        # Parsed segments alternate, so only an opening talking-head segment joins the lead-in
+        if segment.kind == segments[-1]["kind"]:
+            segments[-1]["end"] = offset + segment.end
+        else:
+            segments.append({"kind": segment.kind, "start": offset + segment.start, "end": offset + segment.end})
+    return segments
+
+
+class ReelSection(Record):
+    """A fixed reel section (hook, intro, transition, CTA) and its time window in seconds"""
+
+    __slots__ = ("start", "end", "visual", "script")
+
+    def __init__(self, start: int, end: int, visual: str, script: str):
+        self.start = start
+        self.end = end
+        self.visual = visual
+        self.script = script
+
+    @property
+    def timestamp(self) -> str:
+        return f"{self.start}-{self.end} seconds"
+
+    def to_dict(self) -> Dict:
+        return {"timestamp": f"{self.start}-{self.end} seconds", "visual": self.visual, "script": self.script}
+
+
+class Reel(Record):
+    """An Instagram Reel: hook, intro, transition, tips and CTA in order"""
+
+    __slots__ = ("topic", "hook", "intro", "transition", "tips", "cta")
+
+    CONTENT_TYPE = "Instagram Reel"
+
+    def __init__(self, topic: str, hook: ReelSection, intro: ReelSection, transition: ReelSection,
+                 tips: List[FormattedTip], cta: ReelSection):
+        self.topic = topic
+        self.hook = hook
+        self.intro = intro
+        self.transition = transition
+        self.tips = tips
+        self.cta = cta
+
+    def sections(self) -> Iterator[Tuple[str, Record]]:
+        """(name, section) pairs in speaking order; tips are named "tip" and carry their number"""
+        yield "hook", self.hook
+        yield "intro", self.intro
+        yield "transition", self.transition
+        for tip in self.tips:
+            yield "tip", tip
+        yield "cta", self.cta
+
+    @property
+    def duration(self) -> str:
+        """Length of the reel's timeline (it ends with the CTA)"""
+        return f"{self.cta.end} seconds"
+
+    @property
+    def full_script(self) -> str:
+        """The whole script in speaking order"""
+        parts = [self.hook.script, self.intro.script, self.transition.script]
+        parts.extend(tip.script for tip in self.tips)
+        parts.append(self.cta.script)
+        return " ".join(parts)
+
+    def to_dict(self) -> Dict:
+        hook, intro, transition, cta = self.hook, self.intro, self.transition, self.cta
+        tips = [tip.to_dict() for tip in self.tips]
+        # Reuse the tip scripts just formatted instead of formatting them again
+        parts = [hook.script, intro.script, transition.script]
+        parts.extend(tip["script"] for tip in tips)
+        parts.append(cta.script)
+        return {
+            "content_type": self.CONTENT_TYPE,
+            "topic": self.topic,
+            "duration": f"{cta.end} seconds",
+            "structure": {
+                "hook": hook.to_dict(),
+                "intro": intro.to_dict(),
+                "transition": transition.to_dict(),
+                "tips": tips,
+                "cta": cta.to_dict(),
+            },
+            "full_script": " ".join(parts),
+        }
+
+
+class Hook(Record):
+    """One content hook idea"""
+
+    __slots__ = ("number", "category", "topic", "hook", "use_case")
+
+    def __init__(self, number: int, category: str, topic: str, hook: str, use_case: str):
+        self.number = number
+        self.category = category
+        self.topic = topic
+        self.hook = hook
+        self.use_case = use_case
+
+    def to_dict(self) -> Dict:
+        return {
+            "number": self.number,
+            "category": self.category,
+            "topic": self.topic,
+            "hook": self.hook,
+            "use_case": self.use_case,
+        }
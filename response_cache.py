@@ -0,0 +1,177 @@
+"""
+Content-addressed response cache for the generate endpoints.
+Seeded requests are deterministic, so identical (endpoint, params, seed) requests
+can be served from cache instead of being regenerated. Backends are pluggable:
+an in-process LRU, or a sqlite file that warm serverless instances can share.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+
+class MemoryCacheBackend:
+    """Bounded in-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Get a live entry, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store an entry, evicting the least recently used beyond the bound"""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """Bounded LRU stored in a sqlite file, shareable between processes on one host"""
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Imported here so the default memory backend doesn't pay for sqlite3 at cold start
+        import sqlite3
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed)")
+
+    def get(self, key: str):
+        """Get a live entry, marking it most recently used"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE response_cache SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store an entry, evicting the least recently used beyond the bound"""
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, now + ttl, now)
+            )
+            # Evict least recently used rows beyond the bound
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+class ResponseCache:
+    """Cache generated responses keyed on a canonical hash of (endpoint, params, data version)"""
+
+    def __init__(self, backend, ttl: float = 3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Build the cache from CONTENT_CACHE_* environment variables (None when disabled)"""
+        backend_name = os.environ.get("CONTENT_CACHE_BACKEND", "memory").lower()
+        ttl = float(os.environ.get("CONTENT_CACHE_TTL", 3600))
+        max_entries = int(os.environ.get("CONTENT_CACHE_SIZE", 1024))
+
+        if backend_name in ("off", "none", "0"):
+            return None
+        if backend_name == "sqlite":
+            path = os.environ.get("CONTENT_CACHE_PATH", "/tmp/content_cache.sqlite3")
+            import sqlite3
+            try:
+                return cls(SQLiteCacheBackend(path, max_entries), ttl)
+            except sqlite3.Error as e:
+                print(f"Note: Could not open sqlite cache at {path}, using memory cache: {e}")
+        return cls(MemoryCacheBackend(max_entries), ttl)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict, data_version: str = "") -> str:
+        """Canonical content hash of a request"""
+        canonical = json.dumps(
+            [endpoint, params, data_version], sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict]) -> tuple:
+        """Return (value, hit) for a key, computing and storing the value on a miss"""
+        value = self.backend.get(key)
+        if value is not None:
+            with self._stats_lock:
+                self.hits += 1
+            return value, True
+
+        with self._stats_lock:
+            self.misses += 1
+        value = compute()
+        self.backend.set(key, value, self.ttl)
+        return value, False
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        self.backend.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
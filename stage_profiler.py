@@ -0,0 +1,142 @@
+"""
+Per-stage timing for content generation.
+A generation request records a lap at the end of each stage (hook, tips, intro,
+...); laps are aggregated into wall-time and allocation histograms that can be
+exported in Prometheus text format. When no profiler is attached the generator
+only pays for an `is None` check per stage.
+"""
+
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+# Histogram bucket upper bounds
+SECONDS_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2, 1e-1)
+BLOCKS_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Add one observation"""
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[tuple]:
+        """(upper bound, observations <= bound) pairs, ending with +Inf"""
+        running, out = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            out.append((bound, running))
+        out.append((float("inf"), self.count))
+        return out
+
+
+class RequestTimer:
+    """Laps for one generation request; each lap closes the stage that just finished"""
+
+    __slots__ = ("profiler", "name", "stages", "_start", "_last", "_last_blocks")
+
+    def __init__(self, profiler: "StageProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.stages = []  # (stage, seconds, allocated blocks)
+
+    def __enter__(self) -> "RequestTimer":
+        self._last_blocks = sys.getallocatedblocks()
+        self._start = self._last = time.perf_counter()
+        return self
+
+    def lap(self, stage: str) -> None:
+        """Record the time and net memory blocks allocated since the previous lap"""
+        now = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+        self.stages.append((stage, now - self._last, blocks - self._last_blocks))
+        # Don't bill the profiler's own bookkeeping to the next stage
+        self._last_blocks = sys.getallocatedblocks()
+        self._last = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.profiler.record(self.name, self.stages, time.perf_counter() - self._start)
+        return False
+
+
+class StageProfiler:
+    """Aggregates per-stage wall time and allocations across requests"""
+
+    def __init__(self, on_request: Callable[[str, List[tuple], float], None] = None):
+        # Optional callback(request name, [(stage, seconds, blocks)], total seconds) per request
+        self.on_request = on_request
+        self._seconds = {}  # (request, stage) -> Histogram
+        self._blocks = {}   # (request, stage) -> Histogram
+        self._lock = threading.Lock()
+
+    def request(self, name: str) -> RequestTimer:
+        """Context manager timing one request's stages"""
+        return RequestTimer(self, name)
+
+    def record(self, name: str, stages: List[tuple], total: float) -> None:
+        """Fold one finished request into the histograms"""
+        with self._lock:
+            for stage, seconds, blocks in stages + [("total", total, sum(s[2] for s in stages))]:
+                key = (name, stage)
+                if key not in self._seconds:
+                    self._seconds[key] = Histogram(SECONDS_BUCKETS)
+                    self._blocks[key] = Histogram(BLOCKS_BUCKETS)
+                self._seconds[key].observe(seconds)
+                self._blocks[key].observe(blocks)
+        if self.on_request:
+            self.on_request(name, stages, total)
+
+    def reset(self) -> None:
+        """Drop all recorded observations"""
+        with self._lock:
+            self._seconds.clear()
+            self._blocks.clear()
+
+    def summary(self) -> Dict:
+        """Mean seconds/blocks and counts per request and stage"""
+        with self._lock:
+            out = {}
+            for (name, stage), histogram in self._seconds.items():
+                blocks = self._blocks[(name, stage)]
+                out.setdefault(name, {})[stage] = {
+                    "count": histogram.count,
+                    "mean_seconds": histogram.total / histogram.count if histogram.count else 0.0,
+                    "mean_allocated_blocks": blocks.total / blocks.count if blocks.count else 0.0,
+                }
+            return out
+
+    def to_prometheus(self) -> str:
+        """Histograms in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for metric, help_text, histograms in (
+                ("content_stage_seconds", "Wall time per generation stage", self._seconds),
+                ("content_stage_allocated_blocks", "Net memory blocks allocated per generation stage", self._blocks),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (name, stage), histogram in sorted(histograms.items()):
+                    labels = f'request="{name}",stage="{stage}"'
+                    for bound, count in histogram.cumulative():
+                        le = "+Inf" if bound == float("inf") else repr(float(bound))
+                        lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f"{metric}_sum{{{labels}}} {histogram.total!r}")
+                    lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,86 @@
+"""
+Precomputed startup state for serverless cold starts.
+Derived structures that take longer to build than to unpickle (the fuzzy topic
+index) are written to one pickle file ahead of deployment and loaded with a
+single read on first use. The snapshot is keyed by a hash of the modules and
+content packs that produce it and by the content data version, so a stale file
+is ignored and the structures are rebuilt in memory as before.
+
+Build with:  python3 startup_snapshot.py
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from typing import Dict, Optional
+
+from content_packs import load_pack
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.environ.get("CONTENT_SNAPSHOT_PATH", os.path.join(ROOT, "content_snapshot.pickle"))
+# Modules whose code determines the snapshotted structures
+SOURCE_FILES = ("content_generator_core.py", "topic_index.py", "startup_snapshot.py")
+# Content packs the snapshotted structures are built from (keyed by their digest, read from the pack header)
+SOURCE_PACKS = ("tips",)
+# Protocol 4 loads on every supported Python (3.4+), so one file serves dev and deploy
+PICKLE_PROTOCOL = 4
+
+_source_key = None
+
+
+def source_key() -> str:
+    """Hash of the source modules and content packs the snapshot was built from"""
+    global _source_key
+    if _source_key is None:
+        digest = hashlib.sha256()
+        for name in SOURCE_FILES:
+            with open(os.path.join(ROOT, name), "rb") as f:
+                digest.update(f.read())
+        for name in SOURCE_PACKS:
+            digest.update(load_pack(name).digest.encode("ascii"))
+        _source_key = digest.hexdigest()[:16]
+    return _source_key
+
+
+def load_snapshot(data_version: str, path: str = None) -> Optional[Dict]:
+    """Snapshot state if the file exists and matches the current sources and data (else None)"""
+    path = path or SNAPSHOT_PATH
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Note: Ignoring unreadable startup snapshot {path}: {e}")
+        return None
+
+    if not isinstance(payload, dict) or payload.get("key") != (source_key(), data_version):
+        return None
+    return payload["state"]
+
+
+def save_snapshot(state: Dict, data_version: str, path: str = None) -> str:
+    """Write snapshot state atomically; returns the path written"""
+    path = path or SNAPSHOT_PATH
+    payload = {"key": (source_key(), data_version), "state": state}
+    temp_path = f"{path}.tmp-{os.getpid()}"
+    with open(temp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=PICKLE_PROTOCOL)
+    os.replace(temp_path, path)
+    return path
+
+
+def build_snapshot(path: str = None) -> str:
+    """Build the startup state from the current sources and user examples and save it"""
+    from content_generator_core import ContentGenerator
+
+    generator = ContentGenerator()
+    state = {"topic_index": generator.build_topic_index()}
+    return save_snapshot(state, generator.data_version, path)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    written = build_snapshot()
+    print(f"Wrote {written} ({os.path.getsize(written)} bytes) in {(time.perf_counter() - start) * 1000:.1f}ms")
@@ -0,0 +1,97 @@
+"""
+In-memory static page with precompressed variants.
+The page is resolved and read once, then served from memory with gzip/brotli
+variants and a strong ETag per representation. The file is read on the first
+request rather than at import, and in dev mode it reloads only when the file's
+mtime changes.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from typing import List, Optional
+
+try:
+    import brotli  # Optional: pip install brotli
+except ImportError:
+    brotli = None
+
+# Preferred order when the client accepts several encodings
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+class StaticPage:
+    """A text page held in memory with lazily built, memoized compressed variants"""
+
+    def __init__(self, candidate_paths: List[str], fallback: str):
+        self.candidate_paths = candidate_paths
+        self.fallback = fallback.encode("utf-8")
+        self.path = None
+        self.mtime = None
+        self._lock = threading.Lock()
+        self._variants = None  # Loaded on first use
+
+    def _resolve_path(self) -> Optional[str]:
+        """First candidate path that exists"""
+        for path in self.candidate_paths:
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _load(self) -> None:
+        """Read the page (or the fallback) into memory and reset compressed variants"""
+        body, path, mtime = self.fallback, self._resolve_path(), None
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    body = f.read()
+                mtime = os.stat(path).st_mtime_ns
+            except OSError as e:
+                print(f"Note: Could not read {path}: {e}")
+                path = None
+
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # encoding -> (body, etag); compressed variants are filled in on first use
+        self._variants = {None: (body, digest)}
+        self._digest = digest
+        self.path, self.mtime = path, mtime
+
+    def refresh_if_changed(self) -> None:
+        """Reload the page if its file's mtime changed (dev mode)"""
+        path = self.path or self._resolve_path()
+        try:
+            mtime = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            mtime = None
+        if mtime != self.mtime or path != self.path:
+            with self._lock:
+                self._load()
+
+    def get(self, encoding: str = None) -> tuple:
+        """Get (body, etag) for an encoding (None for identity)"""
+        variants = self._variants
+        if variants is None:
+            with self._lock:
+                if self._variants is None:
+                    self._load()
+            variants = self._variants
+        variant = variants.get(encoding)
+        if variant is None:
+            body = variants[None][0]
+            if encoding == "gzip":
+                compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            elif encoding == "br" and brotli:
+                compressed = brotli.compress(body, quality=11)
+            else:
+                return variants[None]
+            variant = (compressed, f"{self._digest}-{encoding}")
+            variants[encoding] = variant
+        return variant
+
+    def negotiate(self, accept_encodings) -> Optional[str]:
+        """Pick the best available encoding from a werkzeug Accept-Encoding header"""
+        for encoding in ENCODINGS:
+            if accept_encodings[encoding] > 0:
+                return encoding
+        return None
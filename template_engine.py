@@ -0,0 +1,228 @@
+"""
+Precompiled template engine for hook templates.
+Templates are parsed once into slot lists, so rendering never re-parses the
+format string and only builds the placeholders a template actually references.
+"""
+
+import random
+import string
+from typing import Callable, Dict, List, Union
+
+_FORMATTER = string.Formatter()
+
+# A slot spec is either a fixed string (may reference {topic}) or a tuple (or list, as loaded from JSON) of choices
+SlotSpec = Union[str, tuple, list]
+SlotFiller = Callable[[str, random.Random], str]
+
+
+class CompiledTemplate:
+    """A format string parsed once into (literal, field, format_spec) parts"""
+
+    __slots__ = ("source", "parts", "fields")
+
+    def __init__(self, source: str):
+        self.source = source
+        parts = []
+        fields = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(source):
+            if field_name is not None and (conversion or not field_name.isidentifier()):
+                raise ValueError(f"Unsupported placeholder '{{{field_name}}}' in template: {source}")
+            parts.append((literal, field_name, format_spec or ""))
+            if field_name is not None and field_name not in fields:
+                fields.append(field_name)
+        self.parts = tuple(parts)
+        self.fields = tuple(fields)
+
+    def render(self, slots: Dict[str, SlotFiller], topic: str, context: Dict = None, rng=random) -> str:
+        """Fill the template, building only the slots it references"""
+        values = {}
+        for name in self.fields:
+            if context and name in context:
+                values[name] = context[name]
+            else:
+                values[name] = slots[name](topic, rng)
+
+        out = []
+        for literal, name, format_spec in self.parts:
+            out.append(literal)
+            if name is not None:
+                value = values[name]
+                out.append(value if format_spec == "" and value.__class__ is str else format(value, format_spec))
+        return "".join(out)
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.source!r})"
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """Parse a template once for repeated rendering"""
+    return CompiledTemplate(source)
+
+
+def compile_templates(sources: List[str]) -> List[CompiledTemplate]:
+    """Parse a list of templates once for repeated rendering"""
+    return [CompiledTemplate(source) for source in sources]
+
+
+def _compile_slot(spec: SlotSpec) -> SlotFiller:
+    """Turn a slot spec into a filler taking (topic, rng)"""
+    if isinstance(spec, (tuple, list)):
+        choices = tuple(spec)
+        return lambda topic, rng: rng.choice(choices)
+
+    if "{topic}" not in spec:
+        return lambda topic, rng: spec
+
+    prefix, _, suffix = spec.partition("{topic}")
+    if "{" in suffix:
+        template = CompiledTemplate(spec)
+        return lambda topic, rng: template.render({"topic": lambda t, r: t}, topic)
+    return lambda topic, rng: prefix + topic + suffix
+
+
+def compile_slots(specs: Dict[str, SlotSpec]) -> Dict[str, SlotFiller]:
+    """Compile a slot spec table into fillers keyed by placeholder name"""
+    return {name: _compile_slot(spec) for name, spec in specs.items()}
+
+
+def slot_choices(specs: Dict[str, SlotSpec]) -> Dict[str, tuple]:
+    """The slots that vary between renders, with their choices"""
+    return {name: tuple(spec) for name, spec in specs.items() if isinstance(spec, (tuple, list))}
+
+
+class TemplateSpace:
+    """Every distinct rendering of a template list: each template times its slot-choice combinations"""
+
+    def __init__(self, templates: List[CompiledTemplate], slots: Dict[str, SlotFiller], choices: Dict[str, tuple]):
+        self.templates = templates
+        self.slots = slots
+        # Per template: the varying slots it references, and how many renderings that gives
+        self.varying = []
+        self.sizes = []
+        for template in templates:
+            varying = tuple((name, choices[name]) for name in template.fields if name in choices)
+            size = 1
+            for _, options in varying:
+                size *= len(options)
+            self.varying.append(varying)
+            self.sizes.append(size)
+        self.capacity = sum(self.sizes)
+
+    def render(self, index: int, variant: int, topic: str) -> str:
+        """Render one template with the slot choices encoded by a variant number"""
+        values = {}
+        for name, options in self.varying[index]:
+            variant, digit = divmod(variant, len(options))
+            values[name] = options[digit]
+        return self.templates[index].render(self.slots, topic, values)
+
+    def deck(self) -> "TemplateDeck":
+        """A fresh deck drawing this space without replacement"""
+        return TemplateDeck(self)
+
+
+def build_spaces(templates_by_group: Dict[str, List[CompiledTemplate]], slots: Dict[str, SlotFiller],
+                 choices: Dict[str, tuple]) -> Dict[str, TemplateSpace]:
+    """Build a rendering space for each group of templates against one slot table"""
+    return {group: TemplateSpace(templates, slots, choices) for group, templates in templates_by_group.items()}
+
+
+class TemplateDeck:
+    """Draws renderings of a template space without replacement, uniform over templates then variants"""
+
+    def __init__(self, space: TemplateSpace):
+        self.space = space
+        self.remaining = space.capacity
+        self._templates = [index for index, size in enumerate(space.sizes) if size]
+        self._variants = {}  # template index -> unused variant numbers, created on first draw
+
+    def draw(self, topic: str, rng=random) -> str:
+        """Render an unused (template, slot choices) combination; None once exhausted"""
+        templates = self._templates
+        if not templates:
+            return None
+
+        position = rng.randrange(len(templates))
+        index = templates[position]
+        variants = self._variants.get(index)
+        if variants is None:
+            variants = self._variants[index] = list(range(self.space.sizes[index]))
+        variant = _swap_remove(variants, rng.randrange(len(variants)))
+        if not variants:
+            _swap_remove(templates, position)
+        self.remaining -= 1
+        return self.space.render(index, variant, topic)
+
+    def __len__(self) -> int:
+        return self.remaining
+
+
+class DeckGroup:
+    """Several decks drawn as one: a uniformly chosen non-empty deck per draw"""
+
+    def __init__(self, decks: List):
+        self._decks = [deck for deck in decks if len(deck)]
+        self.remaining = sum(len(deck) for deck in self._decks)
+
+    def draw(self, topic: str, rng=random) -> str:
+        """Draw from a random non-empty member deck; None once all are exhausted"""
+        decks = self._decks
+        if not decks:
+            return None
+
+        position = rng.randrange(len(decks))
+        value = decks[position].draw(topic, rng)
+        if not len(decks[position]):
+            _swap_remove(decks, position)
+        self.remaining -= 1
+        return value
+
+    def __len__(self) -> int:
+        return self.remaining
+
+
+def _swap_remove(items: list, position: int):
+    """Remove and return items[position] in O(1) by moving the last item into its place"""
+    value = items[position]
+    items[position] = items[-1]
+    items.pop()
+    return value
+
+
+class TemplateCoverage:
+    """Load-time index of the placeholders each template needs and whether the slot table can fill them"""
+
+    def __init__(self, templates: List[CompiledTemplate], slots: Dict[str, SlotFiller]):
+        self.total = len(templates)
+        self.fillable = []
+        self.quarantined = []
+        self.placeholder_usage = {}
+
+        for template in templates:
+            missing = [name for name in template.fields if name not in slots]
+            if missing:
+                self.quarantined.append((template, missing))
+            else:
+                self.fillable.append(template)
+            for name in template.fields:
+                self.placeholder_usage[name] = self.placeholder_usage.get(name, 0) + 1
+
+        self.unused_slots = sorted(name for name in slots if name not in self.placeholder_usage)
+
+    def to_dict(self) -> Dict:
+        """Coverage report for APIs and tooling"""
+        return {
+            "total_templates": self.total,
+            "fillable_templates": len(self.fillable),
+            "quarantined_templates": [
+                {"template": template.source, "missing_placeholders": missing}
+                for template, missing in self.quarantined
+            ],
+            "placeholder_usage": dict(sorted(self.placeholder_usage.items())),
+            "unused_slots": self.unused_slots,
+        }
+
+
+def build_coverage(templates_by_group: Dict[str, List[CompiledTemplate]], slots: Dict[str, SlotFiller]) -> Dict[str, TemplateCoverage]:
+    """Build a coverage index for each group of templates against one slot table"""
+    return {group: TemplateCoverage(templates, slots) for group, templates in templates_by_group.items()}
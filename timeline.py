@@ -0,0 +1,146 @@
+"""
+Reel timeline: section timestamps from estimated speaking time.
+Each section lasts as long as its spoken words take at a configurable speaking
+rate (B-roll markers aren't spoken), plus a short pause before the next one.
+Sections are laid end to end in whole seconds. Tips are fitted into whatever the
+fixed sections (hook, intro, transition, CTA) leave of the target duration:
+over-long tips are swapped for shorter ones from the same pool, and only if no
+swap is enough are tips dropped, longest first.
+
+Configure with CONTENT_WPM (default 180 words per minute, a brisk short-form pace) and
+CONTENT_REEL_SECONDS (default 60; 0 lays out the timeline without fitting).
+"""
+
+import bisect
+import os
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from records import B_ROLL_END, B_ROLL_START
+
+WORDS_PER_MINUTE = float(os.environ.get("CONTENT_WPM", 180))
+TARGET_SECONDS = float(os.environ.get("CONTENT_REEL_SECONDS", 60))
+# Breath between sections
+PAUSE_SECONDS = 0.25
+# Bound on cached word counts (tip texts, intros and CTAs repeat; hooks mostly don't)
+MAX_CACHED_SCRIPTS = 16384
+
+
+def count_words(script: str) -> int:
+    """Spoken words in a script (each B-roll marker is two words that aren't said)"""
+    return len(script.split()) - 2 * (script.count(B_ROLL_START) + script.count(B_ROLL_END))
+
+
+class Timeline:
+    """Speaking-rate model and target duration for laying out reels"""
+
+    def __init__(self, words_per_minute: float = WORDS_PER_MINUTE, target_seconds: float = TARGET_SECONDS,
+                 pause_seconds: float = PAUSE_SECONDS):
+        if words_per_minute <= 0:
+            raise ValueError("words_per_minute must be positive")
+        if target_seconds < 0 or pause_seconds < 0:
+            raise ValueError("target_seconds and pause_seconds can't be negative")
+        self.words_per_minute = words_per_minute
+        self.target_seconds = target_seconds
+        self.pause_seconds = pause_seconds
+        self._seconds_per_word = 60.0 / words_per_minute
+        self._words = {}  # script -> spoken word count
+
+    def words(self, script: str) -> int:
+        """count_words, cached"""
+        words = self._words.get(script)
+        if words is None:
+            if len(self._words) >= MAX_CACHED_SCRIPTS:
+                self._words.clear()
+            words = self._words[script] = count_words(script)
+        return words
+
+    def seconds(self, script: str) -> float:
+        """Time a section takes: its spoken words plus the pause after it"""
+        return self.words(script) * self._seconds_per_word + self.pause_seconds
+
+    def seconds_each(self, scripts: Sequence[str]) -> List[float]:
+        """seconds() for several sections"""
+        cache, per_word, pause = self._words, self._seconds_per_word, self.pause_seconds
+        seconds = []
+        for script in scripts:
+            words = cache.get(script)
+            if words is None:
+                words = self.words(script)
+            seconds.append(words * per_word + pause)
+        return seconds
+
+    def tip_seconds(self, tip) -> float:
+        """Time a tip takes once formatted as "N, title. explanation" """
+        return (1 + self.words(tip.title) + self.words(tip.explanation)) * self._seconds_per_word + self.pause_seconds
+
+    def tip_budget(self, fixed_seconds: Sequence[float]) -> float:
+        """Seconds left for tips after the fixed sections (infinite when not fitting)"""
+        if not self.target_seconds:
+            return float("inf")
+        return self.target_seconds - sum(fixed_seconds)
+
+    def fit_tips(self, selected: Sequence, candidates: Sequence, budget: float) -> Tuple[List, List[float]]:
+        """(tips, their durations): the selected tips, with long ones swapped for shorter candidates or dropped to fit the budget"""
+        return fit(selected, candidates, budget, self.tip_seconds)
+
+    def place(self, durations: Sequence[float], start: int = 0) -> List[int]:
+        """Boundaries in whole seconds for consecutive sections (section i runs from [i] to [i + 1]), each at least a second long"""
+        bounds = [start]
+        elapsed = previous = start
+        for duration in durations:
+            elapsed += duration
+            end = int(elapsed + 0.5)
+            previous = end if end > previous else previous + 1
+            bounds.append(previous)
+        return bounds
+
+    def to_dict(self) -> Dict:
+        return {
+            "words_per_minute": self.words_per_minute,
+            "target_seconds": self.target_seconds,
+            "pause_seconds": self.pause_seconds,
+        }
+
+    def is_default(self) -> bool:
+        """True when configured with the module defaults"""
+        return (self.words_per_minute, self.target_seconds, self.pause_seconds) == (
+            WORDS_PER_MINUTE, TARGET_SECONDS, PAUSE_SECONDS
+        )
+
+
+def fit(selected: Sequence, candidates: Sequence, budget: float, seconds: Callable) -> Tuple[List, List[float]]:
+    """Fit items into a time budget, keeping their order and at least one item; returns (items, durations)"""
+    durations = [seconds(item) for item in selected]
+    total = sum(durations)
+    if total <= budget:
+        return list(selected), durations
+
+    fitted = list(selected)
+    # Unused candidates by duration, so the best replacement is one bisect away
+    used = {id(item) for item in selected}
+    spare = sorted((seconds(item), index) for index, item in enumerate(candidates) if id(item) not in used)
+    spare_seconds = [duration for duration, _ in spare]
+
+    # Reselect: longest tips first, each swapped at most once
+    for position in sorted(range(len(fitted)), key=durations.__getitem__, reverse=True):
+        if not spare or total <= budget:
+            break
+        longest = durations[position]
+        # The longest spare tip that makes everything fit, else the shortest one if it helps at all
+        best = bisect.bisect_right(spare_seconds, budget - (total - longest)) - 1
+        if best < 0:
+            best = 0
+        if spare_seconds[best] >= longest:
+            continue
+        duration, index = spare.pop(best)
+        spare_seconds.pop(best)
+        fitted[position] = candidates[index]
+        durations[position] = duration
+        total += duration - longest
+
+    # Trim: drop the longest remaining tips
+    while total > budget and len(fitted) > 1:
+        position = max(range(len(fitted)), key=durations.__getitem__)
+        total -= durations.pop(position)
+        fitted.pop(position)
+    return fitted, durations
@@ -0,0 +1,192 @@
+"""
+Fuzzy topic resolution.
+Maps free-text topics ("Delegating work", "time-management") onto the curated
+tip banks using a precomputed index of character trigrams and stemmed tokens,
+so custom requests reuse curated tips instead of falling back to generic ones.
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_SUFFIXES = ("ings", "ing", "ions", "ion", "ments", "ment", "ness", "ies", "ed", "es", "s")
+# Words that carry no topic signal
+_STOPWORDS = frozenset(("a", "an", "and", "the", "of", "to", "for", "with", "in", "on", "my", "your", "how", "at"))
+
+
+def normalize_topic(text: str) -> str:
+    """Lowercase, turn punctuation/underscores/dashes into spaces, collapse whitespace"""
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def _stem(token: str) -> str:
+    """Crude suffix stripping so 'delegating'/'delegation' and 'manage'/'managing' share a stem"""
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 4:
+            token = token[:-len(suffix)]
+            break
+    return token[:-1] if token.endswith("e") and len(token) > 4 else token
+
+
+def _tokens(normalized: str) -> frozenset:
+    return frozenset(_stem(token) for token in normalized.split() if token not in _STOPWORDS)
+
+
+def _trigrams(normalized: str) -> frozenset:
+    padded = f"  {normalized} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TopicMatch:
+    """Result of resolving a free-text topic"""
+
+    __slots__ = ("query", "matched", "topic", "score")
+
+    def __init__(self, query: str, matched: str, topic: Optional[str], score: float):
+        self.query = query
+        self.matched = matched  # index entry that matched
+        self.topic = topic      # curated bank it maps to (None for known topics without a bank)
+        self.score = score
+
+    def to_dict(self) -> Dict:
+        return {"query": self.query, "matched": self.matched, "topic": self.topic, "score": round(self.score, 3)}
+
+    def __repr__(self) -> str:
+        return f"TopicMatch({self.query!r} -> {self.topic!r}, score={self.score:.3f})"
+
+
+class TopicIndex:
+    """Trigram + token index over topic names and aliases, each pointing at a curated bank"""
+
+    # Minimum combined score for a fuzzy (non-exact) match
+    DEFAULT_THRESHOLD = 0.45
+    # Minimum trigram similarity for treating an unknown query word as a misspelled known word
+    TOKEN_SIMILARITY = 0.5
+    MAX_TOKEN_CACHE = 10000
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._exact = {}       # normalized text -> entry id
+        self._entries = []     # (text, target bank, trigrams, tokens)
+        self._by_trigram = {}  # trigram -> [entry ids]
+        self._token_df = {}    # token -> number of entries containing it
+        self._known_tokens = {}  # token -> (position in the vocabulary, number of trigrams)
+        self._token_trigrams = {}  # trigram -> known tokens containing it, for spelling correction
+        self._entry_weights = {}  # entry id -> summed idf of its tokens (filled as entries are scored)
+        self._token_cache = {}  # query word -> known token it corrects to (or itself)
+
+    @classmethod
+    def build(cls, banks: Iterable[str], aliases: Dict[str, Optional[str]] = None,
+              threshold: float = DEFAULT_THRESHOLD) -> "TopicIndex":
+        """Index bank names (mapping to themselves) plus aliases mapping to a bank or None"""
+        index = cls(threshold)
+        for bank in banks:
+            index.add(bank, bank)
+        for text, target in (aliases or {}).items():
+            index.add(text, target)
+        return index
+
+    def add(self, text: str, target: Optional[str]) -> None:
+        """Add an entry; the first entry for a normalized text wins"""
+        normalized = normalize_topic(text)
+        if not normalized or normalized in self._exact:
+            return
+
+        entry_id = len(self._entries)
+        trigrams, tokens = _trigrams(normalized), _tokens(normalized)
+        self._entries.append((text, target, trigrams, tokens))
+        self._exact[normalized] = entry_id
+        for trigram in trigrams:
+            self._by_trigram.setdefault(trigram, []).append(entry_id)
+        for token in tokens:
+            df = self._token_df.get(token, 0)
+            if not df:
+                token_trigrams = _trigrams(token)
+                self._known_tokens[token] = (len(self._known_tokens), len(token_trigrams))
+                for trigram in token_trigrams:
+                    self._token_trigrams.setdefault(trigram, []).append(token)
+            self._token_df[token] = df + 1
+        self._token_cache.clear()
+        self._entry_weights.clear()
+
+    def _idf(self, token: str) -> float:
+        return math.log(1 + len(self._entries) / (1 + self._token_df.get(token, 0)))
+
+    def _correct_token(self, token: str) -> str:
+        """Map an unknown word onto the most similar known token ('confidance' -> 'confidenc')"""
+        if token in self._token_df:
+            return token
+        corrected = self._token_cache.get(token)
+        if corrected is None:
+            # Only known tokens sharing a trigram with the word can be similar enough; count the shared ones
+            token_trigrams = _trigrams(token)
+            shared = {}
+            for trigram in token_trigrams:
+                for known in self._token_trigrams.get(trigram, ()):
+                    shared[known] = shared.get(known, 0) + 1
+            # Most similar known token; on a tie, the one added last
+            corrected, best, best_order = token, self.TOKEN_SIMILARITY, -1
+            for known, count in shared.items():
+                order, size = self._known_tokens[known]
+                similarity = 2.0 * count / (len(token_trigrams) + size)
+                if similarity > best or (similarity == best and order > best_order):
+                    corrected, best, best_order = known, similarity, order
+            if len(self._token_cache) >= self.MAX_TOKEN_CACHE:
+                self._token_cache.clear()
+            self._token_cache[token] = corrected
+        return corrected
+
+    def _token_score(self, query_tokens: frozenset, query_weight: float, entry_id: int, tokens: frozenset) -> float:
+        """Idf-weighted overlap: the share of the query an entry covers, or the cosine if higher (so extra context words don't sink a full match)"""
+        matched = query_tokens & tokens
+        if not matched or not query_weight:
+            return 0.0
+        overlap = sum(self._idf(token) for token in matched)
+        entry_weight = self._entry_weights.get(entry_id)
+        if entry_weight is None:
+            entry_weight = self._entry_weights[entry_id] = sum(self._idf(token) for token in tokens)
+        return max(overlap / query_weight, overlap / math.sqrt(query_weight * entry_weight))
+
+    def resolve(self, query: str) -> Optional[TopicMatch]:
+        """Best entry for a free-text topic, or None below the confidence threshold"""
+        normalized = normalize_topic(query)
+        if not normalized:
+            return None
+
+        entry_id = self._exact.get(normalized)
+        if entry_id is not None:
+            text, target = self._entries[entry_id][:2]
+            return TopicMatch(query, text, target, 1.0)
+
+        # Candidates share at least one trigram; count shared trigrams per candidate
+        query_trigrams = _trigrams(normalized)
+        shared = {}
+        for trigram in query_trigrams:
+            for candidate in self._by_trigram.get(trigram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        if not shared:
+            return None
+
+        query_tokens = frozenset(self._correct_token(token) for token in _tokens(normalized))
+        query_weight = sum(self._idf(token) for token in query_tokens)
+        best_id, best_score = None, 0.0
+        for candidate, count in shared.items():
+            text, target, trigrams, tokens = self._entries[candidate]
+            dice = 2.0 * count / (len(query_trigrams) + len(trigrams))
+            token_score = self._token_score(query_tokens, query_weight, candidate, tokens)
+            score = 0.5 * dice + 0.5 * token_score
+            if score > best_score:
+                best_id, best_score = candidate, score
+
+        if best_score < self.threshold:
+            return None
+        text, target = self._entries[best_id][:2]
+        return TopicMatch(query, text, target, best_score)
+
+    def entries(self) -> List[str]:
+        """All indexed entry texts"""
+        return [entry[0] for entry in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
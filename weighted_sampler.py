@@ -0,0 +1,180 @@
+"""
+Weighted selection for templates, techniques, frameworks and CTAs.
+Weights are kept per namespace (key -> weight, default 1.0) in a WeightRegistry,
+usually loaded from a JSON file of engagement-driven weights. Each weighted
+choice precomputes a Walker/Vose alias table, so a draw costs one random number
+and two list lookups however many items there are; tables are rebuilt lazily,
+only after the weights change. With no weights configured a choice is exactly
+rng.choice, so seeded output is unchanged.
+
+Weights file format:
+    {
+      "weights": {
+        "hook_method": {"hook_library": 1, "hook_point": 2, "custom": 0.5},
+        "hook_technique": {"future_pacing": 3},
+        "hook_template": {"The truth about {topic} that most people miss": 2},
+        "framework": {"brutal_honesty": 1.5},
+        "cta": {"standard": 4, "planner": 0}
+      },
+      "probabilities": {"user_hook": 0.5, "cta_variation": 0.2}
+    }
+"""
+
+import hashlib
+import json
+import math
+import random
+from typing import Callable, Dict, Sequence
+
+# Namespaces a weights file may set
+NAMESPACES = ("hook_method", "hook_technique", "hook_template", "framework", "cta")
+# Coin-flip probabilities and their defaults
+DEFAULT_PROBABILITIES = {
+    "user_hook": 0.3,       # pick one of the user's own hooks for a topic
+    "cta_variation": 0.15,  # vary the CTA instead of using the requested one
+}
+
+
+class WeightedChoice:
+    """O(1) weighted sampling over a fixed item sequence (alias method)"""
+
+    __slots__ = ("items", "uniform", "_prob", "_alias", "_count")
+
+    def __init__(self, items: Sequence, weights: Sequence[float]):
+        self.items = items
+        self._count = count = len(items)
+        total = sum(weights)
+        # Equal (or all-zero) weights: plain rng.choice keeps draws identical to unweighted code
+        self.uniform = total <= 0 or all(weight == weights[0] for weight in weights)
+        self._prob, self._alias = ([], []) if self.uniform else _alias_table(weights, total, count)
+
+    def pick(self, rng: random.Random = None):
+        """Draw one item"""
+        rng = rng or random
+        if self.uniform:
+            return rng.choice(self.items)
+        position = rng.random() * self._count
+        index = int(position)
+        if position - index >= self._prob[index]:
+            index = self._alias[index]
+        return self.items[index]
+
+
+def _alias_table(weights: Sequence[float], total: float, count: int) -> tuple:
+    """Vose's alias table: (acceptance probability, alias index) per slot"""
+    scaled = [weight * count / total for weight in weights]
+    prob, alias = [1.0] * count, list(range(count))
+    small = [index for index, value in enumerate(scaled) if value < 1.0]
+    large = [index for index, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less], alias[less] = scaled[less], more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Leftovers are 1.0 up to rounding error
+    return prob, alias
+
+
+class WeightRegistry:
+    """Per-namespace weights and probabilities, with alias tables cached until the weights change"""
+
+    def __init__(self, config: Dict = None):
+        self._weights = {}        # namespace -> {key: weight}
+        self._probabilities = {}  # name -> probability (only those overriding the defaults)
+        self._choosers = {}       # (namespace, id(items)) -> (items, version, WeightedChoice)
+        self.version = 0
+        if config:
+            self.update(config)
+
+    def update(self, config: Dict, replace: bool = False) -> None:
+        """Apply a {"weights": ..., "probabilities": ...} config, validated in full before anything changes"""
+        weights, probabilities = _validate_config(config)
+        new_weights = {} if replace else {namespace: dict(table) for namespace, table in self._weights.items()}
+        for namespace, table in weights.items():
+            new_weights.setdefault(namespace, {}).update(table)
+        new_probabilities = {} if replace else dict(self._probabilities)
+        new_probabilities.update(probabilities)
+
+        self._weights, self._probabilities = new_weights, new_probabilities
+        self._choosers = {}
+        self.version += 1
+
+    def load(self, path: str) -> None:
+        """Replace all weights with those in a JSON weights file"""
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        self.update(config, replace=True)
+
+    def clear(self) -> None:
+        """Back to uniform weights and default probabilities"""
+        self.update({}, replace=True)
+
+    def to_dict(self) -> Dict:
+        """Current config in weights-file format"""
+        return {
+            "weights": {namespace: dict(table) for namespace, table in self._weights.items()},
+            "probabilities": dict(self._probabilities),
+        }
+
+    def fingerprint(self) -> str:
+        """Short hash of the config ('' when nothing is configured)"""
+        if not self._weights and not self._probabilities:
+            return ""
+        payload = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def weight(self, namespace: str, key: str) -> float:
+        """Weight of one key (1.0 unless configured)"""
+        return self._weights.get(namespace, {}).get(key, 1.0)
+
+    def probability(self, name: str) -> float:
+        """A configured coin-flip probability, or its default"""
+        return self._probabilities.get(name, DEFAULT_PROBABILITIES[name])
+
+    def chooser(self, namespace: str, items: Sequence, key: Callable = None) -> WeightedChoice:
+        """Alias-table chooser for a long-lived item sequence, built once per weights version"""
+        cache_key = (namespace, id(items))
+        entry = self._choosers.get(cache_key)
+        if entry is None or entry[1] != self.version or entry[0] is not items:
+            table = self._weights.get(namespace, {})
+            weights = [table.get(key(item) if key else item, 1.0) for item in items]
+            # The entry holds `items`, so its id can't be reused while cached
+            entry = (items, self.version, WeightedChoice(items, weights))
+            self._choosers[cache_key] = entry
+        return entry[2]
+
+    def choice(self, namespace: str, items: Sequence, rng: random.Random = None, key: Callable = None):
+        """Weighted draw from items; `key` maps an item to its weight key (default: the item itself)"""
+        return self.chooser(namespace, items, key).pick(rng)
+
+
+def _validate_config(config: Dict) -> tuple:
+    """Check a weights config, returning (weights, probabilities)"""
+    if not isinstance(config, dict):
+        raise ValueError("Weights config must be a JSON object")
+    unknown = set(config) - {"weights", "probabilities"}
+    if unknown:
+        raise ValueError(f"Unknown weights config sections: {', '.join(sorted(unknown))}")
+
+    weights = config.get("weights") or {}
+    for namespace, table in weights.items():
+        if namespace not in NAMESPACES:
+            raise ValueError(f"Unknown weight namespace: {namespace}")
+        if not isinstance(table, dict):
+            raise ValueError(f"Weights for {namespace} must be an object of key -> weight")
+        for key, weight in table.items():
+            if not _is_number(weight) or weight < 0:
+                raise ValueError(f"Weight for {namespace}/{key} must be a non-negative number")
+
+    probabilities = config.get("probabilities") or {}
+    for name, value in probabilities.items():
+        if name not in DEFAULT_PROBABILITIES:
+            raise ValueError(f"Unknown probability: {name}")
+        if not _is_number(value) or not 0 <= value <= 1:
+            raise ValueError(f"Probability {name} must be between 0 and 1")
+    return weights, probabilities
+
+
+def _is_number(value) -> bool:
+    """A finite int/float (not bool)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)